@@ -0,0 +1,81 @@
+"""
+Memory churn of a simulation tick in steady play: the transient peak
+allocated during Game.step (tracemalloc) and the net change in allocated
+blocks, plus the cost of recycling balls through the BallSystem pool.
+
+Run from the repo root: python -m benchmarks.bench_alloc
+"""
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from breakout_game.game_logic import Game
+from breakout_game.simulation import follow_ball
+
+from .bench_balls import fill_balls
+
+
+def churn(game: Game, ticks: int, balls: int) -> tuple[float, float]:
+
+    """
+    Mean transient bytes and net allocated blocks per tick.
+    """
+    rng = random.Random(1)
+    peak = blocks = 0
+
+    for _ in range(ticks):
+        if balls > 1 and len(game.balls) < balls // 2:
+            fill_balls(game, balls, rng)
+
+        inputs = follow_ball(game)
+        before_blocks = sys.getallocatedblocks()
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+
+        game.step(inputs)
+
+        peak += tracemalloc.get_traced_memory()[1] - before
+        blocks += sys.getallocatedblocks() - before_blocks
+
+    return peak / ticks, blocks / ticks
+
+
+def main(ticks: int = 2000):
+
+    print(f"{'balls':>6} {'peak B/tick':>12} {'blocks/tick':>12}")
+
+    tracemalloc.start()
+    for balls in (1, 100, 1000):
+        game = Game(headless = True, seed = 1)
+        game.collision.bounce_sound = game.collision.brick_hit_sound = None
+        if balls > 1:
+            fill_balls(game, balls, random.Random(1))
+
+        churn(game, 200, balls)     # warm up: pool and caches at their steady size
+        peak, blocks = churn(game, ticks, balls)
+        print(f"{balls:>6} {peak:>12,.0f} {blocks:>+12.2f}")
+    tracemalloc.stop()
+
+    # Pool: spawn a ball, release a random one (O(1) swap-remove)
+    game = Game(headless = True, seed = 1)
+    balls = game.balls
+    fill_balls(game, 1000, random.Random(1))
+    rng = random.Random(2)
+    victims = [rng.randrange(999) for _ in range(100_000)]
+
+    start = time.perf_counter()
+    for i in victims:
+        balls.spawn(450, 450, 4.0, -4.0)
+        balls.release(i)
+    seconds = time.perf_counter() - start
+    print(f"pool spawn + release at 1000 balls: {seconds / len(victims) * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
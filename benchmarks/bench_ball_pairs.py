@@ -0,0 +1,83 @@
+"""
+Ball-ball collisions (RulesConfig.ball_collisions) against ball count:
+pair tests per frame after the sort-and-sweep broad phase, next to the
+n(n - 1)/2 of a full pair loop, contacts found, and the cost of the
+pass and of the whole tick. Run with the game's ball image and with the
+small fallback ball: thousands of full-size balls cannot fit on screen
+without touching.
+
+Run from the repo root: python -m benchmarks.bench_ball_pairs
+"""
+
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from breakout_game.config import SCREEN, BALL, RulesConfig
+from breakout_game.game_logic import Game
+from breakout_game.objects.ball import BallSystem
+
+
+def top_up(game: Game, n: int, rng: random.Random) -> None:
+
+    """
+    Spawn balls anywhere below the wall until there are n.
+    Bricks get enough hits to survive the run, so the game stays in PLAYING.
+    """
+    game.bricks.hits_left[:] = 10_000
+    balls = game.balls
+    top = SCREEN.height // 3
+    for _ in range(n - len(balls)):
+        balls.spawn(
+            rng.randrange(SCREEN.width), rng.randrange(top, game.bat.rect.top),
+            rng.uniform(-BALL.max_speed, BALL.max_speed), rng.uniform(-BALL.max_speed, -1)
+        )
+
+
+def run(n: int, size: tuple[int, int] | None, frames: int) -> tuple[float, float, float, float, float]:
+
+    game = Game(headless = True, seed = 1, perf = True, rules = RulesConfig(ball_collisions = True))
+    game.collision.bounce_sound = game.collision.brick_hit_sound = None
+    if size:
+        game.balls = BallSystem(size, max_speed = BALL.max_speed)
+        game.rebuild_sprite_list()
+
+    rng = random.Random(1)
+    tests = contacts = balls = 0
+    seconds = 0.0
+
+    for _ in range(frames):
+        top_up(game, n, rng)
+        balls += len(game.balls)
+
+        game.perf.begin_frame()
+        start = time.perf_counter()
+        game.step(0)
+        seconds += time.perf_counter() - start
+        game.perf.end_frame()
+
+        tests += game.collision.pair_tests
+        contacts += game.collision.pair_contacts
+
+    pairs_ms = game.perf.summary()["mean_ms"]["balls"]
+    return balls / frames, tests / frames, contacts / frames, pairs_ms, seconds / frames * 1e3
+
+
+def main(frames: int = 200):
+
+    print(f"frame budget {1e3 / SCREEN.fps:.2f} ms")
+    print(f"{'ball px':>8} {'balls':>6} {'all pairs':>11} {'tests':>9} {'contacts':>9} {'pairs ms':>9} {'tick ms':>8}")
+
+    for size in (None, BALL.fallback_size):
+        for n in (100, 500, 1000, 2000, 5000):
+            balls, tests, contacts, pairs_ms, tick_ms = run(n, size, frames)
+            label = "x".join(map(str, size)) if size else "image"
+            print(f"{label:>8} {n:>6} {balls * (balls - 1) / 2:>11,.0f} {tests:>9,.0f} {contacts:>9,.0f}"
+                  f" {pairs_ms:>9.3f} {tick_ms:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
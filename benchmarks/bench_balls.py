@@ -0,0 +1,60 @@
+"""
+Frame cost of Game.update with many simultaneous balls (BallSystem).
+
+Run from the repo root: python -m benchmarks.bench_balls
+"""
+
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from breakout_game.config import SCREEN, BALL
+from breakout_game.game_logic import Game
+
+
+def fill_balls(game: Game, n: int, rng: random.Random) -> None:
+
+    """
+    Scatter n balls below the brick wall with random velocities.
+    Bricks get enough hits to survive the run, so the game stays in PLAYING.
+    """
+    game.bricks.hits_left[:] = 10_000
+    game.balls.clear()
+    top = SCREEN.height // 2
+    for _ in range(n):
+        game.balls.spawn(
+            rng.randrange(SCREEN.width), rng.randrange(top, SCREEN.height - 100),
+            rng.uniform(-BALL.max_speed, BALL.max_speed), rng.uniform(-BALL.max_speed, -1)
+        )
+
+
+def time_update(game: Game, frames: int) -> float:
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.update()
+    return (time.perf_counter() - start) / frames
+
+
+def main():
+
+    rng = random.Random(1)
+    game = Game(seed = 1)
+    game.collision.bounce_sound = game.collision.brick_hit_sound = None
+    budget = 1.0 / SCREEN.fps
+
+    print(f"{'balls':>7} {'ms/frame':>9} {'us/ball':>8} {'budget':>7} {'left':>7}")
+
+    for n in (1, 100, 1_000, 10_000):
+        game.restart_game()
+        fill_balls(game, n, rng)
+
+        per_frame = time_update(game, 120)
+        print(f"{n:>7} {per_frame * 1e3:>9.3f} {per_frame / n * 1e6:>8.2f} {per_frame / budget:>7.0%} {len(game.balls):>7}")
+
+
+if __name__ == "__main__":
+    main()
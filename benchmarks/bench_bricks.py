@@ -0,0 +1,123 @@
+"""
+Brick store benchmarks:
+- per-ball collision cost vs. brick count (linear rect scan vs. BrickField grid)
+- memory of the array-backed BrickField vs. one object + Rect per brick
+
+Run from the repo root: python -m benchmarks.bench_bricks
+"""
+
+import random
+import time
+import tracemalloc
+
+import numpy as np
+import pygame
+
+from breakout_game.config import BRICKS
+from breakout_game.objects.bricks import BrickField, KIND_SOFT
+
+
+def make_wall(rows: int, cols: int) -> BrickField:
+
+    """
+    Staggered wall like Game.bricks_layout, without the screen-width cut-off.
+    """
+    row = np.repeat(np.arange(rows), cols)
+    col = np.tile(np.arange(cols), rows)
+
+    x = BRICKS.side_margin + (row % 2) * (BRICKS.width // 2) + col * (BRICKS.width + BRICKS.gap)
+    y = BRICKS.top_margin + row * (BRICKS.height + BRICKS.gap)
+    n = rows * cols
+
+    return BrickField.from_arrays(x, y, np.full(n, BRICKS.width), np.full(n, BRICKS.height),
+                                  np.full(n, 2), np.full(n, 60), np.full(n, KIND_SOFT))
+
+
+class LegacyBrick:
+
+    """
+    Shape of the old per-object Brick (rect, hits_left, points, kind string).
+    """
+    def __init__(self, rect, hits_left, points, kind):
+        self.rect = rect
+        self.hits_left = hits_left
+        self.points = points
+        self.kind = kind
+
+
+def legacy_list(field: BrickField) -> list[LegacyBrick]:
+    return [
+        LegacyBrick(field.rect(i), int(field.hits_left[i]), int(field.points[i]), "soft")
+        for i in range(field.count)
+    ]
+
+
+def linear_first_hit(rect, rects):
+    for i, brick_rect in enumerate(rects):
+        if rect.colliderect(brick_rect):
+            return i
+    return None
+
+
+def time_queries(fn, rects, repeat: int = 5) -> float:
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for rect in rects:
+            fn(rect)
+        best = min(best, time.perf_counter() - start)
+
+    return best / len(rects)
+
+
+def bench_collision():
+
+    rng = random.Random(1)
+    print(f"{'bricks':>8} {'linear us/ball':>15} {'grid us/ball':>13}")
+
+    for side in (10, 30, 100, 300):
+        field = make_wall(side, side)
+        brick_rects = [field.rect(i) for i in range(field.count)]
+
+        width = BRICKS.side_margin + side * (BRICKS.width + BRICKS.gap) + BRICKS.width
+        height = BRICKS.top_margin + side * (BRICKS.height + BRICKS.gap)
+        rects = [pygame.Rect(rng.randrange(width), rng.randrange(height), 18, 18) for _ in range(500)]
+
+        # Sanity: both paths agree
+        for rect in rects:
+            assert linear_first_hit(rect, brick_rects) == field.first_hit(rect)
+
+        linear = time_queries(lambda r: linear_first_hit(r, brick_rects), rects, repeat = 1 if side > 100 else 5)
+        indexed = time_queries(field.first_hit, rects)
+        print(f"{field.count:>8} {linear * 1e6:>15.2f} {indexed * 1e6:>13.2f}")
+
+
+def bench_memory(n: int = 100_000):
+
+    side = int(n ** 0.5)
+
+    tracemalloc.start()
+    field = make_wall(side, side)
+    field.first_hit(pygame.Rect(0, 0, 1, 1))    # build the grid
+    field_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    objects = legacy_list(field)
+    object_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"\n{len(objects)} bricks")
+    print(f"  object list : {object_bytes / 1e6:7.2f} MB")
+    print(f"  BrickField  : {field_bytes / 1e6:7.2f} MB (arrays + grid: {field.nbytes / 1e6:.2f} MB)")
+    print(f"  ratio       : {field_bytes / object_bytes:7.1%}")
+
+
+def main():
+    bench_collision()
+    bench_memory()
+
+
+if __name__ == "__main__":
+    main()
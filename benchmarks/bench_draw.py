@@ -0,0 +1,74 @@
+"""
+Game.draw cost:
+- full repaint + flip every frame vs. the dirty-rect renderer
+- brick wall: per-brick pygame.draw.rect vs. one blit of the cached brick layer
+
+Run from the repo root: python -m benchmarks.bench_draw
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from benchmarks.bench_bricks import make_wall
+from breakout_game.config import SCREEN
+from breakout_game.game_logic import Game
+from breakout_game.render import BrickLayer, BrickSprites
+from breakout_game.simulation import follow_ball
+
+
+def play(full: bool, frames: int = 1200, seed: int = 1):
+
+    game = Game(seed = seed)
+    stats = game.renderer.stats
+
+    for _ in range(frames):
+        game.step(follow_ball(game))
+        if full:
+            game.renderer.invalidate()
+        game.draw()
+
+    return stats
+
+
+def time_call(fn, repeat: int = 200) -> float:
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def bench_wall():
+
+    screen = pygame.display.set_mode((SCREEN.width, SCREEN.height))
+    print(f"\n{'bricks':>7} {'per-brick ms':>13} {'layer ms':>9}")
+
+    for rows, cols in ((7, 10), (15, 10)):
+        bricks = make_wall(rows, cols)
+        layer = BrickLayer(screen.get_size(), BrickSprites(screen), screen)
+        layer.rebuild(bricks)
+
+        direct = time_call(lambda: bricks.draw(screen))
+        cached = time_call(lambda: layer.draw(screen))
+        print(f"{len(bricks):>7} {direct * 1e3:>13.3f} {cached * 1e3:>9.3f}")
+
+
+def main():
+
+    print(f"{'mode':>6} {'ms/frame':>9} {'Mpx/frame':>10} {'full frames':>12}")
+
+    for name, full in (("full", True), ("dirty", False)):
+        stats = play(full)
+        print(f"{name:>6} {stats.total_seconds / stats.frames * 1e3:>9.3f} "
+              f"{stats.total_pixels / stats.frames / 1e6:>10.3f} {stats.full_frames:>12}")
+
+    bench_wall()
+
+
+if __name__ == "__main__":
+    main()
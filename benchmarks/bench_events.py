@@ -0,0 +1,54 @@
+"""
+Per-tick collision scheduling vs. the event engine (analytic time of
+impact): update cost and the share of ticks that still run the
+collision pass, in normal play with a scripted bat.
+
+Run from the repo root: python -m benchmarks.bench_events
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from breakout_game.config import SCREEN, BrickConfig
+from breakout_game.game_logic import Game
+from breakout_game.replay import game_digest
+from breakout_game.simulation import follow_ball
+
+
+def play(physics: str, seed: int, ticks: int, brick_config: BrickConfig) -> tuple[float, Game]:
+
+    game = Game(headless = True, seed = seed, physics = physics, brick_config = brick_config)
+    game.collision.bounce_sound = game.collision.brick_hit_sound = None
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        game.step(follow_ball(game))
+    return time.perf_counter() - start, game
+
+
+def main(ticks: int = 20_000):
+
+    budget_us = 1e6 / SCREEN.fps
+    print(f"{'scene':<16} {'step us/tick':>13} {'events us/tick':>15} {'resolved':>9} {'same':>5}")
+
+    scenes = {
+        "single ball": BrickConfig(power_chance = 0.0),
+        "multiball": BrickConfig(power_chance = 0.5),
+    }
+    for name, cfg in scenes.items():
+        step_s, step_game = play("step", 1, ticks, cfg)
+        events_s, events_game = play("events", 1, ticks, cfg)
+
+        engine = events_game.events
+        resolved = engine.resolved / (engine.resolved + engine.skipped)
+        same = game_digest(step_game) == game_digest(events_game)
+        print(f"{name:<16} {step_s / ticks * 1e6:>13.1f} {events_s / ticks * 1e6:>15.1f} {resolved:>9.1%} {str(same):>5}")
+
+    print(f"(tick budget at {SCREEN.fps} fps: {budget_us:.0f} us)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Level loading benchmarks: compiling a JSON source, loading it through the
+content-hash cache, loading a .brkl directly, and the copy a restart makes.
+
+Run from the repo root: python -m benchmarks.bench_levels
+"""
+
+import json
+import os
+import random
+import tempfile
+import time
+
+from breakout_game.levels import compile_source, decode_level, encode_level, load_level
+
+
+def make_source(rows: int, cols: int, seed: int = 1) -> dict:
+
+    """
+    A large level source with small bricks and a random mix of kinds.
+    """
+    rng = random.Random(seed)
+    return {
+        "brick": {"width": 8, "height": 5, "gap": 1},
+        "left": 0,
+        "rows": ["".join(rng.choice("HSSSP.") for _ in range(cols)) for _ in range(rows)],
+    }
+
+
+def _time(fn, repeat: int = 5) -> float:
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+
+    source = make_source(600, 600)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src_path = os.path.join(tmp, "big.json")
+        bin_path = os.path.join(tmp, "big.brkl")
+        cache = os.path.join(tmp, "cache")
+
+        with open(src_path, "w", encoding = "utf-8") as f:
+            json.dump(source, f)
+
+        bricks = compile_source(source)
+        data = encode_level(bricks)
+        with open(bin_path, "wb") as f:
+            f.write(data)
+
+        print(f"{bricks.count:,} bricks, {len(data) / 1e6:.1f} MB compiled")
+
+        start = time.perf_counter()
+        load_level(src_path, cache)
+        print(f"first load (compile + write cache) {(time.perf_counter() - start) * 1e3:9.2f} ms")
+
+        print(f"load via cache                     {_time(lambda: load_level(src_path, cache)) * 1e3:9.2f} ms")
+        print(f"load .brkl                         {_time(lambda: load_level(bin_path)) * 1e3:9.2f} ms")
+        print(f"decode from memory                 {_time(lambda: decode_level(data)) * 1e3:9.2f} ms")
+
+        template = decode_level(data)
+        start = time.perf_counter()
+        template.grid
+        print(f"grid build (once per level)        {(time.perf_counter() - start) * 1e3:9.2f} ms")
+        print(f"restart copy (shares the grid)     {_time(template.copy) * 1e3:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
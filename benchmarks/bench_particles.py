@@ -0,0 +1,112 @@
+"""
+Particle system cost per frame at increasing live counts, against the
+frame budget: update (integrate + cull) and draw (pixel writes), plus a
+whole game frame with the particles on screen. Then ball trails at high
+ball counts, with and without the per-tick trail budget.
+
+Run from the repo root: python -m benchmarks.bench_particles
+"""
+
+import dataclasses
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from breakout_game.config import SCREEN, BALL, PARTICLES
+from breakout_game.game_logic import Game
+from breakout_game.objects.ball import BallSystem
+from breakout_game.objects.particles import ParticleSystem
+from breakout_game.simulation import follow_ball
+
+
+def fill_particles(particles, live: int) -> None:
+
+    """
+    Top the system up to about `live` particles with long-lived debris.
+    """
+    missing = live - len(particles)
+    if missing > 0:
+        particles.emit(SCREEN.width / 2, SCREEN.height / 3, missing, (169, 42, 189), speed = 2.0, life = 400,
+                       spread_x = SCREEN.width * 0.8, spread_y = SCREEN.height / 3)
+
+
+def time_trails(balls: BallSystem, budget: int, frames: int) -> tuple[float, float, int]:
+
+    """
+    ms per tick of trail() + update(), ms per draw, and the live count at the end.
+    """
+    particles = ParticleSystem(dataclasses.replace(PARTICLES, trail_budget = budget), seed = 1)
+    surface = pygame.display.get_surface()
+    tick = draw = 0.0
+
+    for _ in range(frames):
+        start = time.perf_counter()
+        particles.trail(balls)
+        particles.update()
+        tick += time.perf_counter() - start
+
+        start = time.perf_counter()
+        particles.draw(surface)
+        draw += time.perf_counter() - start
+
+    return tick / frames * 1e3, draw / frames * 1e3, len(particles)
+
+
+def trails(frames: int) -> None:
+
+    print(f"\n{'balls':>7} {'budget':>10} {'trail ms':>9} {'draw ms':>8} {'live':>7}")
+    rng = random.Random(1)
+
+    for n in (1_000, 10_000, 20_001):
+        balls = BallSystem((18, 18), max_speed = BALL.max_speed)
+        for _ in range(n):
+            balls.spawn(rng.randrange(SCREEN.width), rng.randrange(SCREEN.height), 0.0, 0.0)
+
+        for budget in (PARTICLES.trail_budget, None):
+            tick, draw, live = time_trails(balls, budget or n * PARTICLES.trail_per_tick, frames)
+            label = f"{budget:,}" if budget else "none"
+            print(f"{n:>7,} {label:>10} {tick:>9.3f} {draw:>8.3f} {live:>7,}")
+
+
+def main(frames: int = 300):
+
+    game = Game(seed = 1)
+    particles = game.particles
+    budget_ms = 1e3 / SCREEN.fps
+
+    print(f"frame budget {budget_ms:.2f} ms, capacity {particles.capacity:,}")
+    print(f"{'live':>7} {'update ms':>10} {'draw ms':>8} {'frame ms':>9}")
+
+    for live in (1_000, 5_000, 10_000, 20_000):
+        update = draw = frame = 0.0
+
+        for _ in range(frames):
+            fill_particles(particles, live)
+
+            start = time.perf_counter()
+            particles.update()
+            update += time.perf_counter() - start
+
+            start = time.perf_counter()
+            particles.draw(game.screen)
+            draw += time.perf_counter() - start
+
+            # A full game frame on top: step (which updates the particles again) and draw
+            start = time.perf_counter()
+            game.step(follow_ball(game))
+            game.draw()
+            frame += time.perf_counter() - start
+
+        print(f"{live:>7,} {update / frames * 1e3:>10.3f} {draw / frames * 1e3:>8.3f} {frame / frames * 1e3:>9.3f}")
+
+    trails(frames)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Per-tick (discrete) vs. swept (continuous) collision at ball speeds
+beyond BALL.max_speed. A lower tick rate at the same on-screen speed
+is a longer step per tick, so each row also stands for a tick rate:
+a step of 4 px at 120 Hz is 32 px at 15 Hz. Counts the ticks a ball
+passed straight through a brick, lives lost with the bat held under
+the ball, and the update cost.
+
+Run from the repo root: python -m benchmarks.bench_swept
+"""
+
+import os
+import time
+
+import numpy as np
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from breakout_game.config import BALL, TIMESTEP, BallConfig
+from breakout_game.game_logic import Game
+from breakout_game.state import GameState
+from breakout_game.swept import sweep_boxes
+
+
+def tunnelled(game: Game, x0: np.ndarray, y0: np.ndarray, dx: np.ndarray, dy: np.ndarray,
+              alive: np.ndarray) -> int:
+
+    """
+    Balls whose straight step entered an alive brick although no brick was
+    hit and they kept their direction.
+    """
+    balls, bricks = game.balls, game.bricks
+    idx = np.flatnonzero(alive)
+    count = 0
+
+    for i in range(min(len(balls), len(x0))):
+        if not (dx[i] or dy[i]) or balls.vx[i] * dx[i] < 0 or balls.vy[i] * dy[i] < 0:
+            continue
+        t, _ = sweep_boxes(float(x0[i]), float(y0[i]), balls.width, balls.height, float(dx[i]), float(dy[i]),
+                           bricks.x[idx], bricks.y[idx], bricks.w[idx], bricks.h[idx])
+        count += bool(np.isfinite(t).any())
+    return count
+
+
+def play(physics: str, speed: int, ticks: int, seed: int = 1) -> tuple[float, int, int]:
+
+    game = Game(headless = True, seed = seed, physics = physics,
+                ball_config = BallConfig(speed = speed, max_speed = speed + speed // 2))
+    game.collision.bounce_sound = game.collision.brick_hit_sound = None
+    balls, lives = game.balls, game.lives
+    seconds = tunnels = 0
+
+    for _ in range(ticks):
+        if game.state != GameState.PLAYING:
+            break
+        n = len(balls)
+        game.bat.rect.centerx = balls.x.item(0) + balls.width // 2
+
+        bricks = game.bricks
+        alive, hits = bricks.alive[:bricks.count].copy(), int(bricks.hits_left[:bricks.count].sum())
+        x0, y0 = balls.x[:n].copy(), balls.y[:n].copy()
+        dx, dy = np.trunc(balls.vx[:n]), np.trunc(balls.vy[:n])
+
+        start = time.perf_counter()
+        game.step(0)
+        seconds += time.perf_counter() - start
+
+        # Only when nothing was hit this tick (a hit changes directions and the wall)
+        if bricks is game.bricks and int(bricks.hits_left[:bricks.count].sum()) == hits:
+            tunnels += tunnelled(game, x0, y0, dx, dy, alive)
+
+    return seconds / ticks, tunnels, lives - game.lives
+
+
+def main(ticks: int = 3000):
+
+    print(f"{'step px':>8} {'~Hz':>5} {'physics':>8} {'us/tick':>8} {'tunnels':>8} {'lost':>5}")
+
+    for speed in (4, 8, 16, 32, 64):
+        rate = TIMESTEP.tick_rate * BALL.speed // speed
+        for physics in ("step", "swept"):
+            seconds, tunnels, lost = play(physics, speed, ticks)
+            print(f"{speed:>8} {rate:>5} {physics:>8} {seconds * 1e6:>8.1f} {tunnels:>8} {lost:>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Per-frame text cost (render + blit): font.render every frame vs. TextCache.
+
+Scenarios:
+- overlay: the game-over screen, nothing changes between frames
+- hud: the HUD line as in play, the score changes every 30th frame
+- counter: the HUD line with a score that changes every frame
+
+Run from the repo root: python -m benchmarks.bench_text
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from breakout_game.text import TextCache
+
+
+HUD = "Score: {}    Lives: 3    Balls: 2"
+WHITE = (235, 235, 235)
+
+
+def time_frames(fn, frames: int = 3000) -> float:
+
+    start = time.perf_counter()
+    for frame in range(frames):
+        fn(frame)
+    return (time.perf_counter() - start) / frames
+
+
+def main():
+
+    pygame.init()
+    screen = pygame.display.set_mode((900, 900))
+    font = pygame.font.SysFont(None, 32)
+    big_font = pygame.font.SysFont(None, 64)
+
+    def uncached(f, text, color):
+        return f.render(text, True, color)
+
+    def overlay(render):
+        def frame(n):
+            screen.blit(render(font, HUD.format(1200), WHITE), (18, 16))
+            screen.blit(render(big_font, "GAME OVER - You suck!", (237, 14, 14)), (200, 450))
+            screen.blit(render(font, "Press R to restart, ESC to quit", (255, 255, 255)), (250, 500))
+        return frame
+
+    def hud(render, every):
+        return lambda n: screen.blit(render(font, HUD.format(n // every), WHITE), (18, 16))
+
+    def glyphs(n):
+        screen.blits(cache.layout(font, HUD.format(n), WHITE, (18, 16)), doreturn = False)
+
+    cache = TextCache()
+
+    rows = [
+        ("overlay", "font.render", time_frames(overlay(uncached))),
+        ("overlay", "TextCache", time_frames(overlay(cache.render))),
+        ("hud", "font.render", time_frames(hud(uncached, 30))),
+        ("hud", "TextCache", time_frames(hud(cache.render, 30))),
+        ("counter", "font.render", time_frames(hud(uncached, 1))),
+        ("counter", "TextCache", time_frames(hud(cache.render, 1))),
+        ("counter", "glyph layout", time_frames(glyphs)),
+    ]
+
+    base = {}
+    print(f"{'scenario':>9} {'mode':>13} {'us/frame':>9} {'saved':>7}")
+    for scenario, mode, seconds in rows:
+        base.setdefault(scenario, seconds)
+        print(f"{scenario:>9} {mode:>13} {seconds * 1e6:>9.1f} {1 - seconds / base[scenario]:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
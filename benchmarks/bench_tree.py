@@ -0,0 +1,187 @@
+"""
+Thousands of moving bricks (sliding, oscillating, falling): the cost per
+frame of keeping a lookup structure current and answering ball queries,
+for the dynamic AABB tree (BrickField.track / move_many), a BrickGrid
+rebuilt every frame, and a linear NumPy scan over every brick. Then
+whole game ticks with the moving wall going through CollisionSystem.
+
+Run from the repo root: python -m benchmarks.bench_tree
+"""
+
+import os
+import random
+import time
+
+import numpy as np
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from breakout_game.config import SCREEN, BALL
+from breakout_game.game_logic import Game
+from breakout_game.objects.bricks import BrickField
+from breakout_game.simulation import follow_ball
+from breakout_game.spatial import BrickGrid
+
+
+BRICK = (16, 8)
+
+
+def moving_wall(n: int, seed: int = 1) -> BrickField:
+
+    rng = random.Random(seed)
+    w, h = BRICK
+    bricks = BrickField(n)
+    for _ in range(n):
+        bricks.add(rng.randrange(SCREEN.width - w), rng.randrange(SCREEN.height * 2 // 3), w, h, hits_left = 10_000)
+    return bricks
+
+
+def positions(base_x: np.ndarray, base_y: np.ndarray, t: int) -> tuple[np.ndarray, np.ndarray]:
+
+    """
+    Frame t: a third slide sideways, a third bob up and down, a third
+    fall and wrap back to the top.
+    """
+    idx = np.arange(len(base_x))
+    phase = t / 30 + idx
+    x, y = base_x.copy(), base_y.copy()
+
+    slide, bob, fall = idx % 3 == 0, idx % 3 == 1, idx % 3 == 2
+    x[slide] += (40 * np.sin(phase[slide])).astype(np.int32)
+    y[bob] += (12 * np.sin(phase[bob])).astype(np.int32)
+    y[fall] = (base_y[fall] + 2 * t) % (SCREEN.height * 2 // 3)
+    return x, y
+
+
+def queries(n: int, seed: int = 2) -> list[tuple[int, int, int, int]]:
+
+    rng = random.Random(seed)
+    w, h = BALL.fallback_size
+    return [(x, y, x + w, y + h) for x, y in
+            ((rng.randrange(SCREEN.width), rng.randrange(SCREEN.height)) for _ in range(n))]
+
+
+def bench_tree(bricks: BrickField, frames: int, rects, moving: float = 1.0) -> tuple[float, float, float]:
+
+    """
+    ms per frame moving the first `moving` share of the bricks and
+    answering the queries, and candidates found per query.
+    """
+    base_x, base_y = bricks.x[:bricks.count].copy(), bricks.y[:bricks.count].copy()
+    bricks.track()
+    movers = np.arange(int(bricks.count * moving))
+    move_s = query_s = 0.0
+    found = 0
+
+    for t in range(frames):
+        x, y = positions(base_x, base_y, t)
+        start = time.perf_counter()
+        bricks.move_many(movers, x[movers], y[movers])
+        move_s += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for rect in rects:
+            found += len(bricks.candidates(*rect))
+        query_s += time.perf_counter() - start
+
+    return move_s / frames, query_s / frames, found / frames / len(rects)
+
+
+def bench_grid(bricks: BrickField, frames: int, rects) -> tuple[float, float]:
+
+    base_x, base_y = bricks.x[:bricks.count].copy(), bricks.y[:bricks.count].copy()
+    w, h = bricks.w[:bricks.count], bricks.h[:bricks.count]
+    build_s = query_s = 0.0
+
+    for t in range(frames):
+        x, y = positions(base_x, base_y, t)
+        start = time.perf_counter()
+        grid = BrickGrid(x, y, w, h, cell_width = 2 * BRICK[0], cell_height = 2 * BRICK[1], origin_y = 0)
+        build_s += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for rect in rects:
+            grid.candidates(*rect)
+        query_s += time.perf_counter() - start
+
+    return build_s / frames, query_s / frames
+
+
+def bench_linear(bricks: BrickField, frames: int, rects) -> float:
+
+    base_x, base_y = bricks.x[:bricks.count].copy(), bricks.y[:bricks.count].copy()
+    w, h = bricks.w[:bricks.count], bricks.h[:bricks.count]
+    query_s = 0.0
+
+    for t in range(frames):
+        x, y = positions(base_x, base_y, t)
+        start = time.perf_counter()
+        for left, top, right, bottom in rects:
+            np.flatnonzero((x < right) & (left < x + w) & (y < bottom) & (top < y + h))
+        query_s += time.perf_counter() - start
+
+    return query_s / frames
+
+
+def bench_game(n: int, frames: int) -> tuple[float, float]:
+
+    """
+    Game ticks (step physics, scripted bat) with n moving bricks.
+    """
+    game = Game(headless = True, seed = 1)
+    game.collision.bounce_sound = game.collision.brick_hit_sound = None
+    game.bricks = moving_wall(n)
+    game.rebuild_sprite_list()
+    bricks = game.bricks
+    base_x, base_y = bricks.x[:n].copy(), bricks.y[:n].copy()
+    bricks.track()
+    everything = np.arange(n)
+    move_s = tick_s = 0.0
+
+    for t in range(frames):
+        x, y = positions(base_x, base_y, t)
+        start = time.perf_counter()
+        bricks.move_many(everything, x, y)
+        move_s += time.perf_counter() - start
+
+        start = time.perf_counter()
+        game.step(follow_ball(game))
+        tick_s += time.perf_counter() - start
+
+    return move_s / frames, tick_s / frames
+
+
+def main(frames: int = 60, balls: int = 1000):
+
+    rects = queries(balls)
+    print(f"frame budget {1e3 / SCREEN.fps:.2f} ms; {balls} ball queries per frame, bricks {BRICK[0]}x{BRICK[1]}")
+    print(f"{'bricks':>7} {'found':>6} {'tree move':>10} {'query':>7} {'refit':>6} {'reins':>6} {'depth':>6}"
+          f" {'grid build':>11} {'query':>7} {'linear':>8}  (ms/frame)")
+
+    for n in (1000, 5000, 10000):
+        bricks = moving_wall(n)
+        move_s, query_s, found = bench_tree(bricks, frames, rects)
+        tree = bricks.tree
+        refits, reinserts = tree.refits / frames, tree.reinserts / frames
+
+        build_ms, grid_query_ms = (s * 1e3 for s in bench_grid(moving_wall(n), frames, rects))
+        linear_ms = bench_linear(moving_wall(n), max(1, frames // 10), rects) * 1e3
+
+        print(f"{n:>7} {found:>6.1f} {move_s * 1e3:>10.2f} {query_s * 1e3:>7.2f} {refits:>6.0f} {reinserts:>6.0f}"
+              f" {tree.depth:>6} {build_ms:>11.2f} {grid_query_ms:>7.2f} {linear_ms:>8.2f}")
+
+    # The tree pays per moved brick, a rebuilt grid per brick
+    print(f"\n{'moving':>7} {'tree move ms':>13}  (10000 bricks)")
+    for moving in (0.01, 0.1, 0.5):
+        move_s, _, _ = bench_tree(moving_wall(10000), frames, rects[:1], moving)
+        print(f"{moving:>7.0%} {move_s * 1e3:>13.2f}")
+
+    print(f"\n{'bricks':>7} {'move ms':>8} {'tick ms':>8}  (game, tree lookups)")
+    for n in (1000, 5000, 10000):
+        move_ms, tick_ms = (s * 1e3 for s in bench_game(n, frames))
+        print(f"{n:>7} {move_ms:>8.2f} {tick_ms:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""
+Synthetic scenarios for benchmarks.suite. Each setup function builds its
+scenario once and returns the operation to time.
+"""
+
+import os
+import random
+from dataclasses import dataclass
+from typing import Callable
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from breakout_game.game_logic import Game
+from breakout_game.levels import compile_source, decode_level, encode_level
+from breakout_game.objects.ball import BallSystem
+from breakout_game.objects.particles import ParticleSystem
+from breakout_game.simulation import follow_ball
+from breakout_game.state import GameState
+from breakout_game.utils import reflect_ball_on_rect
+
+from .bench_balls import fill_balls
+from .bench_bricks import make_wall
+from .bench_levels import make_source
+from .bench_particles import fill_particles
+
+
+@dataclass
+class Benchmark:
+
+    """
+    setup() builds the scenario and returns the operation to time.
+    """
+    name: str
+    setup: Callable[[], Callable[[], object]]
+
+
+REGISTRY: list[Benchmark] = []
+
+
+def benchmark(name: str):
+
+    """
+    Decorator: register a setup function under name.
+    """
+    def register(setup):
+        REGISTRY.append(Benchmark(name, setup))
+        return setup
+    return register
+
+
+def _game(headless: bool, balls: int = 1, seed: int = 1, physics: str = "step") -> Game:
+
+    """
+    A fresh game; with balls > 1, balls are scattered and bricks made
+    unbreakable so the scenario does not end mid-benchmark.
+    """
+    game = Game(headless = headless, seed = seed, physics = physics)
+    game.collision.bounce_sound = game.collision.brick_hit_sound = None
+
+    if balls > 1:
+        fill_balls(game, balls, random.Random(seed))
+    return game
+
+
+# ---------- Collision ----------
+@benchmark("collision.reflect_ball_on_rect")
+def _reflect():
+
+    brick = pygame.Rect(100, 100, 80, 50)
+    start = pygame.Rect(90, 140, 18, 18)
+    ball = start.copy()
+
+    def op():
+        ball.topleft = start.topleft
+        reflect_ball_on_rect(ball, (4.0, -4.0), brick)
+    return op
+
+
+def _handle_bricks(rows: int, cols: int, tracked: bool = False):
+
+    game = _game(headless = True)
+    bricks = make_wall(rows, cols)
+    bricks.hits_left[:] = 1 << 14
+    if tracked:
+        bricks.track()      # lookups through the dynamic AABB tree instead of the grid
+
+    # One ball moving up into the middle of the wall
+    target = bricks.rect(bricks.count // 2)
+    balls = BallSystem((18, 18))
+    balls.spawn(target.centerx, target.bottom + 4, 4.0, -4.0)
+    start = (balls.x[0], balls.y[0])
+
+    def op():
+        balls.x[0], balls.y[0] = start
+        balls.vx[0], balls.vy[0] = 4.0, -4.0
+        balls.can_hit_brick[0] = True
+        game.collision.handle_bricks(balls, 0, bricks)
+    return op
+
+
+@benchmark("collision.handle_bricks.7x10")
+def _handle_bricks_small():
+    return _handle_bricks(7, 10)
+
+
+@benchmark("collision.handle_bricks.100x100")
+def _handle_bricks_large():
+    return _handle_bricks(100, 100)
+
+
+@benchmark("collision.handle_bricks.100x100.tree")
+def _handle_bricks_tree():
+    return _handle_bricks(100, 100, tracked = True)
+
+
+# ---------- Layout ----------
+@benchmark("layout.bricks_layout")
+def _layout():
+    return _game(headless = True).bricks_layout
+
+
+@benchmark("layout.level_decode.300k")
+def _level_decode():
+
+    data = encode_level(compile_source(make_source(600, 600)))
+    return lambda: decode_level(data)
+
+
+@benchmark("layout.level_restart.300k")
+def _level_restart():
+
+    template = compile_source(make_source(600, 600))
+    template.grid
+    return template.copy
+
+
+# ---------- Update ----------
+@benchmark("update.1_ball")
+def _update_one():
+
+    game = _game(headless = True)
+    return lambda: game.step(follow_ball(game))
+
+
+@benchmark("update.1_ball.events")
+def _update_one_events():
+
+    game = _game(headless = True, physics = "events")
+    return lambda: game.step(follow_ball(game))
+
+
+@benchmark("update.1_ball.swept")
+def _update_one_swept():
+
+    game = _game(headless = True, physics = "swept")
+    return lambda: game.step(follow_ball(game))
+
+
+@benchmark("update.1000_balls")
+def _update_many():
+
+    game = _game(headless = True, balls = 1000)
+
+    def op():
+        # Keep the ball count steady: refill once half are lost
+        if len(game.balls) < 500:
+            fill_balls(game, 1000, random.Random(1))
+        game.step(0)
+    return op
+
+
+# ---------- Draw ----------
+@benchmark("draw.full_repaint")
+def _draw_full():
+
+    game = _game(headless = False)
+
+    def op():
+        game.renderer.invalidate()
+        game.draw()
+    return op
+
+
+@benchmark("draw.frame.1_ball")
+def _frame_one():
+
+    game = _game(headless = False)
+
+    def op():
+        game.step(follow_ball(game))
+        game.draw()
+    return op
+
+
+@benchmark("draw.frame.1000_balls")
+def _frame_many():
+
+    game = _game(headless = False, balls = 1000)
+
+    def op():
+        if len(game.balls) < 500:
+            fill_balls(game, 1000, random.Random(1))
+        game.step(0)
+        game.draw()
+    return op
+
+
+@benchmark("particles.trail.20k_balls")
+def _trail_many():
+
+    # More trail particles than the pool holds without the trail budget
+    rng = random.Random(1)
+    balls = BallSystem((18, 18))
+    for _ in range(20_001):
+        balls.spawn(rng.randrange(800), rng.randrange(600), 0.0, 0.0)
+    particles = ParticleSystem(seed = 1)
+
+    def op():
+        particles.trail(balls)
+        particles.update()
+    return op
+
+
+@benchmark("draw.frame.20k_particles")
+def _frame_particles():
+
+    game = _game(headless = False)
+
+    def op():
+        fill_particles(game.particles, 20_000)
+        game.step(follow_ball(game))
+        game.draw()
+    return op
+
+
+@benchmark("draw.game_over_overlay")
+def _game_over():
+
+    game = _game(headless = False)
+    game.state = GameState.LOST
+    game.draw()
+    return game.draw
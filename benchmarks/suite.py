@@ -0,0 +1,193 @@
+"""
+Benchmark suite for the game's hot paths, with JSON baselines.
+
+Run from the repo root:
+    python -m benchmarks.suite                          # run and print
+    python -m benchmarks.suite --save baseline.json     # write a baseline
+    python -m benchmarks.suite --compare baseline.json --threshold 0.10 \\
+        --threshold-for draw.full_repaint=0.25          # exit 1 on regression
+    python -m benchmarks.suite -k update                # only names containing "update"
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass, asdict
+from typing import Callable
+
+# Before pygame is imported anywhere
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+@dataclass
+class Result:
+
+    """
+    Per-operation timings in seconds over `repeat` samples of `number` calls.
+    """
+    median: float
+    mean: float
+    stdev: float
+    min: float
+    max: float
+    p95: float
+    number: int
+    repeat: int
+
+
+def _calibrate(op, min_sample: float) -> int:
+
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            op()
+        if time.perf_counter() - start >= min_sample or number >= 1 << 20:
+            return number
+        number *= 2
+
+
+def measure(op: Callable[[], object], repeat: int = 15, min_sample: float = 0.005) -> Result:
+
+    number = _calibrate(op, min_sample)
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            op()
+        samples.append((time.perf_counter() - start) / number)
+
+    ordered = sorted(samples)
+    return Result(
+        median = statistics.median(samples),
+        mean = statistics.fmean(samples),
+        stdev = statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        min = ordered[0],
+        max = ordered[-1],
+        p95 = ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))],
+        number = number,
+        repeat = repeat,
+    )
+
+
+def run(selected: list, repeat: int) -> dict[str, Result]:
+
+    results = {}
+    for bench in selected:
+        op = bench.setup()
+        results[bench.name] = result = measure(op, repeat = repeat)
+        print(f"{bench.name:<32} {_fmt(result.median):>10} ±{_fmt(result.stdev):>9}  "
+              f"min {_fmt(result.min):>9}  p95 {_fmt(result.p95):>9}")
+    return results
+
+
+def _fmt(seconds: float) -> str:
+
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.2f} us"
+
+
+def save(path: str, results: dict[str, Result]) -> None:
+
+    import numpy
+    import pygame
+
+    data = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pygame": pygame.version.ver,
+            "numpy": numpy.__version__,
+        },
+        "results": {name: asdict(result) for name, result in results.items()},
+    }
+    with open(path, "w", encoding = "utf-8") as f:
+        json.dump(data, f, indent = 2)
+
+
+def compare(results: dict[str, Result], baseline_path: str, threshold: float,
+            overrides: dict[str, float]) -> list[str]:
+
+    """
+    Compare medians against a saved baseline. Returns the regressed names.
+    """
+    with open(baseline_path, encoding = "utf-8") as f:
+        baseline = json.load(f)["results"]
+
+    regressions = []
+    print(f"\n{'benchmark':<32} {'baseline':>10} {'current':>10} {'change':>8}")
+
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:<32} {'-':>10} {_fmt(result.median):>10} {'new':>8}")
+            continue
+
+        before = baseline[name]["median"]
+        change = result.median / before - 1
+        limit = overrides.get(name, threshold)
+        flag = ""
+        if change > limit:
+            regressions.append(name)
+            flag = f"  REGRESSION (> {limit:.0%})"
+
+        print(f"{name:<32} {_fmt(before):>10} {_fmt(result.median):>10} {change:>+8.1%}{flag}")
+
+    return regressions
+
+
+def _parse_override(text: str) -> tuple[str, float]:
+
+    name, _, value = text.partition("=")
+    if not value:
+        raise argparse.ArgumentTypeError(f"expected NAME=FRACTION, got {text!r}")
+    return name, float(value)
+
+
+def main(argv: list[str] | None = None) -> int:
+
+    parser = argparse.ArgumentParser(description = "Run the game benchmark suite.")
+    parser.add_argument("-k", dest = "pattern", default = "", help = "only benchmarks whose name contains this")
+    parser.add_argument("--repeat", type = int, default = 15, help = "samples per benchmark")
+    parser.add_argument("--save", metavar = "PATH", help = "write results to a JSON baseline")
+    parser.add_argument("--compare", metavar = "PATH", help = "compare against a JSON baseline")
+    parser.add_argument("--threshold", type = float, default = 0.10,
+                        help = "allowed slowdown of the median, as a fraction (default 0.10)")
+    parser.add_argument("--threshold-for", type = _parse_override, action = "append", default = [],
+                        metavar = "NAME=FRACTION", help = "per-benchmark threshold (repeatable)")
+    parser.add_argument("--list", action = "store_true", help = "list benchmark names and exit")
+    args = parser.parse_args(argv)
+
+    from .scenarios import REGISTRY
+
+    selected = [b for b in REGISTRY if args.pattern in b.name]
+
+    if args.list:
+        for bench in selected:
+            print(bench.name)
+        return 0
+
+    results = run(selected, args.repeat)
+
+    if args.save:
+        save(args.save, results)
+        print(f"\nsaved {len(results)} results to {args.save}")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold, dict(args.threshold_for))
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,345 @@
+NULL = -1
+
+
+class AABBTree:
+
+    """
+    Dynamic bounding-volume tree for moving obstacles (BrickField.track()).
+
+    Leaves hold an item's box fattened by `margin`, plus room ahead along
+    its last displacement, so a small move usually stays inside the fat box
+    and costs nothing. A move that leaves it but stays within the parent's
+    box refits: the leaf takes a new fat box and its ancestors shrink to
+    fit, stopping at the first one that does not change. A move beyond the
+    parent re-inserts the leaf instead, so boxes never grow to chase a
+    brick that wandered off and the tree keeps its shape.
+    Inserting picks the sibling that adds the least perimeter, and AVL-style
+    rotations on the way up keep the height logarithmic, so queries are too.
+
+    Nodes live in parallel Python lists (fast scalar access), recycled
+    through a free list; a proxy is a leaf's node index.
+    """
+    def __init__(self, margin: int = 4, predict: float = 4.0):
+
+        self.margin = margin
+        self.predict = predict      # extra room along a move, in multiples of the move
+
+        self.x0: list[float] = []
+        self.y0: list[float] = []
+        self.x1: list[float] = []
+        self.y1: list[float] = []
+        self.parent: list[int] = []
+        self.child1: list[int] = []
+        self.child2: list[int] = []
+        self.height: list[int] = []     # 0 for leaves
+        self.item: list[int] = []
+
+        self.root = NULL
+        self.leaves = 0
+        self._free: list[int] = []
+
+        self.refits = 0         # moves handled in place, lifetime totals
+        self.reinserts = 0
+
+    def __len__(self) -> int:
+        return self.leaves
+
+    @property
+
+    def depth(self) -> int:
+        return self.height[self.root] if self.root != NULL else 0
+
+    # ---------- Nodes ----------
+    def _alloc(self) -> int:
+
+        if self._free:
+            node = self._free.pop()
+        else:
+            node = len(self.parent)
+            for column in (self.x0, self.y0, self.x1, self.y1):
+                column.append(0)
+            self.parent.append(NULL)
+            self.child1.append(NULL)
+            self.child2.append(NULL)
+            self.height.append(0)
+            self.item.append(NULL)
+
+        self.parent[node] = self.child1[node] = self.child2[node] = NULL
+        self.height[node] = 0
+        return node
+
+    def _union(self, node: int, a: int, b: int) -> bool:
+
+        """
+        Set node's box to cover a's and b's; False if it was that already.
+        (Conditional expressions: min()/max() calls dominate otherwise.)
+        """
+        x0, y0, x1, y1 = self.x0, self.y0, self.x1, self.y1
+        box = (x0[a] if x0[a] < x0[b] else x0[b], y0[a] if y0[a] < y0[b] else y0[b],
+               x1[a] if x1[a] > x1[b] else x1[b], y1[a] if y1[a] > y1[b] else y1[b])
+        if box == (x0[node], y0[node], x1[node], y1[node]):
+            return False
+        x0[node], y0[node], x1[node], y1[node] = box
+        return True
+
+    def _fatten(self, node: int, left, top, right, bottom, dx = 0, dy = 0) -> None:
+
+        margin = self.margin
+        ahead_x, ahead_y = self.predict * dx, self.predict * dy
+        self.x0[node] = left - margin + min(ahead_x, 0)
+        self.y0[node] = top - margin + min(ahead_y, 0)
+        self.x1[node] = right + margin + max(ahead_x, 0)
+        self.y1[node] = bottom + margin + max(ahead_y, 0)
+
+    # ---------- Proxies ----------
+    def insert(self, item: int, left, top, right, bottom) -> int:
+
+        """
+        Add item with box [left, right) x [top, bottom); returns its proxy.
+        """
+        leaf = self._alloc()
+        self.item[leaf] = item
+        self._fatten(leaf, left, top, right, bottom)
+        self._insert_leaf(leaf)
+        self.leaves += 1
+        return leaf
+
+    def remove(self, proxy: int) -> None:
+
+        self._remove_leaf(proxy)
+        self.item[proxy] = NULL
+        self._free.append(proxy)
+        self.leaves -= 1
+
+    def move(self, proxy: int, left, top, right, bottom, dx = 0, dy = 0) -> bool:
+
+        """
+        The item's box is now [left, right) x [top, bottom), having moved
+        by (dx, dy). Returns False if it is still inside its fat box (the
+        tree is untouched), True if the tree was refitted or the leaf re-inserted.
+        """
+        if (self.x0[proxy] <= left and right <= self.x1[proxy]
+                and self.y0[proxy] <= top and bottom <= self.y1[proxy]):
+            return False
+
+        self._fatten(proxy, left, top, right, bottom, dx, dy)
+
+        parent = self.parent[proxy]
+        if parent != NULL and (self.x0[parent] <= self.x0[proxy] and self.x1[proxy] <= self.x1[parent]
+                               and self.y0[parent] <= self.y0[proxy] and self.y1[proxy] <= self.y1[parent]):
+            self._refit(parent)
+            self.refits += 1
+        else:
+            # Out, and back in where the new fat box fits best
+            self._remove_leaf(proxy)
+            self._insert_leaf(proxy)
+            self.reinserts += 1
+        return True
+
+    # ---------- Queries ----------
+    def query(self, left, top, right, bottom) -> list[int]:
+
+        """
+        Items whose fat box overlaps [left, right) x [top, bottom), in no
+        particular order. Candidates only: callers do the exact test.
+        """
+        found = []
+        root = self.root
+        x0, y0, x1, y1 = self.x0, self.y0, self.x1, self.y1
+        if root == NULL or not (x0[root] < right and left < x1[root] and y0[root] < bottom and top < y1[root]):
+            return found
+
+        # Children are tested before they are pushed: the stack only holds hits
+        child1, child2, item = self.child1, self.child2, self.item
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            first = child1[node]
+            if first == NULL:
+                found.append(item[node])
+                continue
+            for child in (first, child2[node]):
+                if x0[child] < right and left < x1[child] and y0[child] < bottom and top < y1[child]:
+                    stack.append(child)
+
+        return found
+
+    def any(self, left, top, right, bottom) -> bool:
+
+        """
+        Whether some fat box overlaps the rect (query() stopping at the first).
+        """
+        root = self.root
+        x0, y0, x1, y1 = self.x0, self.y0, self.x1, self.y1
+        if root == NULL or not (x0[root] < right and left < x1[root] and y0[root] < bottom and top < y1[root]):
+            return False
+
+        child1, child2 = self.child1, self.child2
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            first = child1[node]
+            if first == NULL:
+                return True
+            for child in (first, child2[node]):
+                if x0[child] < right and left < x1[child] and y0[child] < bottom and top < y1[child]:
+                    stack.append(child)
+
+        return False
+
+    def fat_box(self, proxy: int) -> tuple:
+        return self.x0[proxy], self.y0[proxy], self.x1[proxy], self.y1[proxy]
+
+    # ---------- Structure ----------
+    def _insert_leaf(self, leaf: int) -> None:
+
+        if self.root == NULL:
+            self.root = leaf
+            self.parent[leaf] = NULL
+            return
+
+        x0, y0, x1, y1 = self.x0, self.y0, self.x1, self.y1
+        first, second = self.child1, self.child2
+        lx0, ly0, lx1, ly1 = x0[leaf], y0[leaf], x1[leaf], y1[leaf]
+
+        # Walk down to the sibling that adds the least perimeter overall
+        node = self.root
+        while first[node] != NULL:
+            combined = ((x1[node] if x1[node] > lx1 else lx1) - (x0[node] if x0[node] < lx0 else lx0)
+                        + (y1[node] if y1[node] > ly1 else ly1) - (y0[node] if y0[node] < ly0 else ly0))
+            cost = 2 * combined                 # new parent of node and leaf
+            inherited = 2 * (combined - (x1[node] - x0[node] + y1[node] - y0[node]))   # growth of the ancestors
+
+            costs = []
+            for child in (first[node], second[node]):
+                grown = ((x1[child] if x1[child] > lx1 else lx1) - (x0[child] if x0[child] < lx0 else lx0)
+                         + (y1[child] if y1[child] > ly1 else ly1) - (y0[child] if y0[child] < ly0 else ly0))
+                if first[child] != NULL:
+                    grown -= x1[child] - x0[child] + y1[child] - y0[child]
+                costs.append(grown + inherited)
+
+            if cost < costs[0] and cost < costs[1]:
+                break
+            node = first[node] if costs[0] < costs[1] else second[node]
+
+        sibling = node
+        old_parent = self.parent[sibling]
+        new_parent = self._alloc()
+        self.parent[new_parent] = old_parent
+        self._union(new_parent, sibling, leaf)
+        self.height[new_parent] = self.height[sibling] + 1
+
+        if old_parent == NULL:
+            self.root = new_parent
+        elif first[old_parent] == sibling:
+            first[old_parent] = new_parent
+        else:
+            second[old_parent] = new_parent
+
+        first[new_parent], second[new_parent] = sibling, leaf
+        self.parent[sibling] = self.parent[leaf] = new_parent
+
+        # new_parent is already up to date, bar balance: its ancestors are not
+        self._balance(new_parent)
+        self._fix_upwards(old_parent)
+
+    def _remove_leaf(self, leaf: int) -> None:
+
+        if leaf == self.root:
+            self.root = NULL
+            return
+
+        parent = self.parent[leaf]
+        grandparent = self.parent[parent]
+        sibling = self.child2[parent] if self.child1[parent] == leaf else self.child1[parent]
+
+        if grandparent == NULL:
+            self.root = sibling
+            self.parent[sibling] = NULL
+        else:
+            if self.child1[grandparent] == parent:
+                self.child1[grandparent] = sibling
+            else:
+                self.child2[grandparent] = sibling
+            self.parent[sibling] = grandparent
+            self._fix_upwards(grandparent)
+
+        self._free.append(parent)
+
+    def _fix_upwards(self, node: int) -> None:
+
+        """
+        Rebalance, then recompute heights and boxes from node up to the
+        root, stopping once a node comes out unchanged.
+        """
+        height, first, second = self.height, self.child1, self.child2
+        while node != NULL:
+            balanced = self._balance(node)
+            child1, child2 = first[balanced], second[balanced]
+            h1, h2 = height[child1], height[child2]
+            new_height = 1 + (h1 if h1 > h2 else h2)
+
+            grew = self._union(balanced, child1, child2)
+            if balanced == node and not grew and new_height == height[node]:
+                return
+            height[balanced] = new_height
+            node = self.parent[balanced]
+
+    def _refit(self, node: int) -> None:
+
+        """
+        Recompute boxes from node up, stopping where nothing changes.
+        """
+        x0, y0, x1, y1 = self.x0, self.y0, self.x1, self.y1
+        while node != NULL:
+            child1, child2 = self.child1[node], self.child2[node]
+            box = (min(x0[child1], x0[child2]), min(y0[child1], y0[child2]),
+                   max(x1[child1], x1[child2]), max(y1[child1], y1[child2]))
+            if box == (x0[node], y0[node], x1[node], y1[node]):
+                return
+            x0[node], y0[node], x1[node], y1[node] = box
+            node = self.parent[node]
+
+    def _balance(self, a: int) -> int:
+
+        """
+        If node a's subtrees differ in height by more than one, rotate the
+        taller child up in its place. Returns the node now in a's place.
+        """
+        if self.child1[a] == NULL or self.height[a] < 2:
+            return a
+
+        b, c = self.child1[a], self.child2[a]
+        balance = self.height[c] - self.height[b]
+        if -1 <= balance <= 1:
+            return a
+
+        # Rotate the taller child (up) above a; keep its taller grandchild
+        up, other = (c, b) if balance > 1 else (b, c)
+        f, g = self.child1[up], self.child2[up]
+
+        self.child1[up] = a
+        self.parent[up] = self.parent[a]
+        self.parent[a] = up
+
+        parent = self.parent[up]
+        if parent == NULL:
+            self.root = up
+        elif self.child1[parent] == a:
+            self.child1[parent] = up
+        else:
+            self.child2[parent] = up
+
+        keep, give = (f, g) if self.height[f] > self.height[g] else (g, f)
+        self.child2[up] = keep
+        if balance > 1:
+            self.child2[a] = give       # a keeps b
+        else:
+            self.child1[a] = give       # a keeps c
+        self.parent[give] = a
+
+        self._union(a, other, give)
+        self._union(up, a, keep)
+        self.height[a] = 1 + max(self.height[other], self.height[give])
+        self.height[up] = 1 + max(self.height[a], self.height[keep])
+        return up
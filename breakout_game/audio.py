@@ -0,0 +1,103 @@
+import math
+
+import pygame
+
+from .config import AUDIO
+from .perf import NullFrameStats
+
+
+# Higher wins when the channel pool is full
+PRIORITY_BOUNCE = 0
+PRIORITY_BRICK = 1
+
+
+class SoundBus:
+
+    """
+    Sits between CollisionSystem and pygame.mixer. Game flushes it once a frame.
+
+    Identical requests within a frame are coalesced into one play. A single
+    request plays at full volume, as it would without the bus; a merged
+    one at gain * sqrt(count), capped at 1.0. Plays go to
+    a pool of reserved mixer channels; when every channel is busy, a
+    request cuts off the oldest sound of the lowest priority not above its
+    own, otherwise it is dropped.
+    At most `per_frame` plays start per frame, highest priority first.
+    """
+    def __init__(self, channels: int = AUDIO.sfx_channels, per_frame: int = AUDIO.sfx_per_frame,
+                 gain: float = AUDIO.sfx_gain, perf = None):
+
+        self.size = channels
+        self.per_frame = per_frame
+        self.gain = gain
+        self.perf = perf or NullFrameStats()
+
+        self._requests = {}         # id(sound) -> [sound, count, priority]
+        self._channels = None       # built on first use: the mixer may start late
+        self._priorities = []
+        self._started = []          # play serial per channel, to find the oldest
+        self._serial = 0
+
+    def request(self, sound: pygame.mixer.Sound, priority: int = PRIORITY_BOUNCE, count: int = 1) -> None:
+
+        entry = self._requests.get(id(sound))
+        if entry is None:
+            self._requests[id(sound)] = [sound, count, priority]
+        else:
+            entry[1] += count
+            entry[2] = max(entry[2], priority)
+
+    def _pool(self) -> list:
+
+        if self._channels is None and pygame.mixer.get_init():
+            pygame.mixer.set_reserved(self.size)
+            self._channels = [pygame.mixer.Channel(n) for n in range(self.size)]
+            self._priorities = [PRIORITY_BOUNCE] * self.size
+            self._started = [0] * self.size
+        return self._channels or []
+
+    def _channel_for(self, priority: int):
+
+        """
+        A free channel, else the one to steal (None if every sound outranks priority).
+        """
+        channels = self._pool()
+        victim = None
+
+        for n, channel in enumerate(channels):
+            if not channel.get_busy():
+                return n
+            key = (self._priorities[n], self._started[n])
+            if self._priorities[n] <= priority and (victim is None or key < victim[0]):
+                victim = (key, n)
+
+        return None if victim is None else victim[1]
+
+    def flush(self) -> None:
+
+        if not self._requests:
+            return
+
+        requests = sorted(self._requests.values(), key = lambda r: -r[2])
+        self._requests.clear()
+
+        requested = sum(count for _, count, _ in requests)
+        played = 0
+
+        for sound, count, priority in requests[:self.per_frame]:
+            n = self._channel_for(priority)
+            if n is None:
+                continue
+
+            channel = self._channels[n]
+            channel.set_volume(1.0 if count == 1 else min(1.0, self.gain * math.sqrt(count)))
+            channel.play(sound)
+            self._priorities[n] = priority
+            self._serial += 1
+            self._started[n] = self._serial
+            played += 1
+
+        self.perf.count("sfx_requested", requested)
+        self.perf.count("sfx_coalesced", requested - len(requests))
+        self.perf.count("sfx_played", played)
+        self.perf.count("sfx_dropped", len(requests) - played)
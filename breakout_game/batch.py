@@ -0,0 +1,265 @@
+"""
+Batch simulation for tuning the config dataclasses, spread over all cores.
+
+    python -m breakout_game.batch --seeds 64 --frames 72000 \\
+        --grid bricks.power_chance=0.05,0.1,0.2 --grid ball.max_speed=6,8 \\
+        --out results.jsonl
+
+Every grid point is played once per seed (the same seeds for every point,
+so points are compared on identical layouts where the layout allows it) by
+a headless Game with the follow_ball controller, until the game is won,
+lost or out of frames. Each finished run is appended to the results file as
+a JSON line as soon as a worker returns it; one summary line per grid point
+follows at the end.
+"""
+
+import argparse
+import ast
+import itertools
+import json
+import os
+import statistics
+import time
+from dataclasses import dataclass, fields, replace
+from multiprocessing import Pool
+
+import numpy as np
+
+from .config import SCREEN, BALL, BRICKS, RULES
+from .game_logic import Game
+from .simulation import follow_ball
+from .state import GameState
+
+
+# Grid prefixes -> (Game keyword, default config)
+SECTIONS = {
+    "rules": ("rules", RULES),
+    "ball": ("ball_config", BALL),
+    "bricks": ("brick_config", BRICKS),
+}
+
+
+@dataclass(frozen = True)
+
+class Job:
+
+    point: int                  # index of the grid point
+    params: tuple               # ((name, value), ...) for that point
+    seed: int
+    max_frames: int
+
+
+def _convert(default, text: str):
+
+    if isinstance(default, bool):
+        if text.lower() in ("1", "true", "yes", "on"):
+            return True
+        if text.lower() in ("0", "false", "no", "off"):
+            return False
+        raise ValueError(f"expected a boolean, got {text!r}")
+
+    if isinstance(default, tuple):
+        try:
+            value = ast.literal_eval(text)
+        except (ValueError, SyntaxError):
+            value = None
+        if not isinstance(value, tuple) or len(value) != len(default):
+            raise ValueError(f"expected a tuple like {default!r}, got {text!r}")
+        return tuple(type(d)(v) for d, v in zip(default, value))
+
+    if not isinstance(default, (int, float, str)):
+        raise ValueError(f"cannot sweep a {type(default).__name__} field")
+    return type(default)(text)
+
+
+def _split_values(text: str) -> list[str]:
+
+    """
+    Split on commas outside parentheses: "(18,18),(24,24)" -> ["(18,18)", "(24,24)"].
+    """
+    values, depth, start = [], 0, 0
+    for n, char in enumerate(text):
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            values.append(text[start:n])
+            start = n + 1
+    values.append(text[start:])
+    return values
+
+
+def parse_axis(text: str) -> tuple[str, list]:
+
+    """
+    "bricks.power_chance=0.05,0.1" -> ("bricks.power_chance", [0.05, 0.1]),
+    with values converted to the type of the config default. Tuple fields
+    take Python tuples: "ball.fallback_size=(18,18),(24,24)".
+    """
+    name, _, values = text.partition("=")
+    section, _, field = name.partition(".")
+
+    if section not in SECTIONS or not values:
+        raise argparse.ArgumentTypeError(f"expected SECTION.FIELD=V1,V2,... with SECTION in {sorted(SECTIONS)}")
+
+    default = SECTIONS[section][1]
+    if field not in {f.name for f in fields(default)}:
+        raise argparse.ArgumentTypeError(f"{type(default).__name__} has no field {field!r}")
+
+    try:
+        return name, [_convert(getattr(default, field), v) for v in _split_values(values)]
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"{name}: {e}")
+
+
+def expand_grid(axes: list[tuple[str, list]]) -> list[tuple]:
+
+    """
+    Cartesian product of the axes; each point is a tuple of (name, value).
+    """
+    names = [name for name, _ in axes]
+    return [tuple(zip(names, combo)) for combo in itertools.product(*(values for _, values in axes))]
+
+
+def game_configs(params: tuple) -> dict:
+
+    """
+    Game keyword arguments with the grid point's overrides applied.
+    """
+    changes = {}
+    for name, value in params:
+        section, _, field = name.partition(".")
+        changes.setdefault(section, {})[field] = value
+
+    return {keyword: replace(default, **changes.get(section, {}))
+            for section, (keyword, default) in SECTIONS.items()}
+
+
+def run_job(job: Job) -> dict:
+
+    """
+    Play one game to the end (or to max_frames). Runs in a worker process.
+    """
+    game = Game(headless = True, seed = job.seed, **game_configs(job.params))
+    game.collision.bounce_sound = game.collision.brick_hit_sound = None
+
+    start = time.perf_counter()
+    frames = 0
+    try:
+        while frames < job.max_frames and game.state == GameState.PLAYING:
+            game.step(follow_ball(game))
+            frames += 1
+    finally:
+        game.close()
+
+    return {
+        "type": "run",
+        "point": job.point,
+        "params": dict(job.params),
+        "seed": job.seed,
+        "frames": frames,
+        "state": game.state.name,
+        "won": game.state == GameState.WON,
+        "score": game.score,
+        "lives": game.lives,
+        "bricks_left": len(game.bricks),
+        "balls_spawned": game.balls.spawned,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def summarize(point: int, params: tuple, runs: list[dict]) -> dict:
+
+    scores = np.array([r["score"] for r in runs])
+    clear_frames = [r["frames"] for r in runs if r["won"]]
+    p10, p50, p90 = np.percentile(scores, (10, 50, 90))
+
+    return {
+        "type": "summary",
+        "point": point,
+        "params": dict(params),
+        "runs": len(runs),
+        "win_rate": sum(r["won"] for r in runs) / len(runs),
+        "loss_rate": sum(r["state"] == GameState.LOST.name for r in runs) / len(runs),
+        "frames_to_clear_mean": statistics.fmean(clear_frames) if clear_frames else None,
+        "frames_to_clear_median": statistics.median(clear_frames) if clear_frames else None,
+        "balls_spawned_mean": statistics.fmean(r["balls_spawned"] for r in runs),
+        "score_mean": float(scores.mean()),
+        "score_stdev": float(scores.std()),
+        "score_min": int(scores.min()),
+        "score_p10": float(p10),
+        "score_p50": float(p50),
+        "score_p90": float(p90),
+        "score_max": int(scores.max()),
+    }
+
+
+def run_batch(points: list[tuple], seeds: list[int], max_frames: int, out_path: str,
+              workers: int | None = None) -> list[dict]:
+
+    """
+    Play every (point, seed) pair across a process pool, streaming run lines
+    to out_path as they complete. Returns the summary rows, one per point.
+    """
+    jobs = [Job(n, params, seed, max_frames) for n, params in enumerate(points) for seed in seeds]
+    workers = workers or os.cpu_count() or 1
+
+    # Small chunks keep every worker busy even when game lengths vary a lot
+    chunksize = max(1, len(jobs) // (workers * 8))
+    by_point = {n: [] for n in range(len(points))}
+
+    with open(out_path, "w", encoding = "utf-8") as out:
+
+        def collect(row):
+            by_point[row["point"]].append(row)
+            out.write(json.dumps(row) + "\n")
+            out.flush()
+
+        if workers == 1:
+            for job in jobs:
+                collect(run_job(job))
+        else:
+            with Pool(workers) as pool:
+                for row in pool.imap_unordered(run_job, jobs, chunksize = chunksize):
+                    collect(row)
+
+        summaries = [summarize(n, points[n], by_point[n]) for n in range(len(points))]
+        for row in summaries:
+            out.write(json.dumps(row) + "\n")
+
+    return summaries
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description = "Sweep config values over many headless games.")
+    parser.add_argument("--grid", type = parse_axis, action = "append", default = [],
+                        metavar = "SECTION.FIELD=V1,V2", help = "a swept config field (repeatable)")
+    parser.add_argument("--seeds", type = int, default = 32, help = "games per grid point")
+    parser.add_argument("--seed-base", type = int, default = 0, help = "first seed")
+    parser.add_argument("--frames", type = int, default = SCREEN.fps * 600, help = "frame limit per game")
+    parser.add_argument("--workers", type = int, default = None, help = "processes (default: all cores)")
+    parser.add_argument("--out", default = "batch_results.jsonl", help = "JSON lines results file")
+    args = parser.parse_args()
+
+    points = expand_grid(args.grid)
+    seeds = list(range(args.seed_base, args.seed_base + args.seeds))
+
+    start = time.perf_counter()
+    summaries = run_batch(points, seeds, args.frames, args.out, args.workers)
+    seconds = time.perf_counter() - start
+
+    games = len(points) * len(seeds)
+    print(f"{games} games in {seconds:.1f} s ({games / seconds:.1f} games/s), results in {args.out}")
+
+    for s in summaries:
+        label = ", ".join(f"{k}={v}" for k, v in s["params"].items()) or "defaults"
+        clear = s["frames_to_clear_median"]
+        print(f"{label:<48} win {s['win_rate']:>6.1%}  "
+              f"clear {'-' if clear is None else f'{clear:.0f}':>6} frames  "
+              f"balls {s['balls_spawned_mean']:>6.1f}  score p50 {s['score_p50']:>7.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+Packed asset bundle: images already in the display's pixel format (the
+background pre-scaled to SCREEN size) and sounds pre-decoded to the mixer's
+PCM format. Resources memory-maps it and builds surfaces and sounds straight
+from the mapped bytes, so nothing is decoded or scaled at startup.
+
+Build it after changing assets:  python -m breakout_game.bundle
+
+Layout: magic "BRKA", version u8, index length u32, the index as UTF-8 JSON,
+then the blobs, each aligned to 64 bytes. Entries remember their source
+file's size and mtime; a stale or missing entry (or a display/mixer format
+that differs from the one it was built for) just means that asset is loaded
+from its file as before.
+"""
+
+import json
+import mmap
+import os
+import struct
+
+import numpy as np
+import pygame
+
+from .config import SCREEN, ASSETS
+
+
+MAGIC = b"BRKA"
+VERSION = 1
+_HEADER = struct.Struct("<4sBI")
+ALIGN = 64
+
+
+def _source_stamp(path: str):
+
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+class AssetBundle:
+
+    """
+    Read side: a memory-mapped bundle. Every getter returns None when the
+    asset is not (usable) in the bundle.
+    """
+    def __init__(self, data: mmap.mmap, index: dict, base: int):
+        self._data = data
+        self._index = index
+        self._base = base
+
+    @classmethod
+
+    def open(cls, path: str) -> "AssetBundle | None":
+
+        """
+        Map the bundle at path; None if it is missing or not a valid bundle.
+        """
+        try:
+            with open(path, "rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            magic, version, index_len = _HEADER.unpack_from(data)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError("not a bundle")
+            start = _HEADER.size
+            index = json.loads(bytes(data[start:start + index_len]).decode("utf-8"))
+        except (struct.error, ValueError):
+            data.close()
+            return None
+
+        return cls(data, index, start + index_len)
+
+    def _entry(self, key: str, path: str):
+
+        entry = self._index.get(key)
+        if entry is None or entry["source"] != _source_stamp(path):
+            return None
+        return entry
+
+    def _view(self, entry: dict) -> memoryview:
+
+        start = self._base + entry["offset"]
+        return memoryview(self._data)[start:start + entry["length"]]
+
+    def _surface(self, entry: dict) -> pygame.Surface:
+
+        w, h = entry["size"]
+        flags = pygame.SRCALPHA if entry["alpha"] else 0
+        surface = pygame.Surface((w, h), flags, 32, entry["masks"])
+
+        # One copy from the mapping into the surface (which may pad its rows)
+        pixels = np.frombuffer(self._view(entry), dtype = np.uint32).reshape(h, w)
+        view = surface.get_view("2")
+        np.asarray(view)[:] = pixels.T
+        del view
+
+        # Only converts if this display's format differs from the build's
+        if entry["alpha"]:
+            return surface if surface.get_masks() == _display_masks(True) else surface.convert_alpha()
+        return surface if surface.get_masks() == _display_masks(False) else surface.convert()
+
+    def image(self, path: str):
+        entry = self._entry("image:" + path, path)
+        return self._surface(entry) if entry else None
+
+    def background(self, path: str):
+        entry = self._entry("background:" + path, path)
+        return self._surface(entry) if entry else None
+
+    def image_size(self, path: str):
+
+        """
+        Original image size from the index (no display needed).
+        """
+        entry = self._entry("image:" + path, path)
+        return tuple(entry["size"]) if entry else None
+
+    def sound(self, path: str):
+
+        entry = self._entry("sound:" + path, path)
+        if entry is None or list(pygame.mixer.get_init() or ()) != entry["mixer"]:
+            return None
+        return pygame.mixer.Sound(buffer = self._view(entry))
+
+
+_MASKS = {}
+
+
+def _display_masks(alpha: bool) -> tuple:
+
+    if alpha not in _MASKS:
+        probe = pygame.Surface((1, 1), pygame.SRCALPHA if alpha else 0, 32)
+        _MASKS[alpha] = (probe.convert_alpha() if alpha else probe.convert()).get_masks()
+    return _MASKS[alpha]
+
+
+# ---------- Build ----------
+def _pixels(surface: pygame.Surface) -> bytes:
+
+    """
+    Tightly packed 32-bit pixels, row by row.
+    """
+    return np.ascontiguousarray(pygame.surfarray.pixels2d(surface).T).tobytes()
+
+
+def _image_entry(surface: pygame.Surface, path: str, alpha: bool):
+    return {
+        "source": _source_stamp(path),
+        "size": list(surface.get_size()),
+        "masks": list(surface.get_masks()),
+        "alpha": alpha,
+    }, _pixels(surface)
+
+
+def collect_assets() -> list[tuple[str, dict, bytes]]:
+
+    """
+    Decode and convert every asset the game loads. Needs a display and mixer.
+    """
+    items = []
+
+    for path in (ASSETS.ball_image_file,):
+        if os.path.exists(path):
+            image = pygame.image.load(path).convert_alpha()
+            items.append(("image:" + path, *_image_entry(image, path, True)))
+
+    if os.path.exists(ASSETS.bg_image):
+        background = pygame.image.load(ASSETS.bg_image).convert()
+        background = pygame.transform.scale(background, (SCREEN.width, SCREEN.height))
+        items.append(("background:" + ASSETS.bg_image, *_image_entry(background, ASSETS.bg_image, False)))
+
+    if pygame.mixer.get_init():
+        for path in (ASSETS.brick_hit_sfx, ASSETS.bounce_sfx):
+            if os.path.exists(path):
+                raw = pygame.mixer.Sound(path).get_raw()
+                entry = {"source": _source_stamp(path), "mixer": list(pygame.mixer.get_init())}
+                items.append(("sound:" + path, entry, raw))
+
+    return items
+
+
+def write_bundle(path: str, items: list[tuple[str, dict, bytes]]) -> int:
+
+    index = {}
+    offset = 0
+    for key, entry, blob in items:
+        offset = -(-offset // ALIGN) * ALIGN
+        index[key] = dict(entry, offset = offset, length = len(blob))
+        offset += len(blob)
+
+    index_bytes = json.dumps(index).encode("utf-8")
+
+    # Pad the index so the first blob starts aligned too
+    index_bytes += b" " * (-(_HEADER.size + len(index_bytes)) % ALIGN)
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(index_bytes)))
+        f.write(index_bytes)
+        base = f.tell()
+        for key, _, blob in items:
+            f.seek(base + index[key]["offset"])
+            f.write(blob)
+        size = f.tell()
+
+    os.replace(tmp, path)
+    return size
+
+
+def main():
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    try:
+        pygame.mixer.init()
+    except pygame.error:
+        print("no audio device: sounds are left out of the bundle")
+
+    items = collect_assets()
+    size = write_bundle(ASSETS.bundle_file, items)
+    pygame.quit()
+
+    print(f"wrote {ASSETS.bundle_file}: {len(items)} assets, {size / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,90 +1,470 @@
-from .config import SCREEN, BALL, RULES
-from .utils import clamp, reflect_ball_on_rect
-from .objects.ball import Ball
+import math
+
+import numpy as np
+
+from .config import SCREEN, BALL, RULES, BallConfig, RulesConfig
+from .utils import reflect_ball_on_rect
+from .swept import INF, sweep_boxes, wall_contact
+from .spatial import sort_and_sweep
+from .audio import SoundBus, PRIORITY_BOUNCE, PRIORITY_BRICK
+from .objects.ball import BallSystem
 from .objects.bat import Bat
-from .objects.bricks import Brick
+from .objects.bricks import BrickField
+
+
+# Ball count up to which Game.resolve_collisions uses the scalar path
+SCALAR_BALLS = 8
 
 
 class CollisionSystem:
 
     """
     Game delegates collision handling to this class.
-    """    
-    def __init__(self, bounce_sound = None, brick_hit_sound = None):
+    Walls and bat run as one batched operation over a range of balls;
+    bricks are resolved ball by ball, since each hit changes the wall.
+    Ranges of at most SCALAR_BALLS balls take the scalar twins
+    (handle_walls_one, handle_bat_one) instead: for a ball or two, NumPy's
+    per-call overhead costs more than the loop it replaces.
+    Sounds are requested from a SoundBus, which Game flushes once a frame.
+    sweep() is the continuous alternative to all three (physics "swept").
+    Balls bounce off each other in handle_ball_pairs (RulesConfig.ball_collisions).
+    """
+    def __init__(self, bounce_sound = None, brick_hit_sound = None,
+                 rules: RulesConfig = RULES, ball_config: BallConfig = BALL,
+                 sound_bus: SoundBus | None = None, max_contacts: int = 8):
         self.bounce_sound = bounce_sound
         self.brick_hit_sound = brick_hit_sound
+        self.rules = rules
+        self.ball_config = ball_config
+        self.sound_bus = sound_bus or SoundBus()
+        self.max_contacts = max_contacts    # per ball and tick before sweep() falls back to substeps
+        self.substepped = 0                 # balls that needed the fallback, lifetime total
+        self.pair_tests = 0                 # ball pairs handed to the narrow phase, last call
+        self.pair_contacts = 0
+
+    def _play(self, sound, times: int = 1, priority: int = PRIORITY_BOUNCE):
+        if sound and times:
+            self.sound_bus.request(sound, priority, times)
+
+    def handle_walls_and_bottom(self, balls: BallSystem, start: int, end: int) -> np.ndarray:
+
+        """
+        Bounce balls[start:end] off the side walls and ceiling.
+        Returns a mask (one per ball in the range) of balls lost off the bottom.
+        """
+        x = balls.x[start:end]
+        y = balls.y[start:end]
+        vx = balls.vx[start:end]
+        vy = balls.vy[start:end]
+
+        left = x <= 0
+        right = ~left & (x + balls.width >= SCREEN.width)
+        top = y <= 0
+
+        x[left] = 0
+        vx[left] = np.abs(vx[left])
+
+        x[right] = SCREEN.width - balls.width
+        vx[right] = -np.abs(vx[right])
 
-    def _play(self, sound):
-        if sound:
-            sound.play()
+        y[top] = 0
+        vy[top] = np.abs(vy[top])
+
+        self._play(self.bounce_sound, int(left.sum() + right.sum() + top.sum()))
+
+        return y > SCREEN.height
+
+    def handle_walls_one(self, balls: BallSystem, i: int) -> bool:
+
+        """
+        handle_walls_and_bottom() for ball i alone, on Python scalars.
+        Returns True if the ball is lost off the bottom.
+        """
+        x, y = balls.x.item(i), balls.y.item(i)
+        bounces = 0
+
+        if x <= 0:
+            balls.x[i] = 0
+            balls.vx[i] = abs(balls.vx.item(i))
+            bounces += 1
+        elif x + balls.width >= SCREEN.width:
+            balls.x[i] = SCREEN.width - balls.width
+            balls.vx[i] = -abs(balls.vx.item(i))
+            bounces += 1
+
+        if y <= 0:
+            y = 0
+            balls.y[i] = 0
+            balls.vy[i] = abs(balls.vy.item(i))
+            bounces += 1
+
+        self._play(self.bounce_sound, bounces)
+        return y > SCREEN.height
+
+    def handle_bat_one(self, balls: BallSystem, bat: Bat, i: int) -> None:
+
+        """
+        handle_bat() for ball i alone, on Python scalars.
+        """
+        x, y = balls.x.item(i), balls.y.item(i)
+        rect = bat.rect
 
-    def handle_walls_and_bottom(self, ball: Ball) -> bool:
+        if (x < rect.right and x + balls.width > rect.left and y < rect.bottom and y + balls.height > rect.top
+                and balls.vy.item(i) > 0):
+            self._bat_response(balls, bat, np.array([i]))
 
-        if ball.rect.left <= 0:
-            ball.rect.left = 0
-            ball.vx = abs(ball.vx)
-            self._play(self.bounce_sound)
+    def handle_bat(self, balls: BallSystem, bat: Bat, start: int, end: int, active: np.ndarray) -> None:
 
-        elif ball.rect.right >= SCREEN.width:
-            ball.rect.right = SCREEN.width
-            ball.vx = -abs(ball.vx)
-            self._play(self.bounce_sound)
+        """
+        Bounce the active balls of balls[start:end] off the bat.
+        """
+        x = balls.x[start:end]
+        y = balls.y[start:end]
 
-        if ball.rect.top <= 0:
-            ball.rect.top = 0
-            ball.vy = abs(ball.vy)
-            self._play(self.bounce_sound)
+        hit = (active
+               & (x < bat.rect.right) & (x + balls.width > bat.rect.left)
+               & (y < bat.rect.bottom) & (y + balls.height > bat.rect.top)
+               & (balls.vy[start:end] > 0))
 
-        return ball.rect.top > SCREEN.height
+        if not hit.any():
+            return
 
-    def handle_bat(self, ball: Ball, bat: Bat) -> None:
+        self._bat_response(balls, bat, np.flatnonzero(hit) + start)
 
-        if ball.rect.colliderect(bat.rect) and ball.vy > 0:
-            ball.rect.bottom = bat.rect.top
+    def brick_candidates(self, balls: BallSystem, bricks: BrickField,
+                         start: int, end: int, active: np.ndarray) -> list[int]:
 
-            offset = (ball.rect.centerx - bat.rect.centerx) / (bat.rect.width / 2)
-            ball.vx = clamp(ball.vx + offset * 3.5, -BALL.max_speed, BALL.max_speed)
-            ball.vy = -abs(ball.vy)
+        """
+        Batched broad phase: indices of active balls in [start, end)
+        that may touch an alive brick, in launch order.
+        """
+        x = balls.x[start:end]
+        y = balls.y[start:end]
 
-            ball.speed_cap()
-            ball.can_hit_brick = True
-            self._play(self.bounce_sound)
+        near = active & bricks.may_hit(x, y, x + balls.width, y + balls.height)
+        idx = np.flatnonzero(near) + start
+        if len(idx) > 1:
+            idx = idx[np.argsort(balls.serial[idx], kind = "stable")]
+        return idx.tolist()
 
-    def handle_bricks(self, ball: Ball, bricks: list[Brick]) -> Brick | None:
+    def handle_bricks(self, balls: BallSystem, i: int, bricks: BrickField) -> int | None:
 
         """
-        Return the brick that counts as a hit (or None).
+        Return the index of the brick that counts as a hit (or None).
         Applies:
         - reflection
         - optional force down after brick
         - one-counted-hit per bat bounce (via ball.can_hit_brick)
+        Only bricks in the grid cells under the ball are tested.
         """
+        rect = balls.rect(i)
+        hit_brick = bricks.first_hit(rect)
 
-        hit_brick = None
-        for brick in bricks:
-            if ball.rect.colliderect(brick.rect):
-                hit_brick = brick
-                break
-
-        if not hit_brick:
+        if hit_brick is None:
             return None
 
-        was_moving_up = (ball.vy < 0)
+        vx, vy = balls.vx.item(i), balls.vy.item(i)
+        was_moving_up = (vy < 0)
 
-        ball.vx, ball.vy = reflect_ball_on_rect(ball.rect, (ball.vx, ball.vy), hit_brick.rect)
+        vx, vy = reflect_ball_on_rect(rect, (vx, vy), bricks.rect(hit_brick))
 
         # push away slightly to avoid repeated collisions
-        ball.rect.x += int(ball.vx)
-        ball.rect.y += int(ball.vy)
+        rect.x += int(vx)
+        rect.y += int(vy)
 
-        if RULES.force_ball_down_after_brick:
-            ball.vy = abs(ball.vy)
+        if self.rules.force_ball_down_after_brick:
+            vy = abs(vy)
 
-        ball.speed_cap()
+        balls.set_rect(i, rect)
+        balls.vx[i], balls.vy[i] = vx, vy
+        balls.speed_cap(i)
 
-        if ball.can_hit_brick and was_moving_up:
-            ball.can_hit_brick = False
-            self._play(self.brick_hit_sound)
+        if balls.can_hit_brick[i] and was_moving_up:
+            balls.can_hit_brick[i] = False
+            self._play(self.brick_hit_sound, priority = PRIORITY_BRICK)
             return hit_brick
 
-        return None
\ No newline at end of file
+        return None
+
+    def handle_ball_pairs(self, balls: BallSystem) -> np.ndarray:
+
+        """
+        Elastic collisions between balls, as equal-mass circles as wide as
+        the ball. Candidate pairs come from a sort-and-sweep over row bands
+        (spatial.sort_and_sweep), so the cost follows the number of close
+        pairs, not n squared. Impulses and separations of all contacts are
+        summed, so a ball in several contacts gets them all at once.
+        Returns the slots of the balls that were bumped.
+        """
+        n = len(balls)
+        self.pair_tests = self.pair_contacts = 0
+        if n < 2:
+            return np.zeros(0, dtype = np.intp)
+
+        w, h = balls.width, balls.height
+        x, y = balls.x[:n], balls.y[:n]
+
+        a, b = sort_and_sweep(x, y, w, h)
+        self.pair_tests = len(a)
+
+        # Narrow phase: circles of diameter w
+        nx = (x[b] - x[a]).astype(np.float64)
+        ny = (y[b] - y[a]).astype(np.float64)
+        dist = np.hypot(nx, ny)
+        touching = dist < w
+
+        # Coincident centres: separate along x
+        same = touching & (dist == 0)
+        nx[same], dist[same] = 1.0, 1.0
+        nx /= np.maximum(dist, 1e-9)
+        ny /= np.maximum(dist, 1e-9)
+
+        if not touching.any():
+            return np.zeros(0, dtype = np.intp)
+
+        a, b, nx, ny = a[touching], b[touching], nx[touching], ny[touching]
+        push = (w - dist[touching]) / 2
+        self.pair_contacts = len(a)
+
+        # Only pairs moving toward each other exchange their normal velocity;
+        # every overlapping pair is pushed apart, half the overlap each
+        closing = (balls.vx[b] - balls.vx[a]) * nx + (balls.vy[b] - balls.vy[a]) * ny
+        np.minimum(closing, 0.0, out = closing)
+
+        kx, ky = closing * nx, closing * ny
+        px, py = push * nx, push * ny
+        dvx = np.bincount(a, kx, n) - np.bincount(b, kx, n)
+        dvy = np.bincount(a, ky, n) - np.bincount(b, ky, n)
+        sx = np.bincount(b, px, n) - np.bincount(a, px, n)
+        sy = np.bincount(b, py, n) - np.bincount(a, py, n)
+
+        bumped = np.union1d(a, b)
+        balls.vx[bumped] += dvx[bumped]
+        balls.vy[bumped] += dvy[bumped]
+        # Whole pixels, rounded away from zero so that pairs really come apart
+        balls.x[bumped] += np.copysign(np.ceil(np.abs(sx[bumped])), sx[bumped]).astype(np.int32)
+        balls.y[bumped] += np.copysign(np.ceil(np.abs(sy[bumped])), sy[bumped]).astype(np.int32)
+        balls.speed_cap(bumped)
+
+        self._play(self.bounce_sound, int(np.count_nonzero(closing)))
+        return bumped
+
+    # ---------- Continuous collision (swept AABB) ----------
+    def sweep(self, balls: BallSystem, bat: Bat, bricks: BrickField, on_brick) -> list[int]:
+
+        """
+        Continuous collision for every ball, after BallSystem.update moved
+        it by its whole-pixel step: the step is traced again from where it
+        started, contact by contact (earliest time of impact against the
+        walls, the bat and alive bricks), so no step is long enough to
+        pass through anything. on_brick(i) is called for each counted hit.
+        Returns the slots of lost balls.
+        """
+        n = len(balls)
+        if not n:
+            return []
+
+        w, h = balls.width, balls.height
+        dx = np.trunc(balls.vx[:n]).astype(np.int32)
+        dy = np.trunc(balls.vy[:n]).astype(np.int32)
+        x1, y1 = balls.x[:n], balls.y[:n]
+        x0, y0 = x1 - dx, y1 - dy
+
+        # Broad phase: only balls whose swept box reaches a wall, the floor,
+        # the bat or a cell with an alive brick need tracing
+        left, top = np.minimum(x0, x1), np.minimum(y0, y1)
+        right, bottom = np.maximum(x0, x1) + w, np.maximum(y0, y1) + h
+        rect = bat.rect
+        busy = ((left <= 0) | (right >= SCREEN.width) | (top <= 0) | (bottom > SCREEN.height)
+                | ((left <= rect.right) & (right >= rect.left) & (top <= rect.bottom) & (bottom >= rect.top)))
+        if bricks.alive_count:
+            busy |= bricks.may_hit(left, top, right, bottom)
+
+        idx = np.flatnonzero(busy)
+        if len(idx) > 1:
+            idx = idx[np.argsort(balls.serial[idx], kind = "stable")]
+
+        lost = []
+        for i in idx.tolist():
+            self._trace(balls, i, x0.item(i), y0.item(i), bat, bricks, on_brick)
+            if balls.y.item(i) > SCREEN.height:
+                lost.append(i)
+
+        return lost
+
+    def _trace(self, balls: BallSystem, i: int, x: float, y: float, bat: Bat, bricks: BrickField, on_brick) -> None:
+
+        """
+        Move ball i from (x, y) through this tick's step, contact by contact.
+        """
+        w, h = balls.width, balls.height
+        remaining = 1.0     # fraction of the step still to travel
+
+        # Already inside something (the bat moved into it, or a power brick
+        # spawned it next to another): push out as the per-tick engine does
+        rect = balls.rect(i)
+        rect.topleft = (x, y)
+        if rect.colliderect(bat.rect) and balls.vy.item(i) > 0:
+            balls.x[i] = x
+            self._bat_response(balls, bat, [i])
+            rect.y = balls.y.item(i)
+
+        hit_brick = bricks.first_hit(rect)
+        if hit_brick is not None:
+            vx, vy = balls.vx.item(i), balls.vy.item(i)
+            new_vx, new_vy = reflect_ball_on_rect(rect, (vx, vy), bricks.rect(hit_brick))
+            self._brick_response(balls, i, new_vx, new_vy, vy < 0, hit_brick, on_brick)
+        x, y = rect.topleft
+
+        for _ in range(self.max_contacts):
+            vx, vy = balls.vx.item(i), balls.vy.item(i)
+            dx, dy = math.trunc(vx) * remaining, math.trunc(vy) * remaining
+            if not dx and not dy:
+                break
+
+            t, side = wall_contact(x, y, w, dx, dy, SCREEN.width)
+            what = side
+
+            # The bat only bounces balls moving down
+            if vy > 0:
+                r = bat.rect
+                bt, bx_first = sweep_boxes(x, y, w, h, dx, dy, np.array(r.x), np.array(r.y), r.width, r.height)
+                if bt < t:
+                    t, what, x_face = bt.item(), "bat", bool(bx_first)
+
+            if bricks.alive_count:
+                bt, brick, bx_first = self._first_brick(bricks, x, y, w, h, dx, dy)
+                if bt < t:
+                    t, what, x_face = bt, brick, bx_first
+
+            if what is None:
+                x, y, remaining = x + dx, y + dy, 0.0
+                break
+
+            x, y = x + dx * t, y + dy * t
+            remaining *= 1.0 - t
+
+            if what == "left":
+                balls.vx[i] = abs(vx)
+                self._play(self.bounce_sound)
+            elif what == "right":
+                balls.vx[i] = -abs(vx)
+                self._play(self.bounce_sound)
+            elif what == "top":
+                balls.vy[i] = abs(vy)
+                self._play(self.bounce_sound)
+            elif what == "bat":
+                if x_face:
+                    balls.vx[i] = -abs(vx) if dx > 0 else abs(vx)
+                    self._play(self.bounce_sound)
+                else:
+                    balls.x[i] = round(x)
+                    self._bat_response(balls, bat, [i])
+                    y = balls.y.item(i)
+            else:
+                new_vx, new_vy = vx, vy
+                if x_face:
+                    new_vx = -abs(vx) if dx > 0 else abs(vx)
+                else:
+                    new_vy = -abs(vy) if dy > 0 else abs(vy)
+                self._brick_response(balls, i, new_vx, new_vy, vy < 0, what, on_brick)
+        else:
+            # Still moving after max_contacts (wedged in a corner): fall back
+            # to discrete substeps no longer than half the ball
+            x, y = self._substep(balls, i, x, y, remaining, bricks, on_brick)
+
+        balls.x[i], balls.y[i] = round(x), round(y)
+
+    @staticmethod
+
+    def _first_brick(bricks: BrickField, x: float, y: float, w: int, h: int,
+                     dx: float, dy: float) -> tuple[float, int | None, bool]:
+
+        """
+        Earliest alive brick entered during the move: (time, index, x face).
+        Ties go to the first brick in layout order.
+        """
+        left, top = math.floor(min(x, x + dx)), math.floor(min(y, y + dy))
+        right, bottom = math.ceil(max(x, x + dx)) + w, math.ceil(max(y, y + dy)) + h
+
+        candidates = bricks.candidates(left, top, right, bottom)
+        if not candidates:
+            return INF, None, False
+
+        idx = np.asarray(candidates, dtype = np.intp)
+        idx = idx[bricks.alive[idx]]
+        if not len(idx):
+            return INF, None, False
+
+        t, x_face = sweep_boxes(x, y, w, h, dx, dy, bricks.x[idx], bricks.y[idx], bricks.w[idx], bricks.h[idx])
+        first = int(np.argmin(t))
+        return t.item(first), idx.item(first), bool(x_face[first])
+
+    def _bat_response(self, balls: BallSystem, bat: Bat, idx) -> None:
+
+        """
+        Land the selected balls on top of the bat, steered by where they hit it.
+        """
+        balls.y[idx] = bat.rect.top - balls.height
+
+        centerx = balls.x[idx] + balls.width // 2
+        offset = (centerx - bat.rect.centerx) / (bat.rect.width / 2)
+        balls.vx[idx] = np.clip(balls.vx[idx] + offset * 3.5, -self.ball_config.max_speed, self.ball_config.max_speed)
+        balls.vy[idx] = -np.abs(balls.vy[idx])
+
+        balls.speed_cap(idx)
+        balls.can_hit_brick[idx] = True
+        self._play(self.bounce_sound, len(idx))
+
+    def _brick_response(self, balls: BallSystem, i: int, vx: float, vy: float, was_moving_up: bool,
+                        hit_brick: int, on_brick) -> None:
+
+        """
+        Rules after ball i bounced off a brick with new velocity (vx, vy),
+        as in handle_bricks; on_brick(hit_brick) if the hit counts.
+        """
+        if self.rules.force_ball_down_after_brick:
+            vy = abs(vy)
+
+        balls.vx[i], balls.vy[i] = vx, vy
+        balls.speed_cap(i)
+
+        if balls.can_hit_brick[i] and was_moving_up:
+            balls.can_hit_brick[i] = False
+            self._play(self.brick_hit_sound, priority = PRIORITY_BRICK)
+            on_brick(hit_brick)
+
+    def _substep(self, balls: BallSystem, i: int, x: float, y: float, remaining: float,
+                 bricks: BrickField, on_brick) -> tuple[float, float]:
+
+        """
+        Fallback: travel the rest of the step in discrete substeps short
+        enough that nothing is skipped, resolving overlaps after each.
+        """
+        self.substepped += 1
+        w, h = balls.width, balls.height
+        reach = max(abs(balls.vx.item(i)), abs(balls.vy.item(i))) * remaining
+        steps = max(1, math.ceil(reach / max(1, min(w, h) // 2)))
+        rect = balls.rect(i)
+
+        for _ in range(steps):
+            vx, vy = balls.vx.item(i), balls.vy.item(i)
+            x += math.trunc(vx) * remaining / steps
+            y += math.trunc(vy) * remaining / steps
+
+            if x <= 0 or x + w >= SCREEN.width:
+                x = min(max(x, 0), SCREEN.width - w)
+                balls.vx[i] = abs(vx) if x <= 0 else -abs(vx)
+            if y <= 0:
+                y = 0
+                balls.vy[i] = abs(vy)
+
+            rect.topleft = (round(x), round(y))
+            hit_brick = bricks.first_hit(rect)
+            if hit_brick is not None:
+                vx, vy = balls.vx.item(i), balls.vy.item(i)
+                new_vx, new_vy = reflect_ball_on_rect(rect, (vx, vy), bricks.rect(hit_brick))
+                self._brick_response(balls, i, new_vx, new_vy, vy < 0, hit_brick, on_brick)
+                x, y = rect.topleft
+
+        return x, y
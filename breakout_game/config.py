@@ -7,10 +7,32 @@ class ScreenConfig:
 
     width: int = 900
     height: int = 900
-    fps: int = 120
+    fps: int = 120                 # render rate cap (see TimestepConfig for the simulation)
     caption: str = "Breakout game"
 
 
+@dataclass(frozen = True)
+
+class TimestepConfig:
+
+    tick_rate: int = 120            # simulation ticks per second, whatever the render fps
+    max_steps_per_frame: int = 8    # catch-up cap; time beyond it is dropped
+    interpolate: bool = True        # draw bat and balls between the last two ticks
+
+
+@dataclass(frozen = True)
+
+class QualityConfig:
+
+    window: int = 60                # frames averaged per decision
+    cooldown: int = 120             # frames after a change before the next one
+    down_at: float = 0.9            # step down above this share of the frame budget
+    up_at: float = 0.5              # step up below it (budget of the higher level)
+    probation: int = 600            # a step down this soon after a step up ...
+    max_up_wait: int = 4800         # ... doubles the wait before stepping up, up to this
+    low_fps: int = 60               # target fps of the last quality step
+
+
 @dataclass(frozen = True)
 
 class BatConfig:
@@ -44,6 +66,35 @@ class BrickConfig:
     power_chance: float = 0.10
 
 
+@dataclass(frozen = True)
+
+class EndlessConfig:
+
+    chunk_rows: int = 8             # rows generated per chunk
+    scroll_speed: float = 0.1       # pixels per frame
+    prefetch_chunks: int = 2        # generated ahead of the viewport
+    hard_chance: float = 0.2        # first chunk; grows by hard_chance_step per chunk
+    hard_chance_step: float = 0.05
+    hard_chance_max: float = 0.6
+
+
+@dataclass(frozen = True)
+
+class ParticleConfig:
+
+    capacity: int = 20_000          # live particles at most; the oldest are recycled first
+    size: int = 2                   # pixels per side
+    gravity: float = 0.12           # pixels per tick, per tick
+    debris_per_brick: int = 40
+    debris_speed: float = 3.0       # pixels per tick, at most
+    debris_life: float = 45.0       # ticks, +-50%
+    trail_per_tick: int = 1         # per ball; 0 turns trails off
+    trail_budget: int = 1_000       # trail particles per tick at most; more balls take turns
+    trail_speed: float = 0.4
+    trail_life: float = 18.0
+    trail_color: tuple[int, int, int] = (255, 120, 190)
+
+
 @dataclass(frozen = True)
 
 class AssetsConfig:
@@ -53,6 +104,7 @@ class AssetsConfig:
     brick_hit_sfx: str = "breakout_game/assets/sounds/bullet.mp3"
     bounce_sfx: str = "breakout_game/assets/sounds/hit.mp3"
     music_file: str = "breakout_game/assets/sounds/music.mp3"
+    bundle_file: str = "breakout_game/assets/assets.bundle"     # python -m breakout_game.bundle
 
 
 @dataclass(frozen = True)
@@ -61,6 +113,9 @@ class AudioConfig:
 
     bounce_volume: float = 0.2
     music_volume: float = 0.1
+    sfx_channels: int = 8           # reserved mixer channels for the SoundBus
+    sfx_per_frame: int = 4          # plays started per frame, at most
+    sfx_gain: float = 0.6           # coalesced plays: volume gain * sqrt(count), capped at 1.0
 
 
 @dataclass(frozen = True)
@@ -69,12 +124,17 @@ class RulesConfig:
 
     start_lives: int = 5
     force_ball_down_after_brick: bool = True
+    ball_collisions: bool = False   # balls bounce off each other (elastic, equal mass)
 
 
 SCREEN = ScreenConfig()
+TIMESTEP = TimestepConfig()
+QUALITY = QualityConfig()
 BAT = BatConfig()
 BALL = BallConfig()
 BRICKS = BrickConfig()
 ASSETS = AssetsConfig()
 AUDIO = AudioConfig()
-RULES = RulesConfig()
\ No newline at end of file
+RULES = RulesConfig()
+PARTICLES = ParticleConfig()
+ENDLESS = EndlessConfig()
\ No newline at end of file
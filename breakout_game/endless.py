@@ -0,0 +1,185 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .config import SCREEN, BRICKS, ENDLESS, BrickConfig, EndlessConfig
+from .objects.bricks import BrickField, grid_cell, KIND_SOFT, KIND_HARD, KIND_POWER
+
+
+class EndlessWall:
+
+    """
+    Endless mode: a staggered wall, generated without end, that scrolls down.
+
+    Rows come in chunks of `chunk_rows`, generated on a worker thread a few
+    chunks ahead of the viewport. Game's BrickField only ever holds the
+    chunks overlapping the screen (plus the next one entering it), so
+    collision, drawing and memory cost stay flat however long the run lasts.
+    Scrolling moves the field with BrickField.shift(); the field is rebuilt
+    only when a chunk enters or leaves.
+
+    Chunk contents depend only on (seed, chunk index), and a chunk enters
+    at a fixed scroll position (waiting for the worker if it lags), so
+    replays and headless runs stay deterministic.
+    """
+    def __init__(self, seed: int, bricks: BrickConfig = BRICKS, config: EndlessConfig = ENDLESS):
+
+        self.seed = seed
+        self.bricks = bricks
+        self.config = config
+
+        self.pitch = bricks.height + bricks.gap
+        self.cell = grid_cell(bricks.width, bricks.height, bricks.gap, 0)
+        self.chunk_height = config.chunk_rows * self.pitch
+
+        grid_width = bricks.cols * bricks.width + (bricks.cols - 1) * bricks.gap
+        self.left = (SCREEN.width - grid_width) // 2
+
+        self._worker = ThreadPoolExecutor(max_workers = 1, thread_name_prefix = "chunks")
+        self._pending = {}          # chunk index -> Future of its arrays
+        self.chunks = []            # (chunk index, brick count) in field order, lowest chunk first
+        self.scroll = 0             # total pixels scrolled
+        self._carry = 0.0
+        self.generated = 0
+
+    # ---------- Generation ----------
+    def _generate(self, k: int) -> tuple:
+
+        """
+        Arrays of chunk k. Its row 0 sits at y = 0; rows go up (negative y).
+        Same rules as Game.bricks_layout, with hard bricks getting more common.
+        """
+        cfg = self.bricks
+        rng = np.random.default_rng([self.seed, k])
+        rows = self.config.chunk_rows
+
+        row = np.repeat(np.arange(rows), cfg.cols)
+        col = np.tile(np.arange(cfg.cols), rows)
+        global_row = k * rows + row
+
+        x = self.left + (global_row % 2) * (cfg.width // 2) + col * (cfg.width + cfg.gap)
+        y = -row * self.pitch
+
+        keep = x + cfg.width <= SCREEN.width - cfg.side_margin
+        x, y, n = x[keep], y[keep], int(keep.sum())
+
+        hard_chance = min(self.config.hard_chance_max, self.config.hard_chance + k * self.config.hard_chance_step)
+        roll = rng.random(n)
+        kind = np.where(roll < hard_chance, KIND_HARD, KIND_SOFT).astype(np.int8)
+        kind[rng.random(n) < cfg.power_chance] = KIND_POWER
+
+        hits = np.select([kind == KIND_HARD, kind == KIND_POWER], [3, 3], 2).astype(np.int16)
+        points = np.select([kind == KIND_HARD, kind == KIND_POWER], [120, 150], 60).astype(np.int32)
+        return x, y, np.full(n, cfg.width), np.full(n, cfg.height), hits, points, kind
+
+    def _request(self, k: int) -> None:
+        if k not in self._pending:
+            self._pending[k] = self._worker.submit(self._generate, k)
+
+    def _take(self, k: int) -> tuple:
+
+        self._request(k)
+        arrays = self._pending.pop(k).result()
+        self.generated += 1
+
+        last = k + self.config.prefetch_chunks
+        for ahead in range(k + 1, last + 1):
+            self._request(ahead)
+        return arrays
+
+    # ---------- Chunk placement ----------
+    def _chunk_y(self, k: int) -> int:
+
+        """
+        Screen y of chunk k's row 0 at the current scroll.
+        """
+        # Starts like the fixed wall: `rows` rows on screen below top_margin
+        cfg = self.bricks
+        return cfg.top_margin + (cfg.rows - 1) * self.pitch - k * self.chunk_height + self.scroll
+
+    def _wanted(self) -> range:
+
+        """
+        Chunks overlapping the screen, or starting to enter it from above.
+        """
+        y0 = self._chunk_y(0)
+        span = (self.config.chunk_rows - 1) * self.pitch
+
+        # Top edge above the screen bottom, bottom edge below one row above the screen
+        first = max(0, (y0 - span - SCREEN.height) // self.chunk_height + 1)
+        last = -(-(y0 + self.bricks.height + self.pitch) // self.chunk_height) - 1
+        return range(first, last + 1)
+
+    def start(self) -> BrickField:
+
+        """
+        Reset the wall; returns the first BrickField.
+        """
+        self._pending.clear()
+        self.chunks = []
+        self.scroll = 0
+        self._carry = 0.0
+        return self._rebuild(BrickField(0))
+
+    def _rebuild(self, old: BrickField) -> BrickField:
+
+        wanted = self._wanted()
+        parts = []
+        kept = []
+        offset = 0
+
+        # Kept chunks carry over their hits and alive flags
+        for k, n in self.chunks:
+            if k in wanted:
+                parts.append((old.x[offset:offset + n], old.y[offset:offset + n], old.w[offset:offset + n],
+                              old.h[offset:offset + n], old.hits_left[offset:offset + n],
+                              old.points[offset:offset + n], old.kind[offset:offset + n],
+                              old.alive[offset:offset + n]))
+                kept.append((k, n))
+            offset += n
+
+        have = {k for k, _ in kept}
+        for k in wanted:
+            if k not in have:
+                x, y, w, h, hits, points, kind = self._take(k)
+                parts.append((x, y + self._chunk_y(k), w, h, hits, points, kind, np.ones(len(x), dtype = bool)))
+                kept.append((k, len(x)))
+
+        self.chunks = kept
+        *columns, alive = [np.concatenate(c) for c in zip(*parts)]
+        field = BrickField.from_arrays(*columns, cell = self.cell)
+        field.alive[:field.count] = alive
+        field.alive_count = int(alive.sum())
+        return field
+
+    # ---------- Per frame ----------
+    def advance(self, bricks: BrickField) -> BrickField:
+
+        """
+        Scroll one frame. Returns bricks, or a new BrickField when a chunk
+        entered or left the viewport.
+        """
+        self._carry += self.config.scroll_speed
+        dy = int(self._carry)
+        if not dy:
+            return bricks
+
+        self._carry -= dy
+        self.scroll += dy
+        bricks.shift(dy)
+
+        if [k for k, _ in self.chunks] != list(self._wanted()):
+            return self._rebuild(bricks)
+        return bricks
+
+    def reached(self, bricks: BrickField, line: int) -> bool:
+
+        """
+        True once an alive brick's bottom crosses line (the bat).
+        """
+        n = bricks.count
+        alive = bricks.alive[:n]
+        return bool(alive.any() and (bricks.y[:n][alive] + bricks.h[:n][alive]).max() >= line)
+
+    def close(self) -> None:
+        self._worker.shutdown(wait = True, cancel_futures = True)
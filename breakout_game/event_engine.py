@@ -0,0 +1,201 @@
+import heapq
+
+import numpy as np
+
+from .config import SCREEN
+
+
+NEVER = 1 << 40     # "no contact": further than any horizon
+
+
+def _first_le(a: int, d: int) -> int:
+
+    """
+    First tick k >= 1 with a + k * d <= 0 (NEVER if none).
+    """
+    if a + d <= 0:
+        return 1
+    if d >= 0:
+        return NEVER
+    return -(-a // -d)
+
+
+def _first_within(p: int, d: int, lo: int, hi: int) -> int:
+
+    """
+    First tick k >= 1 with lo <= p + k * d <= hi (NEVER if none).
+    """
+    if d == 0:
+        return 1 if lo <= p <= hi else NEVER
+    if d < 0:
+        p, d, lo, hi = -p, -d, -hi, -lo
+
+    k = max(1, -((p - lo) // d))
+    return k if p + k * d <= hi else NEVER
+
+
+def _intervals(p: int, d: int, lo: np.ndarray, hi: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+
+    """
+    Per bound pair, the ticks k (as [first, last]) with lo <= p + k * d <= hi.
+    """
+    if d == 0:
+        inside = (lo <= p) & (p <= hi)
+        return np.where(inside, 1, NEVER), np.where(inside, NEVER, 0)
+    if d < 0:
+        p, d, lo, hi = -p, -d, -hi, -lo
+    return -((p - lo) // d), (hi - p) // d
+
+
+class EventEngine:
+
+    """
+    Event-driven scheduling for CollisionSystem: Game asks due() every
+    tick and runs the collision pass only when some ball can touch
+    something, instead of on every tick.
+
+    Between contacts a ball moves by the same whole-pixel step every tick,
+    so the first tick it reaches a wall, the floor, an alive brick or the
+    bat's row can be solved for exactly (analytic time of impact, in
+    ticks). Each ball's next event sits in a priority queue keyed by its
+    launch serial. A ball inside the bat's row is due every tick, since
+    the bat moves; everywhere else the bat cannot reach it.
+
+    When a tick is due the usual collision pass runs over every ball, so
+    bounces (reflect_ball_on_rect included) are exactly those of the
+    per-tick engine: a ball that is not due provably touches nothing.
+    Predictions are conservative, so one only needs redoing once its
+    tick has come (a destroyed brick can only delay a contact), for new
+    balls, or when the wall itself moves (endless mode) or is replaced.
+    """
+    def __init__(self, horizon: int = 4096):
+
+        self.horizon = horizon
+        self.tick = 0
+        self.resolved = 0       # ticks that ran the collision pass
+        self.skipped = 0
+        self.predictions = 0
+
+        self._events: dict[int, int] = {}       # ball serial -> tick of its next possible contact
+        self._queue: list[tuple[int, int]] = []     # (tick, serial); entries not in _events are stale
+        self._spawned = -1      # BallSystem.spawned when last scheduled
+        self._field = None      # (BrickField, y of its first brick) the predictions hold for
+
+    @staticmethod
+
+    def _field_key(bricks) -> tuple:
+        return bricks, (bricks.y.item(0) if bricks.count else 0), bricks.moves
+
+    def due(self, game) -> bool:
+
+        """
+        Start a tick (balls have moved): True if the collision pass must run.
+        """
+        self.tick += 1
+        queue = self._queue
+
+        # Drop entries superseded by a later prediction
+        while queue and self._events.get(queue[0][1]) != queue[0][0]:
+            heapq.heappop(queue)
+
+        due = (game.balls.spawned != self._spawned or self._field_key(game.bricks) != self._field
+               or bool(queue) and queue[0][0] <= self.tick)
+
+        if due:
+            self.resolved += 1
+        else:
+            self.skipped += 1
+        return due
+
+    def schedule(self, game) -> None:
+
+        """
+        After a collision pass: predict again for every ball whose event has
+        come (every ball, if the wall moved or was replaced).
+        """
+        balls, bricks = game.balls, game.bricks
+        key = self._field_key(bricks)
+        fresh = key != self._field
+        self._field = key
+        self._spawned = balls.spawned
+
+        events = {}
+        for i in range(len(balls)):
+            serial = balls.serial.item(i)
+            tick = None if fresh else self._events.get(serial)
+
+            if tick is None or tick <= self.tick:
+                tick = self.tick + self.predict(balls, i, bricks, game.bat.rect)
+                heapq.heappush(self._queue, (tick, serial))
+                self.predictions += 1
+            events[serial] = tick
+
+        self._events = events
+        if len(self._queue) > 4 * len(events) + 64:
+            self._queue = [(tick, serial) for serial, tick in events.items()]
+            heapq.heapify(self._queue)
+
+    def forget(self, serials) -> None:
+
+        """
+        Drop the predictions of balls whose motion changed outside the
+        collision pass (ball-ball bounces); schedule() predicts them again.
+        """
+        for serial in serials:
+            self._events.pop(serial, None)
+
+    # ---------- Time of impact ----------
+    def predict(self, balls, i: int, bricks, bat) -> int:
+
+        """
+        Ticks from now until ball i may next touch something (>= 1).
+        """
+        x, y = balls.x.item(i), balls.y.item(i)
+        # Same step as BallSystem.update: truncate toward zero
+        dx, dy = int(balls.vx.item(i)), int(balls.vy.item(i))
+        w, h = balls.width, balls.height
+
+        # Same tests as CollisionSystem.handle_walls_and_bottom
+        k = min(
+            self.horizon,
+            _first_le(x, dx),
+            _first_le(SCREEN.width - w - x, -dx),
+            _first_le(y, dy),
+            _first_le(SCREEN.height + 1 - y, -dy),
+        )
+
+        # The bat's row (handle_bat only bounces balls moving down)
+        if balls.vy.item(i) > 0:
+            k = min(k, _first_within(y, dy, bat.top - h + 1, bat.bottom - 1))
+
+        return min(k, self._first_brick(x, y, dx, dy, w, h, bricks, k))
+
+    @staticmethod
+
+    def _first_brick(x: int, y: int, dx: int, dy: int, w: int, h: int, bricks, limit: int) -> int:
+
+        """
+        First tick (below limit) at which the ball overlaps an alive brick,
+        with the strict overlap test of BrickField.first_hit.
+        """
+        if not bricks.alive_count:
+            return limit
+
+        # Bricks under the path swept until limit
+        x1, y1 = x + dx * limit, y + dy * limit
+        candidates = bricks.candidates(min(x, x1), min(y, y1), max(x, x1) + w, max(y, y1) + h)
+        if not candidates:
+            return limit
+
+        idx = np.asarray(candidates, dtype = np.intp)
+        idx = idx[bricks.alive[idx]]
+        if not len(idx):
+            return limit
+
+        bx, by = bricks.x[idx].astype(np.int64), bricks.y[idx].astype(np.int64)
+        kx0, kx1 = _intervals(x, dx, bx - w + 1, bx + bricks.w[idx] - 1)
+        ky0, ky1 = _intervals(y, dy, by - h + 1, by + bricks.h[idx] - 1)
+
+        first = np.maximum(np.maximum(kx0, ky0), 1)
+        hit = first <= np.minimum(kx1, ky1)
+        return int(first[hit].min()) if hit.any() else limit
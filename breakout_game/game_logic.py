@@ -1,142 +1,347 @@
+import io
 import os
 import random
+import time
+import numpy as np
 import pygame
 
-from .config import SCREEN, BALL, BRICKS, ASSETS, AUDIO, RULES
+from .config import SCREEN, BALL, BRICKS, ASSETS, AUDIO, RULES, TIMESTEP, BallConfig, BrickConfig, RulesConfig
 from .resources import Resources
 from .state import GameState
+from .inputs import KeyState, INPUT_RESTART, mask_from_keys
 from .scoring import Scoring
-from .collision import CollisionSystem
-
-from .objects.ball import Ball
-from .objects.bricks import Brick
+from .collision import CollisionSystem, SCALAR_BALLS
+from .audio import SoundBus
+from .render import DirtyRectRenderer
+from .text import TextCache
+from .perf import FrameStats, NullFrameStats, PerfOverlay
+from .startup import StartupTrace
+from .levels import load_level
+from .endless import EndlessWall
+from .timestep import FixedTimestep
+from .quality import QualityGovernor, QUALITY_STEPS
+from .event_engine import EventEngine
+
+from .objects.ball import BallSystem
+from .objects.bricks import BrickField, grid_cell, KIND_SOFT, KIND_HARD, KIND_POWER
 from .objects.bat import Bat
+from .objects.particles import ParticleSystem
 
 
-class Game:
+# Collision scheduling: a pass every tick, or only on predicted contacts (event_engine.py);
+# or continuous collision, tracing each step contact by contact (CollisionSystem.sweep)
+PHYSICS_MODES = ("step", "events", "swept")
 
-    def __init__(self):
 
-        pygame.init()
-        pygame.display.set_caption(SCREEN.caption)
+class Game:
 
-        self.clock = pygame.time.Clock()
-        self.screen = pygame.display.set_mode((SCREEN.width, SCREEN.height))
+    def __init__(self, headless: bool = False, seed: int | None = None,
+                 perf: bool = False, perf_out: str | None = None,
+                 rules: RulesConfig = RULES, ball_config: BallConfig = BALL,
+                 brick_config: BrickConfig = BRICKS, fast_start: bool = False,
+                 level: str | None = None, endless: bool = False, fps: int | None = None,
+                 adaptive_quality: bool = False, physics: str = "step"):
+
+        """
+        headless: no window, audio, fonts or frame limiter; drive it with step().
+        seed: seeds the game's own RNG (ball directions, power bricks); random if None.
+        perf: time every frame (F3 toggles the overlay); perf_out: dump file
+        (.csv or .json) written when run() exits.
+        rules, ball_config, brick_config: override the config.py defaults
+        (batch.py sweeps them).
+        fast_start: bring up only the display before the first frame; fonts,
+        mixer and music follow one step per frame (see self.startup for timings)
+        and assets load on a background thread behind placeholders.
+        level: a level file (see levels.py) instead of the random staggered layout.
+        endless: an endless, scrolling wall instead (see endless.py).
+        fps: render rate cap (SCREEN.fps if None). The simulation always
+        ticks at TIMESTEP.tick_rate, so gameplay does not depend on it.
+        adaptive_quality: lower (and restore) drawing quality to hold the
+        frame budget (see quality.py). Windowed only.
+        physics: one of PHYSICS_MODES; "events" runs the collision pass only
+        on ticks a ball can touch something, with identical results.
+        "swept" finds each contact's exact time of impact instead, so balls
+        far faster than a brick is thick still bounce (different results).
+        """
+        self.startup = StartupTrace()
+        self.headless = headless
+        self.rules = rules
+        self.ball_config = ball_config
+        self.brick_config = brick_config
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(63)
+        self.rng = random.Random(self.seed)
+
+        self.perf = FrameStats(fps = fps or SCREEN.fps) if perf else NullFrameStats()
+        self.perf_out = perf_out
+        self.perf_overlay = None
+        self.recorder = None        # replay.Recorder, fed by run()
 
         # Composition: Game "has" these helper objects
-        self.res = Resources()
+        with self.startup.step("resources"):
+            self.res = Resources()
         self.scoring = Scoring(score = 0)
 
-        # Audio init (safe)
-        try:
-            pygame.mixer.init()
-        except pygame.error:
-            pass
-
-        self.brick_hit_sound = self.res.sound(ASSETS.brick_hit_sfx)
-        self.bounce_sound = self.res.sound(ASSETS.bounce_sfx)
-        if self.bounce_sound:
-            self.bounce_sound.set_volume(AUDIO.bounce_volume)
-
-        # Delegation: collisions handled by CollisionSystem
-        self.collision = CollisionSystem(
-            bounce_sound = self.bounce_sound,
-            brick_hit_sound = self.brick_hit_sound
-        )
-
-        # Music init (safe)
-        try:
-            if os.path.exists(ASSETS.music_file):
-                pygame.mixer.music.load(ASSETS.music_file)
-                pygame.mixer.music.set_volume(AUDIO.music_volume)
-                pygame.mixer.music.play(-1)
-        except pygame.error:
-            pass
-
-        # Load images
-        self.ball_image = self.res.image(ASSETS.ball_image_file)
-
-        if self.ball_image:
-            self.ball_size = self.ball_image.get_rect().size
+        self.clock = pygame.time.Clock()
+        self.fps = fps or SCREEN.fps
+        self.timestep = FixedTimestep()
+        self.alpha = 1.0            # draw position between the last two ticks (see FixedTimestep)
+        self.screen = None
+        self.brick_hit_sound = None
+        self.bounce_sound = None
+        self.ball_image = None
+        self.background_img = None
+        self.renderer = None
+        self.font = None
+        self.big_font = None
+        self.text = None
+        self.fast_start = fast_start
+        self.deferred_init = []     # init steps still to run, one per frame
+        self.pending_assets = {}    # name -> (Future, finish), see _load_later() and poll_assets()
+
+        # Delegation: collisions handled by CollisionSystem (sounds set by _init_audio),
+        # sound playback by SoundBus
+        self.sound_bus = SoundBus(perf = self.perf)
+        self.collision = CollisionSystem(rules = rules, ball_config = ball_config, sound_bus = self.sound_bus)
+
+        if physics not in PHYSICS_MODES:
+            raise ValueError(f"unknown physics {physics!r}, expected one of {PHYSICS_MODES}")
+        self.physics = physics
+        self.events = EventEngine() if physics == "events" else None
+
+        # Brick sources other than the random layout
+        self.level_path = level     # recordings store it (replay.game_options)
+        self.level = load_level(level) if level else None     # template, copied on restart
+        self.wall = EndlessWall(self.seed, brick_config) if endless else None
+
+        if headless:
+            # Same ball size as the windowed game, so the physics match exactly
+            self.ball_size = self.res.image_size(ASSETS.ball_image_file) or ball_config.fallback_size
         else:
-            self.ball_size = BALL.fallback_size
+            self._init_window(fast_start)
 
-        self.background_img = self.res.background(ASSETS.bg_image)
-
-        if self.background_img:
-            self.background_img = pygame.transform.scale(
-                self.background_img, (SCREEN.width, SCREEN.height)
-            )
-
-        # Fonts
-        self.font = pygame.font.SysFont(None, 32)
-        self.big_font = pygame.font.SysFont(None, 64)
+        self.quality = QualityGovernor(self.set_quality, self.fps) if adaptive_quality and not headless else None
 
         # Objects (instances) + Collections
         self.bat = Bat()
-        self.balls: list[Ball] = []
-        self.bricks: list[Brick] = self.bricks_layout()
+        self.balls = BallSystem(self.ball_size, max_speed = ball_config.max_speed)
+        self.bricks: BrickField = self.bricks_layout()
+        self.particles = None if headless else ParticleSystem(seed = self.seed)     # visual only
 
-        # Polymorphism demo list: contains different Sprite subclasses
+        # Polymorphism demo list: objects sharing the update()/draw() interface
         self.sprites = []
 
-        self.lives = RULES.start_lives
+        self.lives = self.rules.start_lives
         self.state = GameState.PLAYING
         self.running = True
+        self.pending_inputs = 0
 
         self.launch_ball(self.bat.rect.centerx, self.bat.rect.top - 20)
         self.rebuild_sprite_list()
 
+    def _init_window(self, fast_start: bool) -> None:
+
+        trace = self.startup
+
+        with trace.step("display"):
+            # Fast start skips initialising every other pygame module up front
+            if fast_start:
+                pygame.display.init()
+            else:
+                pygame.init()
+            pygame.display.set_caption(SCREEN.caption)
+            self.screen = pygame.display.set_mode((SCREEN.width, SCREEN.height))
+
+        with trace.step("images"):
+            if fast_start:
+                # Placeholders (magenta ellipse, flat fill) until the loader
+                # thread is done. The ball size comes from the bundle index or
+                # the PNG header (no decode) right away: physics must not
+                # depend on load timing.
+                self.ball_size = self.res.image_size(ASSETS.ball_image_file) or self.ball_config.fallback_size
+                self._load_later("ball_image", self.res.image, ASSETS.ball_image_file)
+                self._load_later("background_img", self.res.scaled_background,
+                                 ASSETS.bg_image, (SCREEN.width, SCREEN.height))
+            else:
+                self.ball_image = self.res.image(ASSETS.ball_image_file)
+
+                if self.ball_image:
+                    self.ball_size = self.ball_image.get_rect().size
+                else:
+                    self.ball_size = self.ball_config.fallback_size
+
+                self.background_img = self.res.scaled_background(ASSETS.bg_image, (SCREEN.width, SCREEN.height))
+
+            self.renderer = DirtyRectRenderer(self.screen, self.background_img, scrolling = self.wall is not None)
+
+        steps = [self._init_fonts, self._init_audio, self._init_music]
+        if fast_start:
+            self.deferred_init = steps
+        else:
+            for init_step in steps:
+                init_step()
+
+    def _init_fonts(self) -> None:
+
+        with self.startup.step("fonts"):
+            pygame.font.init()
+            # The default font: SysFont(None, n) would scan every system font first
+            self.font = pygame.font.Font(None, 32)
+            self.big_font = pygame.font.Font(None, 64)
+            self.text = TextCache()
+
+            if self.perf.enabled:
+                self.perf_overlay = PerfOverlay(self.perf, pygame.font.Font(None, 22))
+
+    def _init_audio(self) -> None:
+
+        with self.startup.step("mixer"):
+            # Audio init (safe)
+            try:
+                pygame.mixer.init()
+            except pygame.error:
+                pass
+
+        with self.startup.step("sounds"):
+            if self.fast_start:
+                # Only the file reads go to the loader thread: SDL audio is
+                # driven from the main thread (poll_assets builds the sounds)
+                for name, path in (("brick_hit_sound", ASSETS.brick_hit_sfx), ("bounce_sound", ASSETS.bounce_sfx)):
+                    self._load_later(name, self.res.read, path,
+                                     finish = lambda data, name = name, path = path:
+                                     setattr(self, name, self.res.sound(path, data)))
+            else:
+                self.brick_hit_sound = self.res.sound(ASSETS.brick_hit_sfx)
+                self.bounce_sound = self.res.sound(ASSETS.bounce_sfx)
+                self._use_sounds()
+
+    def _use_sounds(self) -> None:
+
+        if self.bounce_sound:
+            self.bounce_sound.set_volume(AUDIO.bounce_volume)
+
+        self.collision.bounce_sound = self.bounce_sound
+        self.collision.brick_hit_sound = self.brick_hit_sound
+
+    def _init_music(self) -> None:
+
+        with self.startup.step("music"):
+            if self.fast_start:
+                self._load_later("music", self.res.read, ASSETS.music_file, finish = self._start_music)
+            else:
+                self._start_music()
+
+    def _start_music(self, data: bytes | None = None) -> None:
+
+        """
+        data: the music file's bytes when read ahead on the loader thread.
+        """
+        # Music init (safe)
+        try:
+            if data is not None or os.path.exists(ASSETS.music_file):
+                source = io.BytesIO(data) if data is not None else ASSETS.music_file
+                pygame.mixer.music.load(source, os.path.splitext(ASSETS.music_file)[1][1:])
+                pygame.mixer.music.set_volume(AUDIO.music_volume)
+                pygame.mixer.music.play(-1)
+        except pygame.error:
+            pass
+
+    def _load_later(self, name: str, fn, *args, finish = None) -> None:
+
+        """
+        Run fn(*args) on the loader thread; poll_assets() then hands the
+        result to finish on the main thread (default: set attribute `name`).
+        """
+        if finish is None:
+            finish = lambda value: setattr(self, name, value)
+        self.pending_assets[name] = (self.res.submit(fn, *args), finish)
+
+    def poll_assets(self) -> None:
+
+        """
+        Finish the loads the loader thread is done with (never waits).
+        """
+        done = [name for name, (future, _) in self.pending_assets.items() if future.done()]
+
+        for name in done:
+            future, finish = self.pending_assets.pop(name)
+            finish(future.result())
+
+        if "background_img" in done:
+            self.renderer.background = self.background_img
+        if "background_img" in done or "ball_image" in done:
+            self.renderer.invalidate()
+        if "bounce_sound" in done or "brick_hit_sound" in done:
+            self._use_sounds()
+
+        # Once, when the last load is in: deferred init may still submit more
+        if done and not self.pending_assets and not self.deferred_init:
+            self.startup.mark("assets")
+
+    def set_quality(self, level: int) -> None:
+
+        """
+        Turn on the first `level` QUALITY_STEPS, the rest off.
+        """
+        steps = QUALITY_STEPS[:level]
+        self.renderer.set_quality(flat_background = "flat_background" in steps,
+                                  plain_balls = "plain_balls" in steps,
+                                  square_bricks = "square_bricks" in steps)
+        self.fps = self.quality.fps_for(level)
+
     @property
 
     def score(self) -> int:        
         return self.scoring.score
 
-    # Polymorphism setup 
+    # Polymorphism setup: persistent, refreshed in place only when an object is replaced
     def rebuild_sprite_list(self) -> None:
-        self.sprites = [self.bat] + self.bricks + self.balls
+
+        self.sprites[:] = [self.bat, self.bricks, self.balls]
+        if self.particles is not None:
+            self.sprites.append(self.particles)
 
     # ---------- Factory methods ----------
     def launch_ball(self, centerx, centery, vx = None, vy = None):
-        rect = pygame.Rect(0, 0, self.ball_size[0], self.ball_size[1])
-        rect.center = (centerx, centery)
-
         if vx is None:
-            vx = random.choice([-BALL.speed, BALL.speed])
+            vx = self.rng.choice([-self.ball_config.speed, self.ball_config.speed])
         if vy is None:
-            vy = -BALL.speed
+            vy = -self.ball_config.speed
 
-        self.balls.append(Ball(rect, (vx, vy)))
+        self.balls.spawn(centerx, centery, vx, vy)
 
-    def bricks_layout(self):
+    def bricks_layout(self) -> BrickField:
 
-        bricks_local = []
+        if self.level is not None:
+            return self.level.copy()
 
-        grid_width = BRICKS.cols * BRICKS.width + (BRICKS.cols - 1) * BRICKS.gap
+        if self.wall is not None:
+            return self.wall.start()
+
+        cfg = self.brick_config
+        bricks_local = BrickField(cfg.rows * cfg.cols, grid_cell(cfg.width, cfg.height, cfg.gap, cfg.top_margin))
+
+        grid_width = cfg.cols * cfg.width + (cfg.cols - 1) * cfg.gap
         base_start_x = (SCREEN.width - grid_width) // 2
 
-        for row in range(BRICKS.rows):
-            y = BRICKS.top_margin + row * (BRICKS.height + BRICKS.gap)
-            shift = (row % 2) * (BRICKS.width // 2)
+        for row in range(cfg.rows):
+            y = cfg.top_margin + row * (cfg.height + cfg.gap)
+            shift = (row % 2) * (cfg.width // 2)
 
-            for col in range(BRICKS.cols):                
-                x = base_start_x + shift + col * (BRICKS.width + BRICKS.gap)
-                rect = pygame.Rect(x, y, BRICKS.width, BRICKS.height)
+            for col in range(cfg.cols):                
+                x = base_start_x + shift + col * (cfg.width + cfg.gap)
 
-                if rect.right > SCREEN.width - BRICKS.side_margin:
+                if x + cfg.width > SCREEN.width - cfg.side_margin:
                     continue
 
                 if row < 2:
-                    brick = Brick(rect, hits_left = 3, points = 120, kind = "hard")
+                    kind, hits_left, points = KIND_HARD, 3, 120
                 else:
-                    brick = Brick(rect, hits_left = 2, points = 60, kind = "soft")
+                    kind, hits_left, points = KIND_SOFT, 2, 60
 
-                if random.random() < BRICKS.power_chance and row >= 2:
-                    brick.kind = "power"
-                    brick.hits_left = 3
-                    brick.points = 150
+                if self.rng.random() < cfg.power_chance and row >= 2:
+                    kind, hits_left, points = KIND_POWER, 3, 150
 
-                bricks_local.append(brick)
+                bricks_local.add(x, y, cfg.width, cfg.height, hits_left, points, kind)
 
         return bricks_local
 
@@ -145,15 +350,16 @@ class Game:
 
         self.balls.clear()
         self.bat.rect.centerx = SCREEN.width // 2
+        self.bat.snapshot()         # no interpolated sweep from the old position
         self.launch_ball(self.bat.rect.centerx, self.bat.rect.top - 20)
-        self.rebuild_sprite_list()
 
     def restart_game(self):
 
         self.scoring.score = 0
-        self.lives = RULES.start_lives
+        self.lives = self.rules.start_lives
         self.bricks = self.bricks_layout()
         self.balls.clear()
+        self.bat.snapshot()
         self.state = GameState.PLAYING
         self.launch_ball(self.bat.rect.centerx, self.bat.rect.top - 20)
         self.rebuild_sprite_list()
@@ -168,12 +374,40 @@ class Game:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
 
-                if self.state in (GameState.LOST, GameState.WON) and event.key == pygame.K_r:
-                    self.restart_game()
+                if event.key == pygame.K_r:
+                    self.pending_inputs |= INPUT_RESTART
 
-    def update(self):
+                if event.key == pygame.K_F3 and self.perf_overlay:
+                    self.perf_overlay.toggle()
 
-        keys = pygame.key.get_pressed()
+    def read_inputs(self) -> int:
+
+        """
+        This frame's input bitmask: held keys plus key presses seen by handle_events.
+        """
+        inputs = mask_from_keys(pygame.key.get_pressed()) | self.pending_inputs
+        self.pending_inputs = 0
+        return inputs
+
+    def step(self, inputs: int = 0) -> None:
+
+        """
+        Advance one simulation tick driven by an input bitmask (see inputs.py).
+        The windowed loop and headless simulations both go through here;
+        they flush the requested sounds (sound_bus) once per frame.
+        """
+        self.bat.snapshot()
+        self.balls.snapshot()
+
+        if inputs & INPUT_RESTART and self.state in (GameState.LOST, GameState.WON):
+            self.restart_game()
+
+        self.update(KeyState(inputs))
+
+    def update(self, keys = None):
+
+        if keys is None:
+            keys = pygame.key.get_pressed()
 
         if self.state != GameState.PLAYING:
             return
@@ -182,96 +416,264 @@ class Game:
         for s in self.sprites:
             s.update(keys = keys)
 
-        balls_to_remove: list[Ball] = []
+        # The event engine skips ticks on which no ball can touch anything
+        resolve = self.events is None or self.events.due(self)
+        if self.physics == "swept":
+            t = self.perf.clock()
+            lost = self.collision.sweep(self.balls, self.bat, self.bricks, self.brick_hit)
+            self.perf.add("bricks", t)
+        else:
+            lost = self.resolve_collisions() if resolve else []
+
+        # Lost balls go back to the pool
+        if lost:
+            self.balls.release_many(lost)
+
+        # Balls against each other, at their final positions for this tick
+        bumped = None
+        if self.rules.ball_collisions:
+            t = self.perf.clock()
+            bumped = self.collision.handle_ball_pairs(self.balls)
+            self.perf.add("balls", t)
+            self.perf.count("ball_pairs", self.collision.pair_tests)
+            self.perf.count("ball_contacts", self.collision.pair_contacts)
+
+        if self.events is not None:
+            if bumped is not None and len(bumped):
+                self.events.forget(self.balls.serial[bumped].tolist())
+                resolve = True
+            if resolve:
+                self.events.schedule(self)
+
+        if self.particles is not None:
+            self.particles.trail(self.balls)
+
+        if self.wall is not None:
+            bricks = self.wall.advance(self.bricks)
+            if bricks is not self.bricks:
+                self.bricks = bricks
+                self.rebuild_sprite_list()
 
-        # Collisions + rules (delegation)
-        for ball in self.balls:
+        # Lives/state checks
+        if len(self.balls) == 0:
+            self.lives -= 1
 
-            if self.collision.handle_walls_and_bottom(ball):
-                balls_to_remove.append(ball)
+            if self.lives <= 0:
+                self.state = GameState.LOST
+            else:
+                self.reset_round()
+
+        if self.wall is not None:
+            # Endless: no winning, but the wall must not reach the bat
+            if self.wall.reached(self.bricks, self.bat.rect.top):
+                self.state = GameState.LOST
+
+        elif len(self.bricks) == 0:
+            self.state = GameState.WON
+
+    def resolve_collisions(self) -> list[int]:
+
+        """
+        One collision pass over every ball; returns the slots of lost balls.
+        """
+        lost = []
+
+        # Collisions + rules (delegation). Walls and bat run batched over a
+        # wave of balls; balls spawned by power bricks form the next wave.
+        start = 0
+        while start < len(self.balls):
+            end = len(self.balls)
+
+            if end - start <= SCALAR_BALLS:
+                lost += self._resolve_few(start, end)
+                start = end
                 continue
 
-            self.collision.handle_bat(ball, self.bat)
+            t = self.perf.clock()
+            wave_lost = self.collision.handle_walls_and_bottom(self.balls, start, end)
+            self.perf.add("walls", t)
 
-            hit_brick = self.collision.handle_bricks(ball, self.bricks)
+            t = self.perf.clock()
+            self.collision.handle_bat(self.balls, self.bat, start, end, ~wave_lost)
+            self.perf.add("bat", t)
 
-            if hit_brick:
-                destroyed = hit_brick.hit()
+            if wave_lost.any():
+                lost += (np.flatnonzero(wave_lost) + start).tolist()
 
-                if destroyed:
-                    self.scoring.add_for_brick_destroyed(hit_brick)
+            t = self.perf.clock()
+            for i in self.collision.brick_candidates(self.balls, self.bricks, start, end, ~wave_lost):
 
-                    # Power brick effect: extra ball
-                    if hit_brick.kind == "power":
-                        self.launch_ball(
-                            hit_brick.rect.centerx,
-                            hit_brick.rect.centery,
-                            vx = random.choice([-BALL.speed, BALL.speed]),
-                            vy = -BALL.speed
-                        )
+                hit_brick = self.collision.handle_bricks(self.balls, i, self.bricks)
 
-                    self.bricks.remove(hit_brick)
+                if hit_brick is not None:
+                    self.brick_hit(hit_brick)
 
-        # Remove lost balls
-        for b in balls_to_remove:
+            self.perf.add("bricks", t)
+            start = end
 
-            if b in self.balls:
-                self.balls.remove(b)
+        return lost
 
-        # Lives/state checks
-        if len(self.balls) == 0:
-            self.lives -= 1
+    def _resolve_few(self, start: int, end: int) -> list[int]:
 
-            if self.lives <= 0:
-                self.state = GameState.LOST
-            else:
-                self.reset_round()
+        """
+        resolve_collisions() for a wave of a few balls, one ball at a time
+        on Python scalars, in the same order and with the same results.
+        """
+        balls, collision = self.balls, self.collision
 
-        if len(self.bricks) == 0:
-            self.state = GameState.WON
+        t = self.perf.clock()
+        lost = [i for i in range(start, end) if collision.handle_walls_one(balls, i)]
+        self.perf.add("walls", t)
 
-        # Keep polymorphism list in sync with collections
-        self.rebuild_sprite_list()
+        t = self.perf.clock()
+        active = [i for i in range(start, end) if i not in lost]
+        for i in active:
+            collision.handle_bat_one(balls, self.bat, i)
+        self.perf.add("bat", t)
+
+        # No broad phase: first_hit() already looks only at the cells under the ball
+        t = self.perf.clock()
+        for i in sorted(active, key = balls.serial.item):
+            hit_brick = collision.handle_bricks(balls, i, self.bricks)
+            if hit_brick is not None:
+                self.brick_hit(hit_brick)
+        self.perf.add("bricks", t)
+
+        return lost
+
+    def brick_hit(self, hit_brick: int) -> None:
+
+        """
+        A counted hit: damage the brick and, if that destroys it, score it,
+        throw its debris and launch a power brick's extra ball.
+        """
+        if not self.bricks.hit(hit_brick):
+            return
+
+        self.scoring.add_for_brick_destroyed(self.bricks, hit_brick)
+
+        if self.particles is not None:
+            self.particles.burst(self.bricks.rect(hit_brick), self.bricks.color(hit_brick))
+
+        # Power brick effect: extra ball
+        if self.bricks.kind_of(hit_brick) == KIND_POWER:
+            center = self.bricks.rect(hit_brick).center
+            self.launch_ball(
+                center[0],
+                center[1],
+                vx = self.rng.choice([-self.ball_config.speed, self.ball_config.speed]),
+                vy = -self.ball_config.speed
+            )
+
+        self.bricks.destroy(hit_brick)
 
     def draw(self):
 
-        if self.background_img:
-            self.screen.blit(self.background_img, (0, 0))
-        else:
-            self.screen.fill((18, 18, 24))
+        if self.screen is None:
+            return
 
-        # Polymorphism: draw different object types via same method name
-        for s in self.sprites:
-            s.draw(self.screen, image = self.ball_image)
+        # Fonts may still be pending after a fast start
+        texts = self._texts() if self.text else []
+
+        # Delegation: only changed screen areas are repainted
+        self.renderer.draw(self, texts)
 
-        ui = self.font.render(
+    def _texts(self) -> list[tuple[pygame.Surface, pygame.Rect]]:
+
+        # Re-rendered only when one of the numbers changes
+        ui = self.text.render(
+            self.font,
             f"Score: {self.score}    Lives: {self.lives}    Balls: {len(self.balls)}",
-            True, (235, 235, 235)
+            (235, 235, 235)
         )
-        self.screen.blit(ui, (18, 16))
+        texts = [(ui, ui.get_rect(topleft = (18, 16)))]
 
         if self.state == GameState.LOST:
 
-            msg = self.big_font.render("GAME OVER - You suck!", True, (237, 14, 14))
-            sub = self.font.render("Press R to restart, ESC to quit", True, (255, 255, 255))
-            self.screen.blit(msg, msg.get_rect(center=(SCREEN.width // 2, SCREEN.height // 2 + 30)))
-            self.screen.blit(sub, sub.get_rect(center=(SCREEN.width // 2, SCREEN.height // 2 + 75)))
+            msg = self.text.render(self.big_font, "GAME OVER - You suck!", (237, 14, 14))
+            sub = self.text.render(self.font, "Press R to restart, ESC to quit", (255, 255, 255))
+            texts.append((msg, msg.get_rect(center=(SCREEN.width // 2, SCREEN.height // 2 + 30))))
+            texts.append((sub, sub.get_rect(center=(SCREEN.width // 2, SCREEN.height // 2 + 75))))
 
         if self.state == GameState.WON:
             
-            msg = self.big_font.render("Congrats, you won the game!", True, (120, 255, 160))
-            sub = self.font.render("Press R to restart, ESC to quit", True, (255, 255, 255))
-            self.screen.blit(msg, msg.get_rect(center=(SCREEN.width // 2, SCREEN.height // 2 + 30)))
-            self.screen.blit(sub, sub.get_rect(center=(SCREEN.width // 2, SCREEN.height // 2 + 75)))
+            msg = self.text.render(self.big_font, "Congrats, you won the game!", (120, 255, 160))
+            sub = self.text.render(self.font, "Press R to restart, ESC to quit", (255, 255, 255))
+            texts.append((msg, msg.get_rect(center=(SCREEN.width // 2, SCREEN.height // 2 + 30))))
+            texts.append((sub, sub.get_rect(center=(SCREEN.width // 2, SCREEN.height // 2 + 75))))
+
+        if self.perf_overlay:
+            texts += self.perf_overlay.texts((SCREEN.width - 10, 10))
 
-        pygame.display.flip()
+        return texts
 
     def run(self):
 
+        perf = self.perf
+        first_frame = True
+
+        timestep = self.timestep
+
         while self.running:
-            self.clock.tick(SCREEN.fps)
+            perf.begin_frame()
+            elapsed = self.clock.tick(self.fps) / 1000
+            work_start = time.perf_counter()
+            perf.lap("tick")
             self.handle_events()
-            self.update()
+            perf.lap("events")
+
+            # Fixed-rate simulation: as many ticks as the elapsed time holds
+            dropped = timestep.dropped
+            steps = timestep.advance(elapsed)
+            for _ in range(steps):
+                inputs = self.read_inputs()
+                if self.recorder:
+                    self.recorder.record(inputs)
+                self.step(inputs)
+
+            self.alpha = timestep.alpha if TIMESTEP.interpolate else 1.0
+            # Once per rendered frame, however many ticks ran: per_frame
+            # budgets and coalescing hold when the loop is catching up
+            self.sound_bus.flush()
+
+            perf.count("ticks", steps)
+            perf.count("ticks_dropped", timestep.dropped - dropped)
+            perf.lap("update")
             self.draw()
+            perf.lap("draw")
+            perf.end_frame()
+
+            if self.quality:
+                self.quality.record(time.perf_counter() - work_start)
+
+            if first_frame:
+                self.startup.mark("first_frame")
+                first_frame = False
+
+            # Fast start: finish initialising one step per frame
+            if self.deferred_init:
+                self.deferred_init.pop(0)()
+                if not self.deferred_init:
+                    self.startup.mark("ready")
+
+            if self.pending_assets:
+                self.poll_assets()
+
+        if perf.enabled and self.perf_out:
+            perf.dump(self.perf_out)
+
+        if self.recorder:
+            self.recorder.finish(self)
+
+        self.close()
+        pygame.quit()
+
+    def close(self) -> None:
 
-        pygame.quit()
\ No newline at end of file
+        """
+        Stop the background workers (asset loader, endless chunk generator).
+        run() calls it on exit; headless callers call it when done.
+        """
+        self.res.shutdown()
+        if self.wall is not None:
+            self.wall.close()
\ No newline at end of file
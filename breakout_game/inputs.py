@@ -0,0 +1,38 @@
+import pygame
+
+
+# One bit per game input; a frame's input is the OR of the pressed ones
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_RESTART = 4
+
+_KEY_BITS = {
+    pygame.K_LEFT: INPUT_LEFT,
+    pygame.K_RIGHT: INPUT_RIGHT,
+    pygame.K_r: INPUT_RESTART,
+}
+
+
+class KeyState:
+
+    """
+    Stands in for pygame.key.get_pressed(): keys[pygame.K_LEFT] etc.,
+    backed by an input bitmask instead of the keyboard.
+    """
+    def __init__(self, mask: int = 0):
+        self.mask = mask
+
+    def __getitem__(self, key: int) -> bool:
+        return bool(self.mask & _KEY_BITS.get(key, 0))
+
+
+def mask_from_keys(keys) -> int:
+
+    """
+    Bitmask of the held keys in a pygame.key.get_pressed() result.
+    """
+    mask = 0
+    for key, bit in _KEY_BITS.items():
+        if keys[key]:
+            mask |= bit
+    return mask
@@ -0,0 +1,226 @@
+"""
+Level files: a JSON source format for editing and a compact binary format
+for loading.
+
+    python -m breakout_game.levels compile breakout_game/assets/levels/classic.json
+    python -m breakout_game.levels info classic.brkl
+    python -m breakout_game.main --level breakout_game/assets/levels/classic.json
+
+Source (JSON), every key but "rows" optional:
+
+    {
+        "brick": {"width": 80, "height": 50, "gap": 6},   # BrickConfig defaults
+        "top": 50,                  # y of the first row
+        "left": null,               # x of the first column; null centres the widest row
+        "stagger": true,            # shift odd rows right by half a brick
+        "legend": {"H": ["hard", 3, 120]},                # merged over the defaults
+        "rows": ["HHHHHHHHHH", "SSPSS.SSSS"]              # "." or " " is no brick
+    }
+
+Binary: magic "BRKL", version u8, 3 pad bytes, brick count u32, the
+lookup grid's cell width u16, height u16 and origin y i32 (zeros: the
+BRICKS pitch), then one packed 19-byte record per brick (see RECORD),
+little-endian. Loading is one
+np.frombuffer over the file bytes plus one copy per column into a BrickField.
+
+Compiled sources are cached by a hash of their contents, so an unchanged
+level is never compiled twice.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import time
+
+import numpy as np
+
+from .config import SCREEN, BRICKS
+from .startup import cache_dir
+from .objects.bricks import BrickField, grid_cell, KIND_NAMES, KIND_SOFT, KIND_HARD, KIND_POWER
+
+
+MAGIC = b"BRKL"
+VERSION = 2
+_HEADER = struct.Struct("<4sB3xIHHi")
+
+RECORD = np.dtype([
+    ("x", "<i4"), ("y", "<i4"), ("w", "<u2"), ("h", "<u2"),
+    ("hits", "<i2"), ("points", "<i4"), ("kind", "i1"),
+])
+
+LEVEL_CACHE = os.path.join(cache_dir(), "levels")
+
+# Same kinds and values as Game.bricks_layout
+DEFAULT_LEGEND = {
+    "H": (KIND_HARD, 3, 120),
+    "S": (KIND_SOFT, 2, 60),
+    "P": (KIND_POWER, 3, 150),
+}
+EMPTY = ". "
+
+
+# ---------- Binary format ----------
+def encode_level(bricks: BrickField) -> bytes:
+
+    n = bricks.count
+    records = np.empty(n, dtype = RECORD)
+    records["x"] = bricks.x[:n]
+    records["y"] = bricks.y[:n]
+    records["w"] = bricks.w[:n]
+    records["h"] = bricks.h[:n]
+    records["hits"] = bricks.hits_left[:n]
+    records["points"] = bricks.points[:n]
+    records["kind"] = bricks.kind[:n]
+    cell = bricks.cell or (0, 0, 0)
+    return _HEADER.pack(MAGIC, VERSION, n, *cell) + records.tobytes()
+
+
+def decode_level(data) -> BrickField:
+
+    """
+    BrickField from encoded bytes (or any buffer, e.g. an mmap).
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("not a level: too short")
+
+    magic, version, count, *cell = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("not a level: bad magic")
+    if version != VERSION:
+        raise ValueError(f"unsupported level version {version}")
+    if len(data) != _HEADER.size + count * RECORD.itemsize:
+        raise ValueError(f"level is corrupt: size does not match {count} bricks")
+
+    records = np.frombuffer(data, dtype = RECORD, count = count, offset = _HEADER.size)
+    return BrickField.from_arrays(records["x"], records["y"], records["w"], records["h"],
+                                  records["hits"], records["points"], records["kind"],
+                                  tuple(cell) if cell[0] else None)
+
+
+# ---------- Compiler ----------
+def _legend(source: dict) -> dict:
+
+    legend = dict(DEFAULT_LEGEND)
+    for char, (kind, hits, points) in source.get("legend", {}).items():
+        if len(char) != 1 or char in EMPTY:
+            raise ValueError(f"legend key {char!r} must be one character other than {EMPTY!r}")
+        if kind not in KIND_NAMES:
+            raise ValueError(f"legend {char!r}: unknown kind {kind!r}, expected one of {KIND_NAMES}")
+        legend[char] = (KIND_NAMES.index(kind), hits, points)
+    return legend
+
+
+def compile_source(source: dict) -> BrickField:
+
+    rows = source["rows"]
+    brick = source.get("brick", {})
+    width = brick.get("width", BRICKS.width)
+    height = brick.get("height", BRICKS.height)
+    gap = brick.get("gap", BRICKS.gap)
+    legend = _legend(source)
+
+    cols = max((len(r) for r in rows), default = 0)
+    left = source.get("left")
+    if left is None:
+        left = (SCREEN.width - (cols * width + (cols - 1) * gap)) // 2
+    top = source.get("top", BRICKS.top_margin)
+
+    # One character code per cell, rows padded with "."
+    chars = np.array([list(r.ljust(cols, ".")) for r in rows], dtype = "<U1").reshape(len(rows), cols)
+    unknown = set(np.unique(chars)) - set(legend) - set(EMPTY)
+    if unknown:
+        raise ValueError(f"characters not in the legend: {''.join(sorted(unknown))!r}")
+
+    row, col = np.nonzero(~np.isin(chars, list(EMPTY)))
+    cells = chars[row, col]
+
+    kind = np.zeros(len(cells), dtype = np.int8)
+    hits = np.zeros(len(cells), dtype = np.int16)
+    points = np.zeros(len(cells), dtype = np.int32)
+    for char, (k, h, p) in legend.items():
+        mask = cells == char
+        kind[mask], hits[mask], points[mask] = k, h, p
+
+    shift = (row % 2) * (width // 2) if source.get("stagger", True) else 0
+    x = left + shift + col * (width + gap)
+    y = top + row * (height + gap)
+    n = len(cells)
+
+    return BrickField.from_arrays(x, y, np.full(n, width), np.full(n, height), hits, points, kind,
+                                  grid_cell(width, height, gap, top))
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok = True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def load_level(path: str, cache: str | None = LEVEL_CACHE) -> BrickField:
+
+    """
+    Load a .brkl file, or a JSON source through the compiled-level cache.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if data[:len(MAGIC)] == MAGIC:
+        return decode_level(data)
+
+    key = hashlib.blake2b(data, digest_size = 16, person = b"brkl-v%d" % VERSION).hexdigest()
+    cached = os.path.join(cache, key + ".brkl") if cache else None
+
+    if cached and os.path.exists(cached):
+        with open(cached, "rb") as f:
+            try:
+                return decode_level(f.read())
+            except ValueError:
+                pass    # damaged cache entry: compile again
+
+    bricks = compile_source(json.loads(data))
+    if cached:
+        try:
+            _atomic_write(cached, encode_level(bricks))
+        except OSError:
+            pass
+    return bricks
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description = "Compile or inspect level files.")
+    sub = parser.add_subparsers(dest = "command", required = True)
+
+    p = sub.add_parser("compile", help = "JSON source -> .brkl")
+    p.add_argument("source")
+    p.add_argument("-o", "--out", help = "output path (default: source with .brkl)")
+
+    p = sub.add_parser("info", help = "describe a .brkl or JSON level")
+    p.add_argument("path")
+
+    args = parser.parse_args()
+
+    if args.command == "compile":
+        with open(args.source, encoding = "utf-8") as f:
+            bricks = compile_source(json.load(f))
+        out = args.out or os.path.splitext(args.source)[0] + ".brkl"
+        _atomic_write(out, encode_level(bricks))
+        print(f"wrote {out}: {bricks.count} bricks, {os.path.getsize(out)} bytes")
+        return
+
+    start = time.perf_counter()
+    bricks = load_level(args.path)
+    ms = (time.perf_counter() - start) * 1e3
+
+    kinds = np.bincount(bricks.kind[:bricks.count], minlength = len(KIND_NAMES))
+    print(f"{args.path}: {bricks.count} bricks loaded in {ms:.2f} ms")
+    print(", ".join(f"{name} {int(c)}" for name, c in zip(KIND_NAMES, kinds)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,71 @@
 """
 Start game from terminal: python -m breakout_game.main
+Frame timing: python -m breakout_game.main --perf --perf-out perf.csv  (F3 shows the overlay)
+Record inputs: python -m breakout_game.main --record session.brkr  (replay: python -m breakout_game.replay)
+Startup timing: python -m breakout_game.main --fast-start --trace-startup [startup.json]
+Weak machines: python -m breakout_game.main --adaptive-quality  (quality changes are logged)
 """
 
-from .game_logic import Game
+import argparse
+import dataclasses
+import logging
+
+from .config import RULES
+from .game_logic import Game, PHYSICS_MODES
+from .replay import Recorder, game_options
+
+
+def seed_arg(text: str) -> int:
+
+    """
+    argparse type for --seed: a non-negative int that fits a recording's
+    u64 field (NumPy generators seeded from it reject negatives too).
+    """
+    seed = int(text)
+    if not 0 <= seed < 2**64:
+        raise argparse.ArgumentTypeError(f"seed must be in [0, 2**64), got {seed}")
+    return seed
 
 
 def main():
-    Game().run()
+
+    parser = argparse.ArgumentParser(description = "Breakout game")
+    parser.add_argument("--perf", action = "store_true", help = "time every frame (F3 toggles the overlay)")
+    parser.add_argument("--perf-out", metavar = "PATH", help = "write frame timings on exit (.csv or .json)")
+    parser.add_argument("--seed", type = seed_arg, help = "seed for the game's RNG (random if omitted)")
+    parser.add_argument("--record", metavar = "PATH", help = "record seed + inputs for replay")
+    parser.add_argument("--level", metavar = "PATH", help = "play a level file (.json source or compiled .brkl)")
+    parser.add_argument("--endless", action = "store_true", help = "endless scrolling wall")
+    parser.add_argument("--fps", type = int, help = "render rate cap (gameplay speed does not change)")
+    parser.add_argument("--adaptive-quality", action = "store_true",
+                        help = "lower drawing quality when frames run over budget (changes are logged)")
+    parser.add_argument("--physics", choices = PHYSICS_MODES, default = "step",
+                        help = "collisions every tick, only on predicted contacts, or swept (continuous)")
+    parser.add_argument("--ball-collisions", action = "store_true", help = "balls bounce off each other")
+    parser.add_argument("--fast-start", action = "store_true",
+                        help = "show the first frame before fonts, mixer and music are initialised")
+    parser.add_argument("--trace-startup", nargs = "?", const = "-", metavar = "PATH",
+                        help = "print the init step timings on exit, or write them to PATH (JSON)")
+    args = parser.parse_args()
+
+    if args.adaptive_quality:
+        logging.basicConfig(level = logging.INFO, format = "%(name)s: %(message)s")
+
+    game = Game(seed = args.seed, perf = args.perf or bool(args.perf_out), perf_out = args.perf_out,
+                fast_start = args.fast_start, level = args.level,
+                endless = args.endless, fps = args.fps, adaptive_quality = args.adaptive_quality,
+                physics = args.physics, rules = dataclasses.replace(RULES, ball_collisions = args.ball_collisions))
+
+    if args.record:
+        game.recorder = Recorder(game.seed, args.record, game_options(game))
+
+    game.run()
+
+    if args.trace_startup == "-":
+        print(game.startup.report())
+    elif args.trace_startup:
+        game.startup.dump(args.trace_startup)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
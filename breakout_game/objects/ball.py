@@ -1,31 +1,165 @@
+import numpy as np
 import pygame
 
-from .sprite import Sprite
 from ..config import BALL
-from ..utils import clamp
 
 
-class Ball(Sprite):
+class BallSystem:
 
-    def __init__(self, rect: pygame.Rect, vel: tuple[float, float]):
+    """
+    Struct-of-arrays store for every ball in play, and their pool: slots
+    are preallocated (doubling when full) and reused, never freed.
+    Positions are the top-left of each ball rect (ints, like pygame.Rect);
+    all balls share one size.
 
-        super().__init__(rect)
-        self.vx, self.vy = vel
-        self.can_hit_brick = True
+    Releasing a ball moves the last ball into its slot (O(1)), so slot
+    order is not launch order. Launch order, which brick collisions are
+    resolved in, is kept in `serial`; order() lists slots by it.
+    """
+    def __init__(self, size: tuple[int, int], capacity: int = 64, max_speed: float = BALL.max_speed):
 
-    def speed_cap(self) -> None:
+        self.width, self.height = size
+        self.max_speed = max_speed
 
-        self.vx = clamp(self.vx, -BALL.max_speed, BALL.max_speed)
-        self.vy = clamp(self.vy, -BALL.max_speed, BALL.max_speed)
+        capacity = max(capacity, 1)
+        self.x = np.zeros(capacity, dtype = np.int32)
+        self.y = np.zeros(capacity, dtype = np.int32)
+        self.vx = np.zeros(capacity, dtype = np.float64)
+        self.vy = np.zeros(capacity, dtype = np.float64)
+        self.can_hit_brick = np.zeros(capacity, dtype = bool)
+        self.prev_x = np.zeros(capacity, dtype = np.int32)      # position at the last snapshot(),
+        self.prev_y = np.zeros(capacity, dtype = np.int32)      # for interpolated drawing
+        self.serial = np.zeros(capacity, dtype = np.int64)      # launch order
+
+        self.count = 0
+        self.spawned = 0        # lifetime total, for statistics
+
+    _ARRAYS = ("x", "y", "vx", "vy", "can_hit_brick", "prev_x", "prev_y", "serial")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _grow(self) -> None:
+
+        for name in self._ARRAYS:
+            old = getattr(self, name)
+            new = np.zeros(len(old) * 2, dtype = old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def spawn(self, centerx: int, centery: int, vx: float, vy: float) -> int:
+
+        if self.count == len(self.x):
+            self._grow()
+
+        i = self.count
+        self.x[i] = centerx - self.width // 2
+        self.y[i] = centery - self.height // 2
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.can_hit_brick[i] = True
+        self.prev_x[i] = self.x[i]
+        self.prev_y[i] = self.y[i]
+        self.serial[i] = self.spawned
+
+        self.count += 1
+        self.spawned += 1
+        return i
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def release(self, i: int) -> None:
+
+        """
+        Return slot i to the pool: the last ball moves into it.
+        """
+        last = self.count - 1
+        if i != last:
+            for name in self._ARRAYS:
+                arr = getattr(self, name)
+                arr[i] = arr[last]
+        self.count = last
+
+    def release_many(self, indices: list[int]) -> None:
+
+        # Highest first, so the ball moved into a slot is never one still to release
+        for i in sorted(indices, reverse = True):
+            self.release(i)
+
+    def order(self) -> np.ndarray:
+
+        """
+        Slot indices in launch order.
+        """
+        return np.argsort(self.serial[:self.count], kind = "stable")
+
+    # ---------- Per-ball access ----------
+    def rect(self, i: int) -> pygame.Rect:
+        return pygame.Rect(self.x.item(i), self.y.item(i), self.width, self.height)
+
+    def set_rect(self, i: int, rect: pygame.Rect) -> None:
+        self.x[i] = rect.x
+        self.y[i] = rect.y
+
+    def rects(self, alpha: float = 1.0) -> list[pygame.Rect]:
+
+        xs, ys = self.positions(alpha)
+        return [pygame.Rect(x, y, self.width, self.height) for x, y in zip(xs, ys)]
+
+    # ---------- Interpolation ----------
+    def snapshot(self) -> None:
+
+        """
+        Remember current positions; called before each simulation tick.
+        """
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    def positions(self, alpha: float = 1.0) -> tuple[list[int], list[int]]:
+
+        """
+        Draw positions, alpha of the way from the last snapshot to now.
+        """
+        n = self.count
+        if alpha >= 1.0:
+            return self.x[:n].tolist(), self.y[:n].tolist()
+
+        px, py = self.prev_x[:n], self.prev_y[:n]
+        xs = np.rint(px + (self.x[:n] - px) * alpha).astype(np.int32)
+        ys = np.rint(py + (self.y[:n] - py) * alpha).astype(np.int32)
+        return xs.tolist(), ys.tolist()
+
+    # ---------- Batched operations ----------
+    def speed_cap(self, idx = slice(None)) -> None:
+
+        """
+        Clamp velocities of the selected balls (slice, index array or mask).
+        """
+        self.vx[idx] = np.clip(self.vx[idx], -self.max_speed, self.max_speed)
+        self.vy[idx] = np.clip(self.vy[idx], -self.max_speed, self.max_speed)
 
     def update(self, **kwargs) -> None:
 
-        self.rect.x += int(self.vx)
-        self.rect.y += int(self.vy)
+        # Same as moving each rect by int(vx), int(vy): truncate toward zero
+        n = self.count
+        if n <= 2:
+            # A ball or two: scalar updates beat the array calls' overhead
+            for i in range(n):
+                self.x[i] += int(self.vx.item(i))
+                self.y[i] += int(self.vy.item(i))
+            return
+
+        self.x[:n] += np.trunc(self.vx[:n]).astype(np.int32)
+        self.y[:n] += np.trunc(self.vy[:n]).astype(np.int32)
+
+    def draw(self, surface: pygame.Surface, *, image = None, alpha: float = 1.0, **kwargs) -> None:
 
-    def draw(self, surface: pygame.Surface, *, image=None, **kwargs) -> None:
+        positions = zip(*self.positions(alpha))
 
         if image:
-            surface.blit(image, self.rect)
+            surface.blits([(image, pos) for pos in positions], doreturn = False)
         else:
-            pygame.draw.ellipse(surface, (227, 11, 126), self.rect)
\ No newline at end of file
+            for x, y in positions:
+                pygame.draw.ellipse(surface, (227, 11, 126), (x, y, self.width, self.height))
@@ -15,6 +15,7 @@ class Bat(Sprite):
             BAT.height,
         )
         super().__init__(rect)
+        self.prev_x = rect.x        # x at the last snapshot(), for interpolated drawing
 
     def update(self, *, keys = None, **kwargs) -> None:
 
@@ -29,6 +30,16 @@ class Bat(Sprite):
 
         self.rect.x = int(clamp(self.rect.x, 0, SCREEN.width - self.rect.width))
 
-    def draw(self, surface: pygame.Surface, **kwargs) -> None:
+    def snapshot(self) -> None:
+        self.prev_x = self.rect.x
 
-        pygame.draw.rect(surface, (14, 237, 233), self.rect, border_radius = 10)
\ No newline at end of file
+    def draw_rect(self, alpha: float = 1.0) -> pygame.Rect:
+
+        rect = self.rect.copy()
+        if alpha < 1.0:
+            rect.x = round(self.prev_x + (self.rect.x - self.prev_x) * alpha)
+        return rect
+
+    def draw(self, surface: pygame.Surface, *, alpha: float = 1.0, **kwargs) -> None:
+
+        pygame.draw.rect(surface, (14, 237, 233), self.draw_rect(alpha), border_radius = 10)
\ No newline at end of file
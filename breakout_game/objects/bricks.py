@@ -1,40 +1,357 @@
+import copy
+
+import numpy as np
 import pygame
-from .sprite import Sprite
 
+from ..spatial import BrickGrid
+from ..aabb_tree import AABBTree
+
+
+KIND_SOFT = 0
+KIND_HARD = 1
+KIND_POWER = 2
+
+KIND_NAMES = ("soft", "hard", "power")
+KIND_COLORS = (
+    (169, 42, 189),     # soft
+    (67, 60, 200),      # hard
+    (255, 180, 80),     # power
+)
+
+
+def grid_cell(width: int, height: int, gap: int, top: int) -> tuple[int, int, int]:
+
+    """
+    BrickField cell for bricks of width x height laid out gap apart from y = top.
+    """
+    return width + gap, height + gap, top
+
+
+class BrickField:
+
+    """
+    Data-oriented brick store: one NumPy array per attribute, indexed by brick.
+    Destroying a brick only clears its alive flag, so indices stay stable
+    and removal is O(1).
+    Lookups go through a static BrickGrid; once bricks move (move_to()),
+    through a dynamic AABBTree instead (see track()).
+    """
+    def __init__(self, capacity: int = 64, cell: tuple[int, int, int] | None = None):
+
+        """
+        cell: the grid's (cell width, cell height, origin y), normally the
+        layout's brick pitch (see grid_cell()); None for the BRICKS pitch.
+        """
+        capacity = max(capacity, 1)
+        self.x = np.zeros(capacity, dtype = np.int32)
+        self.y = np.zeros(capacity, dtype = np.int32)
+        self.w = np.zeros(capacity, dtype = np.int32)
+        self.h = np.zeros(capacity, dtype = np.int32)
+        self.hits_left = np.zeros(capacity, dtype = np.int16)
+        self.points = np.zeros(capacity, dtype = np.int32)
+        self.kind = np.zeros(capacity, dtype = np.int8)
+        self.alive = np.zeros(capacity, dtype = bool)
+
+        self.count = 0          # slots used (alive or not)
+        self.alive_count = 0
+        self.changed: list[int] | None = None     # hit/destroyed bricks, when a renderer tracks them
+        self.scrolled = 0       # shift() pixels not yet seen by the renderer
+        self.moves = 0          # move_to() calls, lifetime total (the renderer and event engine watch it)
+        self.tree: AABBTree | None = None
+        self._proxy: list[int] = []     # brick -> tree leaf, while tracked
+        self._fat = None                # brick -> its leaf's fat box, for move_many()
+        self.cell = cell
+        self._grid = None
+        self._occupancy = None
+
+    _ARRAYS = ("x", "y", "w", "h", "hits_left", "points", "kind", "alive")
+
+    @classmethod
+
+    def from_arrays(cls, x, y, w, h, hits_left, points, kind, cell = None) -> "BrickField":
+
+        field = cls(len(x), cell)
+        n = len(x)
+        field.x[:n] = x
+        field.y[:n] = y
+        field.w[:n] = w
+        field.h[:n] = h
+        field.hits_left[:n] = hits_left
+        field.points[:n] = points
+        field.kind[:n] = kind
+        field.alive[:n] = True
+        field.count = field.alive_count = n
+        return field
+
+    def copy(self) -> "BrickField":
+
+        """
+        Fresh copy for a restart. The grid only depends on positions, so its
+        arrays are shared (a shallow copy keeps shift() on one from moving the other).
+        """
+        n = self.count
+        field = BrickField.from_arrays(self.x[:n], self.y[:n], self.w[:n], self.h[:n],
+                                       self.hits_left[:n], self.points[:n], self.kind[:n], self.cell)
+        field.alive[:n] = self.alive[:n]
+        field.alive_count = self.alive_count
+        field._grid = copy.copy(self.grid)
+        return field
+
+    def __len__(self) -> int:
+        return self.alive_count
 
-class Brick(Sprite):
+    @property
 
-    def __init__(self, rect: pygame.Rect, hits_left: int = 1, points: int = 20, kind: str = "soft"):
+    def nbytes(self) -> int:
 
-        super().__init__(rect)
-        self.hits_left = hits_left
-        self.points = points
-        self.kind = kind  # "soft", "hard", "power"
+        total = sum(getattr(self, name).nbytes for name in self._ARRAYS)
+        if self._grid is not None:
+            total += self._grid.nbytes
+        return total
 
-    def color(self) -> tuple[int, int, int]:
+    def _grow(self) -> None:
 
-        if self.kind == "hard":
-            return (67, 60, 200)
-        if self.kind == "power":
-            return (255, 180, 80) 
-        return (169, 42, 189)  # soft
-    
+        for name in self._ARRAYS:
+            old = getattr(self, name)
+            new = np.zeros(len(old) * 2, dtype = old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def add(self, x: int, y: int, w: int, h: int,
+            hits_left: int = 1, points: int = 20, kind: int = KIND_SOFT) -> int:
+
+        if self.count == len(self.x):
+            self._grow()
+
+        i = self.count
+        self.x[i], self.y[i], self.w[i], self.h[i] = x, y, w, h
+        self.hits_left[i] = hits_left
+        self.points[i] = points
+        self.kind[i] = kind
+        self.alive[i] = True
+
+        self.count += 1
+        self.alive_count += 1
+        self._grid = None
+        self._occupancy = None
+        if self.tree is not None:
+            self._proxy.append(-1)
+            self._fat = np.concatenate((self._fat, np.zeros((1, 4))))
+            self._track(i)
+        return i
+
+    # ---------- Per-brick access ----------
+    def rect(self, i: int) -> pygame.Rect:
+        return pygame.Rect(int(self.x[i]), int(self.y[i]), int(self.w[i]), int(self.h[i]))
+
+    def kind_of(self, i: int) -> int:
+        return int(self.kind[i])
+
+    def points_of(self, i: int) -> int:
+        return int(self.points[i])
+
+    def color(self, i: int) -> tuple[int, int, int]:
+        return KIND_COLORS[self.kind[i]]
+
+    def hit(self, i: int) -> bool:
+
+        """
+        Apply 1 hit.
+        Returns true if destroyed.
+        """
+        self.hits_left[i] -= 1
+        if self.changed is not None:
+            self.changed.append(i)
+        return bool(self.hits_left[i] <= 0)
+
+    def destroy(self, i: int) -> None:
+
+        if self.alive[i]:
+            self.alive[i] = False
+            self.alive_count -= 1
+            if self.changed is not None:
+                self.changed.append(i)
+            self._occupancy = None
+            if self.tree is not None:
+                self.tree.remove(self._proxy[i])
+
+    def shift(self, dy: int) -> None:
+
+        """
+        Move every brick down by dy. The grid moves along instead of being rebuilt.
+        """
+        self.y[:self.count] += dy
+        if self._grid is not None:
+            self._grid.origin_y += dy
+        if self.changed is not None:
+            self.scrolled += dy
+        if self.tree is not None:
+            self.track()
+
+    def track(self) -> AABBTree:
+
+        """
+        Index the alive bricks in a dynamic AABB tree, for walls whose bricks
+        move: a moved brick then costs a refit at most, where the grid would
+        be rebuilt. Lookups use the tree from now on.
+        """
+        self.tree = AABBTree()
+        self._proxy = [-1] * self.count
+        self._fat = np.zeros((self.count, 4), dtype = np.float64)
+        for i in self.alive_indices().tolist():
+            self._track(i)
+        return self.tree
+
+    def _track(self, i: int) -> None:
+
+        x, y = self.x.item(i), self.y.item(i)
+        self._proxy[i] = self.tree.insert(i, x, y, x + self.w.item(i), y + self.h.item(i))
+        self._fat[i] = self.tree.fat_box(self._proxy[i])
+
+    def move_to(self, i: int, x: int, y: int) -> None:
+
+        """
+        Put brick i at (x, y) (sliding, oscillating, falling bricks).
+        """
+        dx, dy = x - self.x.item(i), y - self.y.item(i)
+        if not dx and not dy:
+            return
+
+        if self.tree is None:
+            self.track()
+        self.x[i], self.y[i] = x, y
+        if self.alive[i]:
+            proxy = self._proxy[i]
+            if self.tree.move(proxy, x, y, x + self.w.item(i), y + self.h.item(i), dx, dy):
+                self._fat[i] = self.tree.fat_box(proxy)
+
+        self.moves += 1
+        self._grid = None
+        self._occupancy = None
+
+    def move_many(self, indices, x, y) -> None:
+
+        """
+        move_to() for many bricks at once. Bricks still inside their fat box
+        are settled with array operations; only the others touch the tree.
+        """
+        idx = np.asarray(indices, dtype = np.intp)
+        x = np.asarray(x, dtype = np.int32)
+        y = np.asarray(y, dtype = np.int32)
+        dx, dy = x - self.x[idx], y - self.y[idx]
+
+        moved = (dx != 0) | (dy != 0)
+        if not moved.any():
+            return
+        if self.tree is None:
+            self.track()
+
+        idx, x, y, dx, dy = idx[moved], x[moved], y[moved], dx[moved], dy[moved]
+        self.x[idx], self.y[idx] = x, y
+        right, bottom = x + self.w[idx], y + self.h[idx]
+
+        fat = self._fat[idx]
+        out = self.alive[idx] & ~((fat[:, 0] <= x) & (right <= fat[:, 2]) & (fat[:, 1] <= y) & (bottom <= fat[:, 3]))
+
+        tree, proxies = self.tree, self._proxy
+        for i, left, top, r, b, ddx, ddy in zip(idx[out].tolist(), x[out].tolist(), y[out].tolist(),
+                                               right[out].tolist(), bottom[out].tolist(),
+                                               dx[out].tolist(), dy[out].tolist()):
+            tree.move(proxies[i], left, top, r, b, ddx, ddy)
+            self._fat[i] = tree.fat_box(proxies[i])
+
+        self.moves += 1
+        self._grid = None
+        self._occupancy = None
+
+    def alive_indices(self) -> np.ndarray:
+        return np.flatnonzero(self.alive[:self.count])
+
+    # ---------- Queries ----------
+    def candidates(self, left: int, top: int, right: int, bottom: int) -> list[int]:
+
+        """
+        Brick indices that may overlap the rect, in layout order, from the
+        tree if bricks are tracked, else from the grid. Destroyed bricks may
+        be included (grid); callers filter by alive and do the exact test.
+        """
+        if self.tree is not None:
+            return sorted(self.tree.query(left, top, right, bottom))
+        return self.grid.candidates(left, top, right, bottom)
+
+    @property
+
+    def grid(self) -> BrickGrid:
+
+        if self._grid is None:
+            n = self.count
+            self._grid = BrickGrid(self.x[:n], self.y[:n], self.w[:n], self.h[:n], *(self.cell or ()))
+        return self._grid
+
+    def first_hit(self, rect: pygame.Rect) -> int | None:
+
+        """
+        Return the first alive brick (layout order) colliding with rect, or None.
+        """
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+
+        for i in self.candidates(left, top, right, bottom):
+            if not self.alive[i]:
+                continue
+
+            bx = self.x.item(i)
+            by = self.y.item(i)
+            if bx < right and left < bx + self.w.item(i) and by < bottom and top < by + self.h.item(i):
+                return i
+
+        return None
+
+    def overlapping(self, rect: pygame.Rect) -> list[int]:
+
+        """
+        All alive bricks colliding with rect, in layout order.
+        """
+        left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+
+        return [
+            i for i in self.candidates(left, top, right, bottom)
+            if self.alive[i]
+            and self.x.item(i) < right and left < self.x.item(i) + self.w.item(i)
+            and self.y.item(i) < bottom and top < self.y.item(i) + self.h.item(i)
+        ]
+
+    def may_hit(self, left: np.ndarray, top: np.ndarray, right: np.ndarray, bottom: np.ndarray) -> np.ndarray:
+
+        """
+        Vectorized broad phase over many rects: False means the rect touches
+        no alive brick; True means first_hit() has to decide.
+        """
+        if self.tree is not None:
+            tree_any = self.tree.any
+            return np.fromiter(map(tree_any, left.tolist(), top.tolist(), right.tolist(), bottom.tolist()),
+                               dtype = bool, count = len(left))
+
+        if self._occupancy is None:
+            self._occupancy = self.grid.occupancy(self.alive[:self.count])
+        return self.grid.any_occupied(self._occupancy, left, top, right, bottom)
+
+    # ---------- Sprite interface ----------
     def update(self, **kwargs) -> None:
         pass
-    
-    def draw(self, surface: pygame.Surface, **kwargs) -> None:
-        
-        pygame.draw.rect(surface, self.color(), self.rect, border_radius = 6)
 
-        if self.kind == "hard" and self.hits_left > 1:
-            inner = self.rect.inflate(-12, -12)
-            pygame.draw.rect(surface, (255, 210, 170), inner, width = 2, border_radius = 6)
+    def draw(self, surface: pygame.Surface, *, indices = None, **kwargs) -> None:
 
-    def hit(self) -> bool:
-        
         """
-        Apply 1 hit. 
-        Returns true if destroyed.
+        Draw all alive bricks, or only the given ones.
         """
-        self.hits_left -= 1
-        return self.hits_left <= 0
\ No newline at end of file
+        idx = self.alive_indices() if indices is None else np.asarray(indices, dtype = np.intp)
+        for x, y, w, h, kind, hits in zip(
+            self.x[idx].tolist(), self.y[idx].tolist(), self.w[idx].tolist(),
+            self.h[idx].tolist(), self.kind[idx].tolist(), self.hits_left[idx].tolist()
+        ):
+            rect = pygame.Rect(x, y, w, h)
+            pygame.draw.rect(surface, KIND_COLORS[kind], rect, border_radius = 6)
+
+            if kind == KIND_HARD and hits > 1:
+                inner = rect.inflate(-12, -12)
+                pygame.draw.rect(surface, (255, 210, 170), inner, width = 2, border_radius = 6)
@@ -0,0 +1,176 @@
+import numpy as np
+import pygame
+
+from ..config import SCREEN, PARTICLES, ParticleConfig
+
+
+class ParticleSystem:
+
+    """
+    Struct-of-arrays debris and trail particles, purely visual.
+
+    Every array is preallocated at `capacity`. Particles are written round
+    a ring, so when it is full the oldest particle is recycled first; a
+    dead particle simply has life 0. update() integrates and culls every
+    slot with a few NumPy operations and draw() writes all live particles
+    into the surface's pixels at once (size x size squares, fading out).
+
+    Particles use their own RNG: they never touch Game.rng, so replays
+    and headless runs are unaffected.
+    """
+    def __init__(self, config: ParticleConfig = PARTICLES, seed: int = 0):
+
+        self.config = config
+        capacity = config.capacity
+
+        self.x = np.zeros(capacity, dtype = np.float32)
+        self.y = np.zeros(capacity, dtype = np.float32)
+        self.vx = np.zeros(capacity, dtype = np.float32)
+        self.vy = np.zeros(capacity, dtype = np.float32)
+        self.life = np.zeros(capacity, dtype = np.float32)     # ticks left; 0 is dead
+        self.max_life = np.ones(capacity, dtype = np.float32)
+        self.rgb = np.zeros((capacity, 3), dtype = np.float32)
+
+        self.capacity = capacity
+        self.head = 0           # next slot written: the oldest particle
+        self.live = 0
+        self.recycled = 0       # live particles overwritten, lifetime total
+        self._trail_ticks = 0
+
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        return self.live
+
+    # ---------- Emitting ----------
+    def _slots(self, n: int) -> np.ndarray:
+
+        n = min(n, self.capacity)
+        slots = (self.head + np.arange(n)) % self.capacity
+        self.head = int((self.head + n) % self.capacity)
+
+        overwritten = int(np.count_nonzero(self.life[slots]))
+        self.recycled += overwritten
+        self.live += n - overwritten
+        return slots
+
+    def emit(self, x, y, n: int, color: tuple[int, int, int], speed: float, life: float,
+             spread_x: float = 0.0, spread_y: float = 0.0) -> None:
+
+        """
+        n particles around (x, y), flying in random directions at up to
+        speed, living about `life` ticks.
+        """
+        if n <= 0:
+            return
+
+        slots = self._slots(n)
+        if len(slots) < n:
+            # More than the pool holds: only the last ones would survive the ring
+            x = x[-len(slots):] if np.ndim(x) else x
+            y = y[-len(slots):] if np.ndim(y) else y
+        n = len(slots)
+        rng = self._rng
+
+        angle = rng.random(n, dtype = np.float32) * np.float32(2 * np.pi)
+        v = rng.random(n, dtype = np.float32) * np.float32(speed)
+
+        self.x[slots] = x + (rng.random(n, dtype = np.float32) - 0.5) * spread_x
+        self.y[slots] = y + (rng.random(n, dtype = np.float32) - 0.5) * spread_y
+        self.vx[slots] = np.cos(angle) * v
+        self.vy[slots] = np.sin(angle) * v
+        self.life[slots] = life * (0.5 + rng.random(n, dtype = np.float32))
+        self.max_life[slots] = self.life[slots]
+        self.rgb[slots] = color
+
+    def burst(self, rect: pygame.Rect, color: tuple[int, int, int]) -> None:
+
+        """
+        Debris of a destroyed brick.
+        """
+        cfg = self.config
+        self.emit(rect.centerx, rect.centery, cfg.debris_per_brick, color, cfg.debris_speed, cfg.debris_life,
+                  rect.width, rect.height)
+
+    def trail(self, balls) -> None:
+
+        """
+        A few slow, short-lived particles at every ball's centre. Past
+        trail_budget particles a tick, a rotating subset of the balls
+        trails instead (every k-th ball, a different one each tick).
+        """
+        cfg = self.config
+        n = len(balls)
+        if not n or not cfg.trail_per_tick:
+            return
+
+        x, y = balls.x[:n], balls.y[:n]
+        stride = -(-n * cfg.trail_per_tick // cfg.trail_budget)
+        if stride > 1:
+            start = self._trail_ticks % stride
+            x, y = x[start::stride], y[start::stride]
+        self._trail_ticks += 1
+
+        cx = np.repeat(x + balls.width / 2, cfg.trail_per_tick)
+        cy = np.repeat(y + balls.height / 2, cfg.trail_per_tick)
+        self.emit(cx, cy, len(cx), cfg.trail_color, cfg.trail_speed, cfg.trail_life)
+
+    # ---------- Per tick ----------
+    def update(self, **kwargs) -> None:
+
+        if not self.live:
+            return
+
+        cfg = self.config
+        self.vy += np.float32(cfg.gravity)
+        self.x += self.vx
+        self.y += self.vy
+
+        # Age, and kill what left the screen
+        np.subtract(self.life, 1.0, out = self.life)
+        np.maximum(self.life, 0.0, out = self.life)
+        self.life[(self.x < 0) | (self.x >= SCREEN.width) | (self.y < 0) | (self.y >= SCREEN.height)] = 0.0
+
+        self.live = int(np.count_nonzero(self.life))
+
+    # ---------- Drawing ----------
+    def bounds(self) -> pygame.Rect | None:
+
+        """
+        Screen area covered by live particles (None if there are none).
+        """
+        if not self.live:
+            return None
+
+        alive = self.life > 0
+        xs, ys = self.x[alive], self.y[alive]
+        left, top = int(xs.min()), int(ys.min())
+        return pygame.Rect(left, top, int(xs.max()) - left + self.config.size, int(ys.max()) - top + self.config.size)
+
+    def draw(self, surface: pygame.Surface, **kwargs) -> None:
+
+        if not self.live:
+            return
+
+        size = self.config.size
+        width, height = surface.get_size()
+        xs, ys = self.x, self.y
+
+        # Live and fully on the surface (fresh debris is not culled until the next update)
+        idx = np.flatnonzero((self.life > 0) & (xs >= 0) & (xs < width - size) & (ys >= 0) & (ys < height - size))
+        px = xs[idx].astype(np.intp)
+        py = ys[idx].astype(np.intp)
+
+        # Fade toward black with age, then pack into the surface's pixel format
+        rgb = (self.rgb[idx] * (self.life[idx] / self.max_life[idx])[:, None]).astype(np.uint32)
+        shifts, losses = surface.get_shifts(), surface.get_losses()
+        mapped = ((rgb[:, 0] >> losses[0]) << shifts[0]) | ((rgb[:, 1] >> losses[1]) << shifts[1])
+        mapped |= (rgb[:, 2] >> losses[2]) << shifts[2]
+
+        pixels = pygame.surfarray.pixels2d(surface)
+        try:
+            for dx in range(size):
+                for dy in range(size):
+                    pixels[px + dx, py + dy] = mapped
+        finally:
+            del pixels
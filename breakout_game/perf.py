@@ -0,0 +1,254 @@
+import csv
+import json
+import sys
+import time
+
+import numpy as np
+import pygame
+
+from .config import SCREEN
+
+
+# Main loop phases (they add up to the frame) and collision sub-steps inside update
+LOOP_PHASES = ("tick", "events", "update", "draw")
+SUB_PHASES = ("walls", "bat", "bricks", "balls")
+COLUMNS = ("frame",) + LOOP_PHASES + SUB_PHASES
+
+# Per-frame event counts (kept apart from the timings)
+COUNTERS = ("sfx_requested", "sfx_coalesced", "sfx_played", "sfx_dropped", "ticks", "ticks_dropped",
+            "alloc_blocks", "ball_pairs", "ball_contacts")
+
+HISTOGRAM_MS = (0, 1, 2, 4, 8, 16, 33, float("inf"))
+
+
+class NullFrameStats:
+
+    """
+    Instrumentation switched off: every call is a no-op.
+    """
+    enabled = False
+
+    def clock(self) -> float:
+        return 0.0
+
+    def begin_frame(self) -> None:
+        pass
+
+    def lap(self, phase: str) -> None:
+        pass
+
+    def add(self, phase: str, since: float) -> None:
+        pass
+
+    def count(self, name: str, n: int = 1) -> None:
+        pass
+
+    def end_frame(self) -> None:
+        pass
+
+
+class FrameStats:
+
+    """
+    Per-frame phase timings (seconds) in a fixed-size ring buffer.
+
+    begin_frame() / lap(phase) time the main loop phases back to back;
+    add(phase, since) accumulates nested timings such as collision steps.
+    "frame" is the work time (everything but the tick wait); a frame misses
+    its deadline when that exceeds 1 / fps. count(name, n) adds to this
+    frame's COUNTERS; "alloc_blocks" is the net change in Python's allocated
+    memory blocks over the frame, which should hover around 0 in steady play.
+    """
+    enabled = True
+
+    def __init__(self, capacity: int = 600, fps: int = SCREEN.fps):
+
+        self.capacity = capacity
+        self.budget = 1.0 / fps
+        self.rows = np.zeros((capacity, len(COLUMNS)), dtype = np.float64)
+        self.counts = np.zeros((capacity, len(COUNTERS)), dtype = np.int32)
+        self.frames = 0
+
+        self._col = {name: n for n, name in enumerate(COLUMNS)}
+        self._counter = {name: n for n, name in enumerate(COUNTERS)}
+        self._row = self.rows[0]
+        self._counts = self.counts[0]
+        self._last = 0.0
+        self._blocks = 0
+
+    clock = staticmethod(time.perf_counter)
+
+    def begin_frame(self) -> None:
+
+        self._row = self.rows[self.frames % self.capacity]
+        self._row[:] = 0.0
+        self._counts = self.counts[self.frames % self.capacity]
+        self._counts[:] = 0
+        self._blocks = sys.getallocatedblocks()
+        self._last = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+
+        now = time.perf_counter()
+        self._row[self._col[phase]] += now - self._last
+        self._last = now
+
+    def add(self, phase: str, since: float) -> None:
+        self._row[self._col[phase]] += time.perf_counter() - since
+
+    def count(self, name: str, n: int = 1) -> None:
+        self._counts[self._counter[name]] += n
+
+    def end_frame(self) -> None:
+
+        row = self._row
+        row[0] = row[self._col["events"]] + row[self._col["update"]] + row[self._col["draw"]]
+        self._counts[self._counter["alloc_blocks"]] = sys.getallocatedblocks() - self._blocks
+        self.frames += 1
+
+    # ---------- Summaries ----------
+    def recent(self, rows: np.ndarray | None = None) -> np.ndarray:
+
+        """
+        Rows of the buffered frames (timings, or pass self.counts), oldest first.
+        """
+        if rows is None:
+            rows = self.rows
+        if self.frames <= self.capacity:
+            return rows[:self.frames]
+        start = self.frames % self.capacity
+        return np.concatenate((rows[start:], rows[:start]))
+
+    def summary(self) -> dict:
+
+        rows = self.recent()
+        if not len(rows):
+            return {"frames": 0}
+
+        frame_ms = rows[:, 0] * 1e3
+        p50, p95, p99 = np.percentile(frame_ms, (50, 95, 99))
+        counts, _ = np.histogram(frame_ms, bins = HISTOGRAM_MS)
+        frame_counts = self.recent(self.counts)
+
+        return {
+            "frames": len(rows),
+            "total_frames": self.frames,
+            "budget_ms": self.budget * 1e3,
+            "p50_ms": float(p50),
+            "p95_ms": float(p95),
+            "p99_ms": float(p99),
+            "max_ms": float(frame_ms.max()),
+            "missed": int((rows[:, 0] > self.budget).sum()),
+            "mean_ms": {name: float(rows[:, n].mean() * 1e3) for n, name in enumerate(COLUMNS)},
+            "histogram_ms": {f"<{edge}": int(c) for edge, c in zip(HISTOGRAM_MS[1:], counts)},
+            "counters": {name: {"mean": float(frame_counts[:, n].mean()),
+                                "max": int(frame_counts[:, n].max()),
+                                "total": int(frame_counts[:, n].sum())}
+                         for n, name in enumerate(COUNTERS)},
+        }
+
+    def dump(self, path: str) -> None:
+
+        """
+        Write the buffered frames: .csv gets one row per frame (ms),
+        anything else gets JSON with the summary and the rows.
+        """
+        rows = self.recent() * 1e3
+        counts = self.recent(self.counts)
+        first = self.frames - len(rows)
+
+        if path.endswith(".csv"):
+            with open(path, "w", newline = "", encoding = "utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(("index",) + tuple(f"{c}_ms" for c in COLUMNS) + COUNTERS)
+                for n, (row, row_counts) in enumerate(zip(rows.tolist(), counts.tolist())):
+                    writer.writerow([first + n] + [round(v, 4) for v in row] + row_counts)
+        else:
+            with open(path, "w", encoding = "utf-8") as f:
+                json.dump({
+                    "summary": self.summary(),
+                    "columns": COLUMNS,
+                    "first_frame": first,
+                    "frames_ms": np.round(rows, 4).tolist(),
+                    "counters": COUNTERS,
+                    "frame_counts": counts.tolist(),
+                }, f)
+
+
+class PerfOverlay:
+
+    """
+    Draws FrameStats as text lines plus a frame-time histogram.
+    The panel is rebuilt every `refresh` frames, not every frame.
+    """
+    def __init__(self, stats: FrameStats, font: pygame.font.Font, refresh: int = 15):
+
+        self.stats = stats
+        self.font = font
+        self.refresh = refresh
+        self.visible = False
+
+        self._panel = None
+        self._built_at = -1
+
+    def toggle(self) -> None:
+        self.visible = not self.visible
+
+    def _build(self) -> pygame.Surface:
+
+        s = self.stats.summary()
+        lines = ["perf: no frames yet"]
+
+        if s["frames"]:
+            mean = s["mean_ms"]
+            counters = s["counters"]
+            lines = [
+                f"frame p50 {s['p50_ms']:.2f}  p95 {s['p95_ms']:.2f}  p99 {s['p99_ms']:.2f} ms",
+                f"missed {s['missed']}/{s['frames']} (budget {s['budget_ms']:.2f} ms)",
+                "  ".join(f"{p} {mean[p]:.2f}" for p in LOOP_PHASES),
+                "  ".join(f"{p} {mean[p]:.2f}" for p in SUB_PHASES),
+                "sfx/frame  " + "  ".join(
+                    f"{name[4:]} {c['mean']:.2f}" for name, c in counters.items() if name.startswith("sfx_")
+                ),
+                f"ticks/frame {counters['ticks']['mean']:.2f}  dropped {counters['ticks_dropped']['total']}"
+                f"  alloc blocks/frame {counters['alloc_blocks']['mean']:+.1f}",
+                f"ball pairs/frame {counters['ball_pairs']['mean']:.1f}  contacts {counters['ball_contacts']['mean']:.1f}",
+            ]
+
+        text = [self.font.render(line, True, (255, 255, 160)) for line in lines]
+        line_h = self.font.get_linesize()
+        width = max(t.get_width() for t in text) + 16
+
+        hist = list(s.get("histogram_ms", {}).items())
+        chart_h = 48 if hist else 0
+
+        panel = pygame.Surface((width, len(text) * line_h + chart_h + 16), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+
+        for n, t in enumerate(text):
+            panel.blit(t, (8, 8 + n * line_h))
+
+        if hist:
+            top = 8 + len(text) * line_h + 4
+            peak = max(c for _, c in hist) or 1
+            bar_w = (width - 16) // len(hist)
+
+            for n, (label, count) in enumerate(hist):
+                h = int((chart_h - 8) * count / peak)
+                pygame.draw.rect(panel, (120, 200, 255), (8 + n * bar_w, top + chart_h - 8 - h, bar_w - 2, h))
+
+        return panel
+
+    def texts(self, topright: tuple[int, int]) -> list[tuple[pygame.Surface, pygame.Rect]]:
+
+        """
+        (surface, rect) pairs for Game.draw; empty while hidden.
+        """
+        if not self.visible:
+            return []
+
+        if self._panel is None or self.stats.frames - self._built_at >= self.refresh:
+            self._panel = self._build()
+            self._built_at = self.stats.frames
+
+        return [(self._panel, self._panel.get_rect(topright = topright))]
@@ -0,0 +1,88 @@
+import logging
+
+import numpy as np
+
+from .config import QUALITY, QualityConfig
+
+
+log = logging.getLogger(__name__)
+
+# Applied in order as quality drops; level n means the first n are on
+QUALITY_STEPS = (
+    "flat_background",      # fill instead of restoring the background image
+    "plain_balls",          # ellipses instead of the per-pixel-alpha ball image
+    "square_bricks",        # no rounded corners on brick sprites
+    "low_fps",              # target QualityConfig.low_fps
+)
+
+
+class QualityGovernor:
+
+    """
+    Watches frame work times (everything but the tick wait) and steps
+    quality down when the rolling mean nears the frame budget, back up
+    when there is plenty of headroom.
+
+    Hysteresis: the two thresholds are far apart, every change is followed
+    by a cooldown, and stepping up is judged against the budget of the
+    higher level (its fps). A level that had to be left again within
+    `probation` frames of stepping up to it doubles the wait before the
+    next step up, so a borderline machine settles instead of flapping.
+
+    apply(level) makes a level take effect; every change is kept in
+    self.history and logged.
+    """
+    def __init__(self, apply, fps: int, config: QualityConfig = QUALITY):
+
+        self.apply = apply
+        self.fps = fps
+        self.config = config
+
+        self.level = 0
+        self.history: list[tuple[int, int, int, float]] = []     # (frame, old, new, load)
+
+        self._times = np.zeros(config.window, dtype = np.float64)
+        self._frame = 0
+        self._changed_at = 0
+        self._stepped_up_at = None
+        self._up_wait = config.cooldown
+
+    def fps_for(self, level: int) -> int:
+        return self.config.low_fps if "low_fps" in QUALITY_STEPS[:level] else self.fps
+
+    def record(self, seconds: float) -> None:
+
+        """
+        Add one frame's work time; may change the level.
+        """
+        cfg = self.config
+        self._times[self._frame % cfg.window] = seconds
+        self._frame += 1
+
+        since = self._frame - self._changed_at
+        if since < max(cfg.cooldown, cfg.window):
+            return
+
+        mean = float(self._times.mean())
+        load = mean * self.fps_for(self.level)
+
+        if load > cfg.down_at and self.level < len(QUALITY_STEPS):
+            if self._stepped_up_at is not None and self._frame - self._stepped_up_at < cfg.probation:
+                self._up_wait = min(self._up_wait * 2, cfg.max_up_wait)
+            self._stepped_up_at = None
+            self._set(self.level + 1, load)
+
+        elif self.level and since >= self._up_wait and mean * self.fps_for(self.level - 1) < cfg.up_at:
+            self._stepped_up_at = self._frame
+            self._set(self.level - 1, load)
+
+    def _set(self, level: int, load: float) -> None:
+
+        old, self.level = self.level, level
+        self._changed_at = self._frame
+        self.history.append((self._frame, old, level, load))
+
+        step = QUALITY_STEPS[max(old, level) - 1]
+        log.info("frame %d: quality %d -> %d (%s %s, load %.0f%% of budget)",
+                 self._frame, old, level, step, "on" if level > old else "off", load * 100)
+        self.apply(level)
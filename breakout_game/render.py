@@ -0,0 +1,298 @@
+import time
+from dataclasses import dataclass
+
+import pygame
+
+from .config import SCREEN
+from .objects.bricks import KIND_COLORS, KIND_HARD
+
+
+BACKGROUND_COLOR = (18, 18, 24)
+LAYER_COLORKEY = (255, 0, 255)   # never used by a brick colour
+
+
+@dataclass
+class RenderStats:
+
+    """
+    Counters for the last frame; totals accumulate across frames.
+    pixels: screen pixels restored from the background and pushed to the display.
+    """
+    frames: int = 0
+    full_frames: int = 0
+    pixels: int = 0
+    rects: int = 0
+    seconds: float = 0.0
+
+    total_pixels: int = 0
+    total_seconds: float = 0.0
+
+    def record(self, full: bool, pixels: int, rects: int, seconds: float) -> None:
+
+        self.frames += 1
+        self.full_frames += full
+        self.pixels = pixels
+        self.rects = rects
+        self.seconds = seconds
+        self.total_pixels += pixels
+        self.total_seconds += seconds
+
+
+class BrickSprites:
+
+    """
+    Pre-rendered brick surfaces, built once per (kind, hits_left, width, height).
+    """
+    def __init__(self, format_surface: pygame.Surface | None = None, rounded: bool = True):
+        self.format_surface = format_surface
+        self.rounded = rounded
+        self._cache: dict[tuple[int, int, int, int], pygame.Surface] = {}
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get(self, kind: int, hits_left: int, width: int, height: int) -> pygame.Surface:
+
+        key = (kind, hits_left, width, height)
+        sprite = self._cache.get(key)
+
+        if sprite is None:
+            if self.format_surface:
+                sprite = pygame.Surface((width, height), 0, self.format_surface)
+            else:
+                sprite = pygame.Surface((width, height))
+
+            sprite.fill(LAYER_COLORKEY)
+            rect = sprite.get_rect()
+            radius = 6 if self.rounded else 0
+            pygame.draw.rect(sprite, KIND_COLORS[kind], rect, border_radius = radius)
+
+            if kind == KIND_HARD and hits_left > 1:
+                pygame.draw.rect(sprite, (255, 210, 170), rect.inflate(-12, -12), width = 2, border_radius = radius)
+
+            sprite.set_colorkey(LAYER_COLORKEY)
+            self._cache[key] = sprite
+
+        return sprite
+
+    def set_rounded(self, rounded: bool) -> None:
+
+        if rounded != self.rounded:
+            self.rounded = rounded
+            self._cache.clear()
+
+
+class BrickLayer:
+
+    """
+    Every live brick composed onto one colour-keyed surface, so drawing the
+    wall is one blit. Rebuilt for a new BrickField or once bricks moved,
+    otherwise only patched where bricks were hit or destroyed.
+    """
+    def __init__(self, size: tuple[int, int], sprites: BrickSprites, format_surface: pygame.Surface | None = None,
+                 rle: bool = True):
+
+        if format_surface:
+            self.surface = pygame.Surface(size, 0, format_surface)
+        else:
+            self.surface = pygame.Surface(size)
+
+        # RLE blits ~5x faster, but every change re-encodes the whole layer
+        self.surface.set_colorkey(LAYER_COLORKEY, pygame.RLEACCEL if rle else 0)
+        self.sprites = sprites
+
+    def _put(self, bricks, i: int) -> None:
+
+        rect = bricks.rect(i)
+        # Clip first: fill() keeps the full height of a rect starting above y = 0
+        self.surface.fill(LAYER_COLORKEY, rect.clip(self.surface.get_rect()))
+
+        if bricks.alive[i]:
+            sprite = self.sprites.get(bricks.kind_of(i), int(bricks.hits_left[i]), rect.width, rect.height)
+            self.surface.blit(sprite, rect)
+
+    def rebuild(self, bricks) -> None:
+
+        self.surface.fill(LAYER_COLORKEY)
+        for i in bricks.alive_indices().tolist():
+            self._put(bricks, i)
+
+    def patch(self, bricks, indices) -> None:
+        for i in indices:
+            self._put(bricks, i)
+
+    def scroll(self, bricks, dy: int) -> None:
+
+        """
+        Follow BrickField.shift(dy): move the pixels, then draw the strip
+        uncovered at the top.
+        """
+        self.surface.scroll(0, dy)
+
+        strip = pygame.Rect(0, 0, self.surface.get_width(), dy)
+        self.surface.fill(LAYER_COLORKEY, strip)
+        for i in bricks.overlapping(strip):
+            self._put(bricks, i)
+
+    def draw(self, surface: pygame.Surface, area: pygame.Rect | None = None) -> None:
+
+        if area is None:
+            surface.blit(self.surface, (0, 0))
+        else:
+            surface.blit(self.surface, area, area)
+
+
+class DirtyRectRenderer:
+
+    """
+    Game delegates drawing to this class.
+
+    Each frame only the areas that changed are repainted: the previous and
+    current rects of the bat, balls and particle cloud, bricks hit or
+    destroyed since the last frame (BrickField.changed) and the text lines. Those areas get the
+    background and the brick layer back, then the bat, balls and text are
+    redrawn and only those areas are pushed with pygame.display.update(rects).
+    Falls back to a full repaint + flip when the dirty area is large,
+    on the first frame, after a restart or when the game state changes.
+
+    set_quality() trades looks for speed (see quality.py).
+    """
+    def __init__(self, screen: pygame.Surface, background: pygame.Surface | None = None,
+                 full_redraw_ratio: float = 0.35, scrolling: bool = False):
+
+        self.screen = screen
+        self.background = background
+        self.full_redraw_ratio = full_redraw_ratio
+        self.stats = RenderStats()
+
+        self.brick_sprites = BrickSprites(screen)
+        # A scrolling wall changes the layer every few frames: skip RLE
+        self.brick_layer = BrickLayer(screen.get_size(), self.brick_sprites, screen, rle = not scrolling)
+
+        self.flat_background = False
+        self.plain_balls = False
+
+        self._prev_rects: list[pygame.Rect] = []
+        self._bricks = None
+        self._moves = 0
+        self._state = None
+        self._force_full = True
+
+    def invalidate(self) -> None:
+        self._force_full = True
+
+    def set_quality(self, flat_background: bool, plain_balls: bool, square_bricks: bool) -> None:
+
+        self.flat_background = flat_background
+        self.plain_balls = plain_balls
+
+        if square_bricks == self.brick_sprites.rounded:
+            self.brick_sprites.set_rounded(not square_bricks)
+            self._bricks = None         # rebuild the layer with the new sprites
+        self.invalidate()
+
+    def _restore(self, rect: pygame.Rect) -> None:
+
+        if self.background and not self.flat_background:
+            self.screen.blit(self.background, rect, rect)
+        else:
+            self.screen.fill(BACKGROUND_COLOR, rect)
+
+    def draw(self, game, texts: list[tuple[pygame.Surface, pygame.Rect]]) -> None:
+
+        """
+        Draw one frame of game; texts are (surface, rect) pairs blitted on top.
+        """
+        start = time.perf_counter()
+
+        bricks = game.bricks
+        alpha = game.alpha
+        rects = [game.bat.draw_rect(alpha)] + game.balls.rects(alpha) + [rect for _, rect in texts]
+
+        particle_rect = game.particles.bounds() if game.particles is not None else None
+        if particle_rect:
+            rects.append(particle_rect)
+
+        # A scrolled wall (endless mode) moves every brick, moved bricks leave
+        # their old place behind: repaint everything
+        moved = bricks.moves != self._moves
+        full = (self._force_full or bricks is not self._bricks or game.state != self._state
+                or bricks.scrolled != 0 or moved)
+
+        if bricks.changed is None:
+            bricks.changed = []
+        elif not full:
+            dirty = [bricks.rect(i) for i in bricks.changed]
+            dirty += self._prev_rects + rects
+
+            area = sum(r.width * r.height for r in dirty)
+            full = area > self.full_redraw_ratio * SCREEN.width * SCREEN.height
+
+        if bricks is not self._bricks or moved:
+            self.brick_layer.rebuild(bricks)
+        else:
+            if bricks.scrolled:
+                self.brick_layer.scroll(bricks, bricks.scrolled)
+            self.brick_layer.patch(bricks, bricks.changed)
+        bricks.changed.clear()
+        bricks.scrolled = 0
+
+        if full:
+            self._draw_full(game, texts)
+            pixels = SCREEN.width * SCREEN.height
+            pushed = 1
+        else:
+            pixels = self._draw_dirty(game, texts, dirty)
+            pushed = len(dirty)
+
+        self._prev_rects = rects
+        self._bricks = bricks
+        self._moves = bricks.moves
+        self._state = game.state
+        self._force_full = False
+
+        self.stats.record(full, pixels, pushed, time.perf_counter() - start)
+
+    def _draw_full(self, game, texts) -> None:
+
+        if self.background and not self.flat_background:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            self.screen.fill(BACKGROUND_COLOR)
+
+        self.brick_layer.draw(self.screen)
+        if game.particles is not None:
+            game.particles.draw(self.screen)
+        game.bat.draw(self.screen, alpha = game.alpha)
+        game.balls.draw(self.screen, image = None if self.plain_balls else game.ball_image, alpha = game.alpha)
+
+        for surface, rect in texts:
+            self.screen.blit(surface, rect)
+
+        pygame.display.flip()
+
+    def _draw_dirty(self, game, texts, dirty: list[pygame.Rect]) -> int:
+
+        screen_rect = self.screen.get_rect()
+        dirty = [r.clip(screen_rect) for r in dirty]
+
+        pixels = 0
+        for rect in dirty:
+            if not rect.width or not rect.height:
+                continue
+
+            self._restore(rect)
+            self.brick_layer.draw(self.screen, rect)
+            pixels += rect.width * rect.height
+
+        # Same back-to-front order as a full frame
+        if game.particles is not None:
+            game.particles.draw(self.screen)
+        game.bat.draw(self.screen, alpha = game.alpha)
+        game.balls.draw(self.screen, image = None if self.plain_balls else game.ball_image, alpha = game.alpha)
+
+        for surface, rect in texts:
+            self.screen.blit(surface, rect)
+
+        pygame.display.update(dirty)
+        return pixels
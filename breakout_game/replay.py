@@ -0,0 +1,277 @@
+"""
+Deterministic input recording and headless replay.
+
+Record while playing:  python -m breakout_game.main --record session.brkr
+Replay at full speed:  python -m breakout_game.replay session.brkr
+
+A recording is the game's RNG seed, the Game options that change the
+simulation (see game_options), and one input bitmask per frame (see
+inputs.py). On disk the masks are run-length encoded:
+
+    magic "BRKR", version u8, seed u64, frames u32, digest 16 bytes
+    options: length u16, then that many bytes of JSON (version 2+)
+    then runs of (mask u8, run length as unsigned LEB128 varint)
+
+The digest fingerprints the game state after the last frame (all zeros
+if unknown); replay() reports whether it was reproduced.
+"""
+
+import argparse
+import dataclasses
+import hashlib
+import json
+import os
+import struct
+from dataclasses import dataclass, field
+
+from .config import SCREEN, RULES
+from .game_logic import Game
+from .simulation import SimulationResult, simulate
+
+
+MAGIC = b"BRKR"
+VERSION = 2
+_HEADER = struct.Struct("<4sBQI16s")
+_OPTIONS_LEN = struct.Struct("<H")
+NO_DIGEST = bytes(16)
+
+
+def game_digest(game: Game) -> bytes:
+
+    """
+    16-byte fingerprint of the simulation state (not rendering).
+    """
+    h = hashlib.blake2b(digest_size = 16)
+    order = game.balls.order()      # launch order: independent of pool slots
+    for arr in (game.balls.x, game.balls.y, game.balls.vx, game.balls.vy, game.balls.can_hit_brick):
+        h.update(arr[order].tobytes())
+
+    m = game.bricks.count
+    h.update(game.bricks.hits_left[:m].tobytes())
+    h.update(game.bricks.alive[:m].tobytes())
+    h.update(struct.pack("<qiii", game.score, game.lives, game.bat.rect.x, game.state.value))
+    return h.digest()
+
+
+def file_hash(path: str) -> str:
+
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size = 16).hexdigest()
+
+
+def game_options(game: Game) -> dict:
+
+    """
+    The Game() arguments besides the seed that change the simulation, as
+    stored in a recording. A level is kept by path and content hash.
+    """
+    options = {}
+    if game.level_path:
+        options["level"] = os.path.abspath(game.level_path)
+        options["level_hash"] = file_hash(game.level_path)
+    if game.wall is not None:
+        options["endless"] = True
+    if game.physics != "step":
+        options["physics"] = game.physics
+
+    # Rules that differ from config.RULES (e.g. --ball-collisions)
+    rules = {f.name: getattr(game.rules, f.name) for f in dataclasses.fields(game.rules)
+             if getattr(game.rules, f.name) != getattr(RULES, f.name)}
+    if rules:
+        options["rules"] = rules
+    return options
+
+
+def game_kwargs(options: dict) -> dict:
+
+    """
+    Game() keyword arguments reproducing recorded options. Raises
+    ValueError if the recorded level file has changed since.
+    """
+    kwargs = {}
+    if "level" in options:
+        if file_hash(options["level"]) != options["level_hash"]:
+            raise ValueError(f"level {options['level']} has changed since it was recorded")
+        kwargs["level"] = options["level"]
+    kwargs["endless"] = options.get("endless", False)
+    kwargs["physics"] = options.get("physics", "step")
+    kwargs["rules"] = dataclasses.replace(RULES, **options.get("rules", {}))
+    return kwargs
+
+
+def encode_runs(inputs: bytes) -> bytes:
+
+    out = bytearray()
+    n = 0
+    while n < len(inputs):
+        mask = inputs[n]
+        end = n + 1
+        while end < len(inputs) and inputs[end] == mask:
+            end += 1
+
+        out.append(mask)
+        run = end - n
+        while run >= 0x80:
+            out.append((run & 0x7F) | 0x80)
+            run >>= 7
+        out.append(run)
+        n = end
+
+    return bytes(out)
+
+
+def decode_runs(data: bytes, frames: int) -> bytearray:
+
+    inputs = bytearray()
+    pos = 0
+    while pos < len(data):
+        mask = data[pos]
+        pos += 1
+
+        run = shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            run |= (byte & 0x7F) << shift
+            shift += 7
+            if byte < 0x80:
+                break
+
+        inputs += bytes((mask,)) * run
+
+    if len(inputs) != frames:
+        raise ValueError(f"recording is corrupt: {len(inputs)} frames decoded, header says {frames}")
+    return inputs
+
+
+@dataclass
+class Recording:
+
+    seed: int
+    inputs: bytearray = field(default_factory = bytearray)
+    digest: bytes = NO_DIGEST
+    options: dict = field(default_factory = dict)      # see game_options()
+
+    def __len__(self) -> int:
+        return len(self.inputs)
+
+    def to_bytes(self) -> bytes:
+        header = _HEADER.pack(MAGIC, VERSION, self.seed, len(self.inputs), self.digest)
+        options = json.dumps(self.options, sort_keys = True).encode()
+        return header + _OPTIONS_LEN.pack(len(options)) + options + encode_runs(self.inputs)
+
+    @classmethod
+
+    def from_bytes(cls, data: bytes) -> "Recording":
+
+        if len(data) < _HEADER.size:
+            raise ValueError("not a recording: too short")
+
+        magic, version, seed, frames, digest = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("not a recording: bad magic")
+        if version not in (1, VERSION):
+            raise ValueError(f"unsupported recording version {version}")
+
+        # Version 1 recordings predate options: default game
+        pos = _HEADER.size
+        options = {}
+        if version >= 2:
+            (size,) = _OPTIONS_LEN.unpack_from(data, pos)
+            pos += _OPTIONS_LEN.size
+            options = json.loads(data[pos:pos + size])
+            pos += size
+
+        return cls(seed, decode_runs(data[pos:], frames), digest, options)
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+
+    def load(cls, path: str) -> "Recording":
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class Recorder:
+
+    """
+    Collects a game's per-frame inputs. Game.run calls record() every frame
+    and finish() on exit, which saves to path when one is given.
+    options: from game_options(), so replay() rebuilds the same game.
+    """
+    def __init__(self, seed: int, path: str | None = None, options: dict | None = None):
+        self.recording = Recording(seed, options = options or {})
+        self.path = path
+
+    def record(self, inputs: int) -> None:
+        self.recording.inputs.append(inputs)
+
+    def finish(self, game: Game) -> Recording:
+
+        self.recording.digest = game_digest(game)
+        if self.path:
+            self.recording.save(self.path)
+        return self.recording
+
+
+@dataclass
+class ReplayResult:
+
+    result: SimulationResult
+    digest: bytes
+    expected: bytes
+
+    @property
+
+    def verified(self) -> bool | None:
+
+        """
+        True/False if the recording had a digest to check against, else None.
+        """
+        if self.expected == NO_DIGEST:
+            return None
+        return self.digest == self.expected
+
+
+def replay(recording: Recording) -> ReplayResult:
+
+    """
+    Feed a recording through a headless Game with no frame limiter,
+    built with the recorded options.
+    """
+    game = Game(headless = True, seed = recording.seed, **game_kwargs(recording.options))
+    inputs = iter(recording.inputs)
+
+    result = simulate(len(recording), controller = lambda g: next(inputs), game = game)
+    game.close()
+    return ReplayResult(result, game_digest(game), recording.digest)
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description = "Replay a recorded session headless.")
+    parser.add_argument("path")
+    args = parser.parse_args()
+
+    recording = Recording.load(args.path)
+    out = replay(recording)
+    r = out.result
+
+    print(f"{r.frames} frames ({r.frames / SCREEN.fps:.0f} s of play), seed {recording.seed}")
+    if recording.options:
+        print("options: " + ", ".join(f"{k} {v}" for k, v in sorted(recording.options.items())))
+    print(f"replayed in {r.seconds:.2f} s: {r.fps:,.0f} fps ({r.realtime_factor:.0f}x real time)")
+    print(f"score {r.score}, lives {r.lives}, bricks left {r.bricks_left}, {r.state.name}")
+
+    if out.verified is None:
+        print("no digest in recording: end state not verified")
+    else:
+        print("end state matches recording" if out.verified else "END STATE DIFFERS from recording")
+        return 0 if out.verified else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,9 +1,18 @@
+import io
 import os
+import struct
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import pygame
 
+from .config import ASSETS
+from .bundle import AssetBundle
+
 
-def safe_load_sound(path: str):
+def safe_load_sound(path: str, data: bytes | None = None):
     try:
+        if data is not None:
+            return pygame.mixer.Sound(file = io.BytesIO(data))
         if os.path.exists(path):
             return pygame.mixer.Sound(path)
     except pygame.error:
@@ -11,6 +20,14 @@ def safe_load_sound(path: str):
     return None
 
 
+def safe_read(path: str):
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
 def safe_load_image(path: str):
     try:
         if os.path.exists(path):
@@ -20,6 +37,30 @@ def safe_load_image(path: str):
     return None
 
 
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def png_size(header: bytes):
+    """
+    (width, height) from a PNG's first 24 bytes (signature + IHDR), else None.
+    """
+    if len(header) >= 24 and header[:8] == PNG_SIGNATURE and header[12:16] == b"IHDR":
+        return struct.unpack(">II", header[16:24])
+    return None
+
+
+def safe_image_size(path: str):
+    try:
+        if os.path.exists(path):
+            # PNGs: read the IHDR chunk, no decode; anything else is loaded
+            with open(path, "rb") as f:
+                size = png_size(f.read(24))
+            return size or pygame.image.load(path).get_size()
+    except (OSError, pygame.error):
+        pass
+    return None
+
+
 def safe_load_background(path: str):
     try:
         if os.path.exists(path):
@@ -32,23 +73,76 @@ def safe_load_background(path: str):
 class Resources:
     """
     Asset cache. Game delegates loading to this class.
+    Assets come from the packed bundle (see bundle.py) when it has them,
+    otherwise they are decoded from their files.
+    submit() runs a loader on a background thread and returns a Future.
     """
-    def __init__(self):
+    def __init__(self, bundle_path: str | None = ASSETS.bundle_file):
         self._images = {}
         self._sounds = {}
         self._backgrounds = {}
+        self.bundle = AssetBundle.open(bundle_path) if bundle_path else None
+        self._loader = None
 
     def image(self, path: str):
         if path not in self._images:
-            self._images[path] = safe_load_image(path)
+            self._images[path] = (self.bundle and self.bundle.image(path)) or safe_load_image(path)
         return self._images[path]
 
-    def sound(self, path: str):
+    def sound(self, path: str, data: bytes | None = None):
+        """
+        data: the file's bytes if already read (see read()), so only the
+        decode runs here. Call from the main thread: it drives the mixer.
+        """
         if path not in self._sounds:
-            self._sounds[path] = safe_load_sound(path)
+            self._sounds[path] = (self.bundle and self.bundle.sound(path)) or safe_load_sound(path, data)
         return self._sounds[path]
 
+    def read(self, path: str):
+        """
+        A file's bytes, or None. Touches no pygame module: safe on the loader thread.
+        """
+        return safe_read(path)
+
+    def image_size(self, path: str):
+        """
+        Size of an image without decoding it where possible: from the
+        bundle index or a PNG header (works with no display).
+        """
+        if self._images.get(path):
+            return self._images[path].get_size()
+        return (self.bundle and self.bundle.image_size(path)) or safe_image_size(path)
+
     def background(self, path: str):
         if path not in self._backgrounds:
-            self._backgrounds[path] = safe_load_background(path)
-        return self._backgrounds[path]
\ No newline at end of file
+            self._backgrounds[path] = (self.bundle and self.bundle.background(path)) or safe_load_background(path)
+        return self._backgrounds[path]
+
+    def scaled_background(self, path: str, size: tuple[int, int]):
+        """
+        Background scaled to size (bundled backgrounds already are).
+        """
+        background = self.background(path)
+        if background and background.get_size() != size:
+            background = pygame.transform.scale(background, size)
+        return background
+
+    # ---------- Async loading ----------
+    def submit(self, fn, *args) -> Future:
+        """
+        Run fn(*args) on the loader thread, e.g. submit(res.image, path).
+        One thread: loads finish in submission order and never compete
+        with each other for the GIL. Not for the mixer: submit read() and
+        build sounds and music from the bytes on the main thread.
+        """
+        if self._loader is None:
+            self._loader = ThreadPoolExecutor(max_workers = 1, thread_name_prefix = "assets")
+        return self._loader.submit(fn, *args)
+
+    def shutdown(self) -> None:
+        """
+        Wait for pending loads (call before pygame.quit()).
+        """
+        if self._loader is not None:
+            self._loader.shutdown(wait = True, cancel_futures = True)
+            self._loader = None
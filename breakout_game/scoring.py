@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from .objects.bricks import Brick
+from .objects.bricks import BrickField
 
 
 @dataclass
@@ -7,5 +7,5 @@ class Scoring:
     
     score: int = 0
 
-    def add_for_brick_destroyed(self, brick: Brick) -> None:
-        self.score += brick.points
\ No newline at end of file
+    def add_for_brick_destroyed(self, bricks: BrickField, index: int) -> None:
+        self.score += bricks.points_of(index)
\ No newline at end of file
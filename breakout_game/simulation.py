@@ -0,0 +1,110 @@
+"""
+Headless simulation, faster than real time.
+Run from terminal: python -m breakout_game.simulation --frames 432000 --seed 1
+"""
+
+import argparse
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from .config import SCREEN
+from .game_logic import Game
+from .inputs import INPUT_LEFT, INPUT_RIGHT, INPUT_RESTART
+from .state import GameState
+
+
+Controller = Callable[[Game], int]
+
+
+@dataclass
+class SimulationResult:
+
+    frames: int
+    seconds: float
+    score: int
+    lives: int
+    state: GameState
+    bricks_left: int
+
+    @property
+
+    def fps(self) -> float:
+        return self.frames / self.seconds if self.seconds > 0 else float("inf")
+
+    @property
+
+    def realtime_factor(self) -> float:
+        return self.fps / SCREEN.fps
+
+
+def follow_ball(game: Game, dead_zone: int = 20) -> int:
+
+    """
+    Scripted bat: move under the lowest ball; restart when the game ends.
+    """
+    if game.state != GameState.PLAYING:
+        return INPUT_RESTART
+
+    balls = game.balls
+    if not len(balls):
+        return 0
+
+    # Launch order breaks ties, whatever slots the balls are in
+    order = balls.order()
+    lowest = int(order[balls.y[order].argmax()])
+    target = int(balls.x[lowest]) + balls.width // 2
+
+    diff = target - game.bat.rect.centerx
+    if diff < -dead_zone:
+        return INPUT_LEFT
+    if diff > dead_zone:
+        return INPUT_RIGHT
+    return 0
+
+
+def idle(game: Game) -> int:
+    return 0
+
+
+def simulate(frames: int, seed: int | None = None, controller: Controller = follow_ball,
+             game: Game | None = None) -> SimulationResult:
+
+    """
+    Step a headless Game for a number of frames with no frame limiter.
+    A game passed in is left open; one made here is closed.
+    """
+    owned = game is None
+    if owned:
+        game = Game(headless = True, seed = seed)
+
+    start = time.perf_counter()
+    try:
+        for _ in range(frames):
+            game.step(controller(game))
+            game.sound_bus.flush()      # one tick per frame here
+        seconds = time.perf_counter() - start
+    finally:
+        if owned:
+            game.close()
+
+    return SimulationResult(frames, seconds, game.score, game.lives, game.state, len(game.bricks))
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description = "Run the game headless, as fast as possible.")
+    parser.add_argument("--frames", type = int, default = SCREEN.fps * 3600)
+    parser.add_argument("--seed", type = int, default = 0)
+    parser.add_argument("--idle", action = "store_true", help = "never move the bat")
+    args = parser.parse_args()
+
+    result = simulate(args.frames, args.seed, idle if args.idle else follow_ball)
+
+    print(f"{result.frames} frames ({result.frames / SCREEN.fps:.0f} s of play) in {result.seconds:.2f} s")
+    print(f"{result.fps:,.0f} simulated fps ({result.realtime_factor:.0f}x real time)")
+    print(f"score {result.score}, lives {result.lives}, bricks left {result.bricks_left}, {result.state.name}")
+
+
+if __name__ == "__main__":
+    main()
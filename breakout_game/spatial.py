@@ -0,0 +1,158 @@
+import numpy as np
+
+from .config import BRICKS
+
+
+class BrickGrid:
+
+    """
+    Uniform grid over the brick wall. BrickField delegates lookups to this class.
+
+    Cells follow the BrickConfig pitch (brick size + gap), so an aligned brick
+    sits in one cell and a brick in a shifted (staggered) row straddles two.
+    Storage is CSR-style: cell_start[c]:cell_start[c + 1] slices cell_items,
+    which holds brick indices in layout order.
+    Destroyed bricks stay in the grid; callers filter them with their alive mask.
+    """
+    def __init__(self, x: np.ndarray, y: np.ndarray, w: np.ndarray, h: np.ndarray,
+                 cell_width: int = BRICKS.width + BRICKS.gap,
+                 cell_height: int = BRICKS.height + BRICKS.gap, origin_y: int = BRICKS.top_margin):
+
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.origin_y = origin_y
+
+        if len(x) == 0:
+            self.col_min = self.row_min = 0
+            self.cols = self.rows = 0
+            self.cell_start = np.zeros(1, dtype = np.int32)
+            self.cell_items = np.zeros(0, dtype = np.int32)
+            self.item_cell = np.zeros(0, dtype = np.int32)
+            return
+
+        col0 = x // cell_width
+        col1 = (x + w - 1) // cell_width
+        row0 = (y - origin_y) // cell_height
+        row1 = (y + h - 1 - origin_y) // cell_height
+
+        self.col_min = int(col0.min())
+        self.row_min = int(row0.min())
+        self.cols = int(col1.max()) - self.col_min + 1
+        self.rows = int(row1.max()) - self.row_min + 1
+
+        # Expand every brick into the (col, row) cells it covers
+        span_x = col1 - col0 + 1
+        spans = span_x * (row1 - row0 + 1)
+        owner = np.repeat(np.arange(len(x), dtype = np.int32), spans)
+        local = np.arange(len(owner)) - np.repeat(np.cumsum(spans) - spans, spans)
+
+        cell_col = col0[owner] + local % span_x[owner] - self.col_min
+        cell_row = row0[owner] + local // span_x[owner] - self.row_min
+        cell = cell_row * self.cols + cell_col
+
+        order = np.lexsort((owner, cell))
+        self.cell_items = owner[order]
+        self.item_cell = cell[order].astype(np.int32)
+
+        counts = np.bincount(cell, minlength = self.rows * self.cols)
+        self.cell_start = np.zeros(len(counts) + 1, dtype = np.int32)
+        np.cumsum(counts, out = self.cell_start[1:])
+
+    @property
+
+    def nbytes(self) -> int:
+        return self.cell_start.nbytes + self.cell_items.nbytes + self.item_cell.nbytes
+
+    def _cell_bounds(self, left, top, right, bottom):
+
+        col0 = left // self.cell_width - self.col_min
+        col1 = (right - 1) // self.cell_width - self.col_min
+        row0 = (top - self.origin_y) // self.cell_height - self.row_min
+        row1 = (bottom - 1 - self.origin_y) // self.cell_height - self.row_min
+        return col0, col1, row0, row1
+
+    def occupancy(self, alive: np.ndarray) -> np.ndarray:
+
+        """
+        Summed-area table of alive bricks per cell, shape (rows + 1, cols + 1).
+        """
+        counts = np.bincount(self.item_cell[alive[self.cell_items]], minlength = self.rows * self.cols)
+
+        table = np.zeros((self.rows + 1, self.cols + 1), dtype = np.int32)
+        table[1:, 1:] = counts.reshape(self.rows, self.cols).cumsum(0).cumsum(1)
+        return table
+
+    def any_occupied(self, table: np.ndarray, left, top, right, bottom) -> np.ndarray:
+
+        """
+        Vectorized broad phase: for arrays of rect edges, True where some
+        covered cell holds an alive brick (per the occupancy() table).
+        """
+        col0, col1, row0, row1 = self._cell_bounds(left, top, right, bottom)
+
+        # np.minimum/np.maximum: np.clip has a high fixed cost on small arrays
+        col0 = np.minimum(np.maximum(col0, 0), self.cols)
+        row0 = np.minimum(np.maximum(row0, 0), self.rows)
+        col1 = np.minimum(np.maximum(col1 + 1, col0), self.cols)
+        row1 = np.minimum(np.maximum(row1 + 1, row0), self.rows)
+
+        total = table[row1, col1] - table[row0, col1] - table[row1, col0] + table[row0, col0]
+        return total > 0
+
+    def candidates(self, left: int, top: int, right: int, bottom: int) -> list[int]:
+
+        """
+        Return brick indices whose cells overlap the rect, in layout order.
+        Candidates only: callers still do the exact overlap test.
+        """
+        col0, col1, row0, row1 = self._cell_bounds(left, top, right, bottom)
+        col0, row0 = max(col0, 0), max(row0, 0)
+        col1, row1 = min(col1, self.cols - 1), min(row1, self.rows - 1)
+
+        if col0 > col1 or row0 > row1:
+            return []
+
+        start = self.cell_start
+        items = self.cell_items
+
+        if col0 == col1 and row0 == row1:
+            cell = row0 * self.cols + col0
+            return items[start[cell]:start[cell + 1]].tolist()
+
+        found = set()
+        for row in range(row0, row1 + 1):
+            first = row * self.cols
+            found.update(items[start[first + col0]:start[first + col1 + 1]].tolist())
+
+        return sorted(found)
+
+
+
+def sort_and_sweep(x: np.ndarray, y: np.ndarray, w: int, h: int) -> tuple[np.ndarray, np.ndarray]:
+
+    """
+    Broad phase for boxes all w x h at (x, y): index pairs (first, second)
+    of boxes that may overlap, each pair once.
+    Boxes are sorted by (row band of height h, x). Two overlapping boxes
+    are in the same band or adjacent ones and less than w apart in x, so
+    each box sweeps forward over two runs of the sorted keys, found by
+    binary search: its own band up to x + w, the next band from x - w to x + w.
+    """
+    x = x.astype(np.int64)
+    left = x.min()
+    stride = int(x.max() - left) + 2 * w + 1      # wider than any x offset: bands never mix
+
+    keys = (y.astype(np.int64) // h) * stride + (x - left)
+    order = np.argsort(keys, kind = "stable")
+    keys = keys[order]
+    pos = np.arange(len(keys))
+
+    lo = np.concatenate((pos + 1, np.searchsorted(keys, keys + stride - w, "right")))
+    hi = np.concatenate((np.searchsorted(keys, keys + w, "left"), np.searchsorted(keys, keys + stride + w, "left")))
+    counts = np.maximum(hi - lo, 0)
+
+    # Expand every [lo, hi) run into (box, other) pairs
+    starts = np.cumsum(counts) - counts
+    first = np.repeat(np.concatenate((pos, pos)), counts)
+    second = np.repeat(lo - starts, counts) + np.arange(int(counts.sum()))
+    return order[first], order[second]
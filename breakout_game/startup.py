@@ -0,0 +1,54 @@
+"""
+Startup trace, and the cache directory shared by on-disk caches.
+
+    python -m breakout_game.main --trace-startup              # print the steps
+    python -m breakout_game.main --fast-start --trace-startup startup.json
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+
+
+def cache_dir() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "breakout_game")
+
+
+class StartupTrace:
+
+    """
+    Wall-clock time of each init step, relative to when the trace was created.
+    mark() records an instant such as the first frame on screen.
+    """
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.steps: list[tuple[str, float, float]] = []     # (name, start, seconds)
+
+    @contextmanager
+
+    def step(self, name: str):
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append((name, start - self.t0, time.perf_counter() - start))
+
+    def mark(self, name: str) -> None:
+        self.steps.append((name, time.perf_counter() - self.t0, 0.0))
+
+    def report(self) -> str:
+
+        lines = [f"{'step':<14} {'at ms':>9} {'took ms':>9}"]
+        for name, at, seconds in self.steps:
+            took = f"{seconds * 1e3:9.1f}" if seconds else f"{'-':>9}"
+            lines.append(f"{name:<14} {at * 1e3:9.1f} {took}")
+        return "\n".join(lines)
+
+    def dump(self, path: str) -> None:
+
+        with open(path, "w", encoding = "utf-8") as f:
+            json.dump([{"step": name, "at_ms": at * 1e3, "ms": seconds * 1e3}
+                       for name, at, seconds in self.steps], f, indent = 2)
@@ -0,0 +1,139 @@
+import re
+from collections import OrderedDict
+
+import pygame
+
+
+_DIGIT_RUNS = re.compile(r"(\d+)")
+
+
+class GlyphAtlas:
+
+    """
+    One rasterized surface per character for a (font, colour).
+    Lines are laid out from cached glyphs, so fast-changing counters
+    never go back through the font rasterizer. Kerning is not applied.
+    """
+    def __init__(self, font: pygame.font.Font, color: tuple[int, int, int], chars: str = "0123456789"):
+
+        self.font = font
+        self.color = color
+        self._glyphs: dict[str, pygame.Surface] = {}
+        self.height = font.get_linesize()
+
+        for ch in chars:
+            self.glyph(ch)
+
+    def glyph(self, ch: str) -> pygame.Surface:
+
+        surface = self._glyphs.get(ch)
+        if surface is None:
+            surface = self._glyphs[ch] = self.font.render(ch, True, self.color)
+        return surface
+
+    def layout(self, text: str, x: int, y: int) -> list[tuple[pygame.Surface, pygame.Rect]]:
+
+        """
+        (glyph, rect) blits that draw text with its top-left at (x, y).
+        """
+        blits = []
+        for ch in text:
+            g = self.glyph(ch)
+            blits.append((g, g.get_rect(topleft = (x, y))))
+            x += g.get_width()
+        return blits
+
+    def compose(self, text: str) -> pygame.Surface:
+
+        glyphs = [self.glyph(ch) for ch in text]
+        width = sum(g.get_width() for g in glyphs)
+        height = max([g.get_height() for g in glyphs], default = self.height)
+
+        line = pygame.Surface((max(width, 1), height), pygame.SRCALPHA)
+
+        x = 0
+        for g in glyphs:
+            # RGBA_MAX copies the glyph as-is onto the transparent line
+            line.blit(g, (x, 0), special_flags = pygame.BLEND_RGBA_MAX)
+            x += g.get_width()
+
+        return line
+
+
+class TextCache:
+
+    """
+    Rendered text keyed by (font, text, colour): a string is rendered only
+    when it is not in the cache. Least recently used entries are dropped
+    past max_entries.
+    With glyphs=True, misses are composed from a GlyphAtlas instead of
+    rasterizing the whole string. layout() goes further for lines with
+    counters that change every frame: labels come from the cache, digits
+    are blitted straight from the atlas.
+    """
+    def __init__(self, max_entries: int = 128):
+
+        self.max_entries = max_entries
+        self._cache: OrderedDict = OrderedDict()
+        self._atlases: dict = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def atlas(self, font: pygame.font.Font, color: tuple[int, int, int]) -> GlyphAtlas:
+
+        key = (font, color)
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            atlas = self._atlases[key] = GlyphAtlas(font, color)
+        return atlas
+
+    def render(self, font: pygame.font.Font, text: str, color: tuple[int, int, int],
+               glyphs: bool = False) -> pygame.Surface:
+
+        key = (font, text, color, glyphs)
+        surface = self._cache.get(key)
+
+        if surface is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        if glyphs:
+            surface = self.atlas(font, color).compose(text)
+        else:
+            surface = font.render(text, True, color)
+
+        self._cache[key] = surface
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last = False)
+
+        return surface
+
+    def layout(self, font: pygame.font.Font, text: str, color: tuple[int, int, int],
+               topleft: tuple[int, int]) -> list[tuple[pygame.Surface, pygame.Rect]]:
+
+        """
+        (surface, rect) blits for a line of labels and numbers.
+        """
+        atlas = self.atlas(font, color)
+        x, y = topleft
+        blits = []
+
+        for n, part in enumerate(_DIGIT_RUNS.split(text)):
+            if not part:
+                continue
+
+            if n % 2:
+                blits += atlas.layout(part, x, y)
+                x = blits[-1][1].right
+            else:
+                label = self.render(font, part, color)
+                blits.append((label, label.get_rect(topleft = (x, y))))
+                x += label.get_width()
+
+        return blits
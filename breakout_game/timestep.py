@@ -0,0 +1,49 @@
+from .config import TIMESTEP
+
+
+class FixedTimestep:
+
+    """
+    Accumulator that turns wall-clock frame times into a whole number of
+    fixed simulation ticks, so gameplay runs at `rate` ticks per second
+    whatever the render rate.
+
+    alpha is how far the clock is past the last tick, in ticks (0..1):
+    the renderer blends the previous and current tick by it. When a frame
+    would need more than `max_steps` ticks (a stall, or a machine too slow
+    for the tick rate) the excess time is dropped instead of making the next
+    frame even slower; the game then runs slow rather than spiral.
+    """
+    def __init__(self, rate: int = TIMESTEP.tick_rate, max_steps: int = TIMESTEP.max_steps_per_frame):
+
+        self.rate = rate
+        self.dt = 1.0 / rate
+        self.max_steps = max_steps
+
+        self.accumulator = 0.0
+        self.ticks = 0          # lifetime totals
+        self.dropped = 0
+
+    def advance(self, elapsed: float) -> int:
+
+        """
+        Add elapsed seconds; returns the number of ticks to run now.
+        """
+        self.accumulator += elapsed
+        steps = int(self.accumulator / self.dt)
+        self.accumulator -= steps * self.dt
+
+        if steps > self.max_steps:
+            self.dropped += steps - self.max_steps
+            steps = self.max_steps
+
+        self.ticks += steps
+        return steps
+
+    @property
+
+    def alpha(self) -> float:
+        return min(self.accumulator / self.dt, 1.0)
+
+    def reset(self) -> None:
+        self.accumulator = 0.0